@@ -10,6 +10,16 @@ def get_version():
             return match.group(1)
         raise RuntimeError("Unable to find version string.")
 
+def get_ext_modules():
+    # The kernel modules are compiled with mypyc only on request,
+    # otherwise the same modules are installed as pure Python.
+    if os.environ.get("MULTILEVELGRAPHS_USE_MYPYC") != "1":
+        return []
+    from mypyc.build import mypycify
+    return mypycify(["--follow-imports=silent",
+                     os.path.join("src", "multilevelgraphs", "dec_graphs", "dec_graph_kernels.py"),
+                     os.path.join("src", "multilevelgraphs", "contraction_schemes_impl", "stars_kernels.py")])
+
 setup(
     name="multilevelgraphs",
     version=get_version(),
@@ -25,8 +35,12 @@ setup(
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
     ],
+    ext_modules=get_ext_modules(),
     python_requires='>=3.10',
     install_requires=[
         'networkx>=3.3'
     ],
+    extras_require={
+        'rustworkx': ['rustworkx']
+    },
 )
@@ -1,4 +1,4 @@
-from typing import Iterable, Set, Dict, Callable, Generator
+from typing import Iterable, Set, Dict, Callable, Generator, FrozenSet, Optional, List
 
 from multilevelgraphs.contraction_schemes import ComponentSet
 from multilevelgraphs.dec_graphs import Supernode
@@ -17,9 +17,30 @@ class CompTable:
     ----------
     modified : Set[Supernode]
         the set of nodes whose component sets have been modified in the rows of this table since the last update
+
+    Notes
+    -----
+    For the operations on maximal sets, each tracked component set is given a small integer identifier and each row
+    of the table is also represented as an integer bitmask of the identifiers of its component sets, so that
+    intersections and unions of rows are computed as bitwise operations.
+    Bitmasks are only built the first time a maximal set operation is performed and are then kept up to date.
+    Identifiers of component sets that are no longer in any row are reused.
     """
+    __slots__ = ('modified', '_table', '_fingerprints', '_masks', '_set_ids', '_sets_by_id', '_free_ids',
+                 '_memberships', '_all', '_sizes_by_id', '_size_bits', '_emptied')
+
     modified: Set[Supernode]
     _table: Dict[Supernode, Set[ComponentSet]]
+    _fingerprints: Optional[Dict[FrozenSet[Supernode], ComponentSet]]
+    _masks: Optional[Dict[Supernode, int]]
+    _set_ids: Dict[ComponentSet, int]
+    _sets_by_id: List[Optional[ComponentSet]]
+    _free_ids: List[int]
+    _memberships: Dict[ComponentSet, int]
+    _all: Set[ComponentSet]
+    _sizes_by_id: List[int]
+    _size_bits: List[int]
+    _emptied: Set[Supernode]
 
     def __init__(self, sets: Iterable[ComponentSet] = None, maximal: bool = False):
         """
@@ -33,13 +54,21 @@ class CompTable:
         :param maximal: if True, only maximal sets of nodes are stored
         """
         self._table = dict()
+        self._fingerprints = None  # Maps the sets of supernodes to the component sets, built by the first lookup
         self.modified = set()
+        self._masks = None  # Bitmasks of the rows, built by the first maximal set operation
+        self._set_ids = dict()
+        self._sets_by_id = []
+        self._free_ids = []
+        self._memberships = dict()  # Number of rows in which each tracked component set is
+        self._all = set()  # All the component sets in at least one row
+        self._sizes_by_id = []
+        self._size_bits = []  # Bit-sliced sizes of the component sets, indexed by their identifiers
+        self._emptied = set()  # Nodes whose rows have been emptied or deleted since the last singletons addition
 
         if sets is not None:
-            for c_set in sets:
-                self.add_set(c_set, maximal=maximal)
-
-            self.modified.clear()
+            self.add_sets(sets, maximal=maximal)
+            self.clear_modified()
 
     def add_set(self, c_set: ComponentSet, maximal: bool = False):
         """
@@ -78,9 +107,40 @@ class CompTable:
 
         :param c_set: the component set to add
         """
-        for node in c_set:
-            self._table.setdefault(node, set()).add(c_set)
-            self.modified.add(node)
+        self.add_sets((c_set,))
+
+    def add_sets(self, c_sets: Iterable[ComponentSet], maximal: bool = False):
+        """
+        Adds all the given component sets to the table tracked sets, as if they were added one at a time with
+        ``add_set``.
+        When maximal is False, the sets are added in a single pass where the table structures are bound only once,
+        which is preferable when many sets, such as the singletons of a contraction function, are added together.
+
+        :param c_sets: the component sets to add
+        :param maximal: if True, only maximal sets of nodes are stored and maintained
+        """
+        if maximal:
+            for c_set in c_sets:
+                self.add_maximal_set(c_set)
+            return
+
+        table = self._table
+        modified = self.modified
+        track_membership = self._track_membership
+        for c_set in c_sets:
+            added = []
+            for node in c_set:
+                row = table.get(node)
+                if row is None:
+                    table[node] = {c_set}
+                elif c_set not in row:
+                    row.add(c_set)
+                else:
+                    continue
+                added.append(node)
+            if added:
+                track_membership(c_set, added)
+            modified.update(c_set)
 
     def add_maximal_set(self, c_set: ComponentSet, check_subsets: bool = True):
         """
@@ -100,15 +160,60 @@ class CompTable:
         :param c_set: the component set to add
         :param check_subsets: if True, the method does not check for subsets of the given component set to remove
         """
-        # Finds the smallest set of component sets to reduce the workload of the intersection operation
-        c_sets_of_nodes = [self._table.get(node, set()) for node in c_set]
-        smallest_set = min(c_sets_of_nodes, key=len)
-
-        if len(set.intersection(smallest_set, *c_sets_of_nodes)) == 0:
-            if check_subsets:
-                for subset in self._find_subsets(c_set):
-                    self.remove_set(subset)
+        # A set whose nodes are in no tracked set is maximal and has no tracked subsets
+        masks = self._row_masks()
+        if c_set and not any(masks.get(node) for node in c_set):
             self.add_non_maximal_set(c_set)
+            return
+
+        # The bitmask of the component sets containing all the nodes of the given one, seeded with the first row
+        # and narrowed by the others until it becomes empty
+        nodes = iter(c_set)
+        common = masks.get(next(nodes), 0) if c_set else -1
+        for node in nodes:
+            if not common:
+                break
+            common &= masks.get(node, 0)
+
+        # Some tracked set contains all the nodes of the given one, which is therefore not maximal
+        if common:
+            return
+
+        if check_subsets:
+            for subset in self._find_subsets(c_set):
+                self.remove_set(subset)
+        self.add_non_maximal_set(c_set)
+
+    def find_set(self, supernodes: Iterable[Supernode]) -> Optional[ComponentSet]:
+        """
+        Returns the component set tracked in this table containing exactly the given supernodes, if any.
+        The lookup is performed in constant time with respect to the number of tracked sets, once the index of the
+        tracked sets by their supernodes has been built by the first lookup.
+
+        :param supernodes: the supernodes of the component set
+        :return: the tracked component set with the given supernodes, or None if there is no such set
+        """
+        fingerprints = self._fingerprint_index()
+        fingerprint = supernodes if isinstance(supernodes, frozenset) else frozenset(supernodes)
+        c_set = fingerprints.get(fingerprint)
+        if c_set is None:
+            return None
+
+        # The component set might have been removed from the rows of the table or modified since its addition
+        if c_set == fingerprint and c_set in self._table.get(next(iter(fingerprint)), ()):
+            return c_set
+        del fingerprints[fingerprint]
+        return None
+
+    def _fingerprint_index(self) -> Dict[FrozenSet[Supernode], ComponentSet]:
+        """
+        Returns the index of the tracked component sets by their supernodes, building it if it has not been built yet.
+
+        :return: the index of the tracked component sets by their supernodes
+        """
+        if self._fingerprints is None:
+            self._fingerprints = {frozenset(c_set): c_set for c_set in self._all}
+        return self._fingerprints
 
     def _find_subsets(self, c_set: ComponentSet) -> Generator[ComponentSet, None, None]:
         """
@@ -117,14 +222,37 @@ class CompTable:
         :param c_set: the component set
         :return: the subsets of the given component set
         """
-        t_count = dict()
+        # Counts, for each tracked component set, the number of rows of the given nodes in which it is, with a
+        # bit-sliced counter where the i-th bitmask holds the i-th bit of the counts of all component sets
+        masks = self._row_masks()
+        counter = []
         for node in c_set:
-            for c_set in self._table.get(node, set()):
-                t_count[c_set] = t_count.get(c_set, 0) + 1
-
-        for c_set, count in t_count.items():
-            if count == len(c_set):
-                yield c_set
+            carry = masks.get(node, 0)
+            for i, bits in enumerate(counter):
+                counter[i] = bits ^ carry
+                carry &= bits
+                if not carry:
+                    break
+            if carry:
+                counter.append(carry)
+
+        # A component set is a subset if it is in as many rows of the given nodes as its size, that is, if the
+        # bit-sliced count and size of the component set agree on every bit
+        subsets = 0
+        for bits in counter:
+            subsets |= bits
+        for i, size_bits in enumerate(self._size_bits):
+            if not subsets:
+                break
+            subsets &= ~(size_bits ^ counter[i]) if i < len(counter) else ~size_bits
+
+        sets_by_id = self._sets_by_id
+        while subsets:
+            lowest_bit = subsets & -subsets
+            subsets ^= lowest_bit
+            candidate = sets_by_id[lowest_bit.bit_length() - 1]
+            if all(node in c_set for node in candidate):
+                yield candidate
 
     def remove_set(self, c_set: ComponentSet):
         """
@@ -135,9 +263,247 @@ class CompTable:
 
         :param c_set: the component set to remove
         """
+        table = self._table
+        removed = []
+        for node in c_set:
+            row = table.get(node)
+            if row is not None and c_set in row:
+                row.remove(c_set)
+                removed.append(node)
+            if not row:
+                self._emptied.add(node)
+        if removed:
+            self._untrack_membership(c_set, removed)
+        self.modified.update(c_set)
+
+    def add_to_set(self, c_set: ComponentSet, node: Supernode):
+        """
+        Adds the given node to the given component set tracked in the table, adding the component set to the row of
+        the node.
+        Differently from removing the component set and adding an extended copy of it, only the row of the given node
+        is modified and tracked in the modified set, while the rows of the other nodes in the component set still
+        contain the same component set.
+
+        :param c_set: the tracked component set
+        :param node: the node to add to the component set
+        """
+        self._forget_fingerprint(c_set)
+        old_size = len(c_set)
+        c_set.add(node)
+        self._resized(c_set, old_size)
+
+        row = self._table.setdefault(node, set())
+        if c_set not in row:
+            row.add(c_set)
+            self._track_membership(c_set, [node])
+        self.modified.add(node)
+
+    def remove_from_set(self, c_set: ComponentSet, node: Supernode):
+        """
+        Removes the given node from the given component set tracked in the table, removing the component set from the
+        row of the node.
+        Differently from removing the component set and adding a reduced copy of it, only the row of the given node
+        is modified and tracked in the modified set, while the rows of the other nodes in the component set still
+        contain the same component set.
+
+        :param c_set: the tracked component set
+        :param node: the node to remove from the component set
+        """
+        row = self._table.get(node)
+        if row is not None and c_set in row:
+            row.remove(c_set)
+            self._untrack_membership(c_set, [node])
+        if not row:
+            self._emptied.add(node)
+
+        self._forget_fingerprint(c_set)
+        old_size = len(c_set)
+        c_set.discard(node)
+        self._resized(c_set, old_size)
+        self.modified.add(node)
+
+    def merge_sets(self, c_set: ComponentSet, into: ComponentSet):
+        """
+        Moves all the nodes of the first given component set into the second one, removing the first component set
+        from the table.
+        The second component set is extended in place, so that only the rows of the moved nodes are modified and
+        tracked in the modified set, and each of them is updated once rather than once for the removal and once for
+        the addition.
+
+        :param c_set: the tracked component set to merge
+        :param into: the tracked component set extended with the nodes of the first one
+        """
+        table = self._table
+        removed = []
+        moved = []
         for node in c_set:
-            self._table.get(node, set()).discard(c_set)
-            self.modified.add(node)
+            row = table.get(node)
+            if row is None:
+                row = table[node] = set()
+            elif c_set in row:
+                row.remove(c_set)
+                removed.append(node)
+            if into not in row:
+                row.add(into)
+                moved.append(node)
+        if removed:
+            self._untrack_membership(c_set, removed)
+
+        self._forget_fingerprint(into)
+        old_size = len(into)
+        for node in moved:
+            into.add(node)
+        self._resized(into, old_size)
+        if moved:
+            self._track_membership(into, moved)
+        self.modified.update(c_set)
+
+    def only_set(self, node: Supernode) -> ComponentSet:
+        """
+        Returns the only component set in the row of the given node, for tables where each node is in exactly one
+        component set.
+        If the row of the node does not contain exactly one component set, a ValueError is raised.
+
+        :param node: the node
+        :return: the only component set containing the node
+        """
+        (c_set,) = self._table[node]
+        return c_set
+
+    def _forget_fingerprint(self, c_set: ComponentSet):
+        """
+        Removes the fingerprint of the given component set from the table, if the fingerprints have been indexed.
+
+        :param c_set: the component set
+        """
+        fingerprints = self._fingerprints
+        if fingerprints is not None:
+            fingerprint = frozenset(c_set)
+            if fingerprints.get(fingerprint) is c_set:
+                del fingerprints[fingerprint]
+
+    def _resized(self, c_set: ComponentSet, old_size: int):
+        """
+        Updates the fingerprint, if the fingerprints have been indexed, and the size of the given tracked component set
+        after its supernodes have been changed.
+
+        :param c_set: the component set
+        :param old_size: the size of the component set before the change
+        """
+        if self._fingerprints is not None and c_set in self._memberships:
+            self._fingerprints[frozenset(c_set)] = c_set
+        set_id = self._set_ids.get(c_set)
+        if set_id is not None:
+            self._toggle_size_bits(set_id, old_size)
+            self._toggle_size_bits(set_id, len(c_set))
+            self._sizes_by_id[set_id] = len(c_set)
+
+    def _row_masks(self) -> Dict[Supernode, int]:
+        """
+        Returns the bitmasks of the rows of this table, building them if they have not been built yet.
+
+        :return: the bitmasks of the rows of this table
+        """
+        if self._masks is None:
+            self._masks = dict()
+            for node, row in self._table.items():
+                mask = 0
+                for c_set in row:
+                    mask |= 1 << self._id_of(c_set)
+                self._masks[node] = mask
+        return self._masks
+
+    def _track_membership(self, c_set: ComponentSet, nodes: List[Supernode]):
+        """
+        Updates the bookkeeping of this table after the given component set has been added to the rows of the given
+        nodes.
+        The bookkeeping of the component set itself is updated once for all the given nodes.
+
+        :param c_set: the component set added to the rows of the nodes
+        :param nodes: the nodes
+        """
+        count = self._memberships.get(c_set, 0)
+        if not count:
+            self._all.add(c_set)
+            if self._fingerprints is not None:
+                self._fingerprints[frozenset(c_set)] = c_set
+        self._memberships[c_set] = count + len(nodes)
+        masks = self._masks
+        if masks is not None:
+            bit = 1 << self._id_of(c_set)
+            for node in nodes:
+                masks[node] = masks.get(node, 0) | bit
+
+    def _untrack_membership(self, c_set: ComponentSet, nodes: List[Supernode]):
+        """
+        Updates the bookkeeping of this table after the given component set has been removed from the rows of the
+        given nodes.
+        The bookkeeping of the component set itself is updated once for all the given nodes.
+
+        :param c_set: the component set removed from the rows of the nodes
+        :param nodes: the nodes
+        """
+        masks = self._masks
+        if masks is not None:
+            bit = 1 << self._set_ids[c_set]
+            for node in nodes:
+                masks[node] &= ~bit
+        count = self._memberships[c_set] - len(nodes)
+        if count:
+            self._memberships[c_set] = count
+        else:
+            del self._memberships[c_set]
+            self._all.discard(c_set)
+            self._forget_fingerprint(c_set)
+            if masks is not None:
+                self._release_id(c_set)
+
+    def _id_of(self, c_set: ComponentSet) -> int:
+        """
+        Returns the identifier of the given component set, assigning a new one if it has none.
+
+        :param c_set: the component set
+        :return: the identifier of the component set
+        """
+        set_id = self._set_ids.get(c_set)
+        if set_id is None:
+            size = len(c_set)
+            if self._free_ids:
+                set_id = self._free_ids.pop()
+                self._sets_by_id[set_id] = c_set
+                self._sizes_by_id[set_id] = size
+            else:
+                set_id = len(self._sets_by_id)
+                self._sets_by_id.append(c_set)
+                self._sizes_by_id.append(size)
+            self._set_ids[c_set] = set_id
+            self._toggle_size_bits(set_id, size)
+        return set_id
+
+    def _release_id(self, c_set: ComponentSet):
+        """
+        Releases the identifier of the given component set, which is no longer in any row, so that it can be reused.
+
+        :param c_set: the component set
+        """
+        set_id = self._set_ids.pop(c_set)
+        self._sets_by_id[set_id] = None
+        self._free_ids.append(set_id)
+        self._toggle_size_bits(set_id, self._sizes_by_id[set_id])
+
+    def _toggle_size_bits(self, set_id: int, size: int):
+        """
+        Toggles the bits of the given size in the bit-sliced sizes of the component sets, for the given identifier.
+
+        :param set_id: the identifier of the component set
+        :param size: the size of the component set
+        """
+        bit = 1 << set_id
+        while len(self._size_bits) < size.bit_length():
+            self._size_bits.append(0)
+        for i in range(size.bit_length()):
+            if size >> i & 1:
+                self._size_bits[i] ^= bit
 
     def add_singletons(self, id_function: Callable[[], int]):
         """
@@ -146,12 +512,29 @@ class CompTable:
         Note that only the nodes that have been tracked as modified are considered for this operation, since
         having empty set of component sets for a node is not a valid state in this table outside the update
         procedure of a contraction scheme.
+        Among them, only the nodes whose rows have been emptied or deleted since the last call of this method or of
+        ``clear_modified`` are checked.
 
         :param id_function: the function to generate unique identifiers for the new component sets
         """
-        for node in self.modified:
-            if not self._table.get(node):
-                self.add_set(ComponentSet(id_function(), {node}))
+        # Rows only become empty through removals, so the modified nodes whose rows have not been emptied since the
+        # last call are not scanned
+        if not self._emptied:
+            return
+        table = self._table
+        modified = self.modified
+        self.add_sets([ComponentSet(id_function(), {node}) for node in self._emptied
+                       if node in modified and not table.get(node)])
+        self._emptied.clear()
+
+    def clear_modified(self):
+        """
+        Clears the set of modified nodes of this table, at the end of the update procedure of a contraction scheme.
+        The nodes whose rows have been emptied or deleted are forgotten as well, since only modified nodes are
+        considered by ``add_singletons``.
+        """
+        self.modified.clear()
+        self._emptied.clear()
 
     def get_all_c_sets(self) -> Set[ComponentSet]:
         """
@@ -159,16 +542,27 @@ class CompTable:
 
         :return: all the unique component sets tracked in this table
         """
-        return set.union(*self._table.values(), set())
+        return self._all.copy()
 
     def __getitem__(self, key: Supernode) -> Set[ComponentSet]:
         return self._table[key]
 
     def __setitem__(self, key: Supernode, value: Set[ComponentSet]):
+        old_value = self._table.get(key, set())
         self._table[key] = value
+        if not value:
+            self._emptied.add(key)
+        for c_set in old_value - value:
+            self._untrack_membership(c_set, [key])
+        for c_set in value - old_value:
+            self._track_membership(c_set, [key])
 
     def __delitem__(self, key: Supernode):
-        del self._table[key]
+        for c_set in self._table.pop(key):
+            self._untrack_membership(c_set, [key])
+        self._emptied.add(key)
+        if self._masks is not None:
+            self._masks.pop(key, None)
 
     def __iter__(self):
         return iter(self._table)
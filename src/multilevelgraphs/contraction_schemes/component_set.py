@@ -20,6 +20,12 @@ class ComponentSet:
     key : Any
         the unique identifier of the component set in its contraction scheme
 
+    Notes
+    -----
+    The hash of a component set is computed once from its key when the component set is created, as component sets
+    are frequently hashed in the rows of the component sets tables. For this reason, the key of a component set should
+    not be modified after its creation.
+
     Examples
     --------
     A ComponentSet can be treated as a set of supernodes, for instance::
@@ -45,6 +51,7 @@ class ComponentSet:
     key: Any
     _supernodes: Set[Supernode]
     _attr: Dict[str, Any]
+    _hash: int
 
     def __init__(self, key: Any, supernodes: Set[Supernode] = None, **attr):
         """
@@ -55,6 +62,7 @@ class ComponentSet:
         :param attr: the key-values pairs attributes of the component set
         """
         self.key = key
+        self._hash = hash(key)
         self._supernodes = supernodes if supernodes else set()
         self._attr = attr
 
@@ -117,7 +125,17 @@ class ComponentSet:
         return str(self)
 
     def __hash__(self) -> int:
-        return hash(self.key)
+        return self._hash
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # The hash is not pickled, as the hash of the key may differ in other interpreters
+        state = self.__dict__.copy()
+        del state['_hash']
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__dict__.update(state)
+        self._hash = hash(self.key)
 
     def __eq__(self, other: Union[Iterable[Supernode], 'ComponentSet']) -> bool:
         if isinstance(other, ComponentSet):
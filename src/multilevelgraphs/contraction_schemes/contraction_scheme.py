@@ -5,6 +5,10 @@ from multilevelgraphs.dec_graphs import DecGraph, Supernode, Superedge
 from multilevelgraphs.contraction_schemes import CompTable, UpdateQuadruple, ComponentSet
 
 
+def _no_attributes(_) -> Dict[str, Any]:
+    return {}
+
+
 class ContractionScheme(ABC):
     """
     An abstract class for contraction schemes.
@@ -77,6 +81,7 @@ class ContractionScheme(ABC):
     _supernode_attr_function: Callable[[Supernode], Dict[str, Any]]
     _superedge_attr_function: Callable[[Superedge], Dict[str, Any]]
     _c_set_attr_function: Callable[[Set[Supernode]], Dict[str, Any]]
+    _singleton_attrs: Optional[Dict[str, Any]]
     _deleted_subnodes: Dict[Supernode, Set[Supernode]]
 
     def __init__(self,
@@ -92,9 +97,12 @@ class ContractionScheme(ABC):
         """
         self._supernode_id_counter = 0
         self._component_set_id_counter = 0
-        self._supernode_attr_function = supernode_attr_function if supernode_attr_function else lambda x: {}
-        self._superedge_attr_function = superedge_attr_function if superedge_attr_function else lambda x: {}
-        self._c_set_attr_function = c_set_attr_function if c_set_attr_function else lambda x: {}
+        self._supernode_attr_function = supernode_attr_function if supernode_attr_function else _no_attributes
+        self._superedge_attr_function = superedge_attr_function if superedge_attr_function else _no_attributes
+        self._c_set_attr_function = c_set_attr_function if c_set_attr_function else _no_attributes
+        # Without a user-defined component set attribute function, every component set gets the same (empty)
+        # attributes, so they are computed once instead of calling the function for each new set
+        self._singleton_attrs = {} if self._c_set_attr_function is _no_attributes else None
         self._deleted_subnodes = dict()
         self._valid = False
         self.level = None
@@ -235,6 +243,21 @@ class ContractionScheme(ABC):
         self._component_set_id_counter += 1
         return self._component_set_id_counter
 
+    def _singleton_c_set(self, node: Supernode) -> ComponentSet:
+        """
+        Returns a new component set of this contraction scheme containing only the given node, with a new unique
+        identifier and the attributes assigned by the component set attribute function of this scheme.
+        The set of the node is built once and is also the one given to the attribute function, if any.
+
+        :param node: the node of the component set
+        :return: the new singleton component set
+        """
+        singleton = {node}
+        attrs = self._singleton_attrs
+        return ComponentSet(self._get_component_set_id(),
+                            singleton,
+                            **(attrs if attrs is not None else self._c_set_attr_function(singleton)))
+
     def _get_supernode_key(self):
         return (str(self.level)+"_" if self.level else "") \
             + self.contraction_name() + "_" \
@@ -300,7 +323,7 @@ class ContractionScheme(ABC):
 
         # For each edge, we assign it to a superedge if the tail and head are in different supernodes,
         # otherwise we assign it to the supernode containing both tail and head.
-        for edge in dec_graph.edges():
+        for edge in dec_graph.E.values():
             tail = edge.tail
             head = edge.head
             if tail.supernode != head.supernode:
@@ -315,9 +338,9 @@ class ContractionScheme(ABC):
         """
         Updates the attributes of the supernodes, superedges and component sets of this contraction scheme.
         """
-        for supernode in self.dec_graph.nodes():
+        for supernode in self.dec_graph.V.values():
             supernode.update(**self._supernode_attr_function(supernode))
-        for superedge in self.dec_graph.edges():
+        for superedge in self.dec_graph.E.values():
             superedge.update(**self._superedge_attr_function(superedge))
         for c_set in self.component_sets_table.get_all_c_sets():
             c_set.update(**self._c_set_attr_function(set(c_set)))
@@ -383,7 +406,8 @@ class ContractionScheme(ABC):
         """
         self.dec_graph.remove_node(supernode)
         self.update_quadruple.add_v_minus(supernode)
-        if supernode.component_sets in self.supernode_table:
+        # The component sets of a star changed in place may have become the key of another supernode
+        if self.supernode_table.get(supernode.component_sets) is supernode:
             del self.supernode_table[supernode.component_sets]
 
     def _update_graph(self):
@@ -404,12 +428,16 @@ class ContractionScheme(ABC):
 
             # The old supernode of the node is stored to update the edges later
             old_supernodes[node] = node.supernode
-            # The removal of the node from the old supernode is tracked
-            self._deleted_subnodes.setdefault(node.supernode, set()).add(node)
 
-            # The node is assigned to the new supernode
-            node.supernode = self.supernode_table[c_sets_of_node]
-            node.supernode.dec.add_node(node)
+            # A node whose component sets have been changed in place may still belong to the same supernode
+            new_supernode = self.supernode_table[c_sets_of_node]
+            if node.supernode is not new_supernode:
+                # The removal of the node from the old supernode is tracked
+                self._deleted_subnodes.setdefault(node.supernode, set()).add(node)
+
+                # The node is assigned to the new supernode
+                node.supernode = new_supernode
+                node.supernode.dec.add_node(node)
 
         # Edges at lower level are moved among superedges and supernodes according to the changes in the component
         # sets table
@@ -454,14 +482,13 @@ class ContractionScheme(ABC):
 
         # The set of nodes in each old supernode is updated
         for supernode, node_set in self._deleted_subnodes.items():
-            for node in node_set:
-                supernode.dec.remove_node(node)
+            supernode.dec.remove_nodes_from(node_set)
             # The supernodes that have no longer sub-nodes are removed
-            if not supernode.dec.nodes():
+            if not supernode.dec.V:
                 self._remove_supernode(supernode)
 
         self._deleted_subnodes.clear()
-        self.component_sets_table.modified.clear()
+        self.component_sets_table.clear_modified()
 
     def __str__(self):
         return f"{self.contraction_name()}"
@@ -21,14 +21,14 @@ class DecontractionEdgeBasedContractionScheme(EdgeBasedContractionScheme, ABC):
         :class:`EdgeBasedContractionScheme`, :class:`ContractionScheme`
     """
 
-    _decontracted_graph: Optional[DecGraph]
+    _decontraction: Optional[DecGraph]
 
     def __init__(self,
                  supernode_attr_function: Callable[[Supernode], Dict[str, Any]] = None,
                  superedge_attr_function: Callable[[Superedge], Dict[str, Any]] = None,
                  c_set_attr_function: Callable[[Set[Supernode]], Dict[str, Any]] = None):
         super().__init__(supernode_attr_function, superedge_attr_function, c_set_attr_function)
-        self._decontracted_graph = None  # Used to store the current complete decontraction during subsequent updates
+        self._decontraction = None  # Used to store the current complete decontraction during subsequent updates
 
     @abstractmethod
     def contraction_name(self) -> str:
@@ -42,23 +42,32 @@ class DecontractionEdgeBasedContractionScheme(EdgeBasedContractionScheme, ABC):
     def contraction_function(self, dec_graph: DecGraph) -> CompTable:
         pass
 
+    @property
+    def _decontracted_graph(self) -> DecGraph:
+        """
+        Returns the complete decontraction of the graph of this scheme.
+        The complete decontraction is only built when it is first accessed, so that the update procedures that
+        precede it do not need to maintain it, and it is then kept up to date by the following update procedures.
+
+        :return: the complete decontraction of the graph of this scheme
+        """
+        if self._decontraction is None:
+            self._decontraction = self.dec_graph.complete_decontraction()
+        return self._decontraction
+
     # The following methods are overridden to update the decontracted graph used during the other update
     # procedures of the scheme.
     def _update_added_node(self, node: Supernode):
         super()._update_added_node(node)
 
-        if not self._decontracted_graph:
-            self._decontracted_graph = self.dec_graph.complete_decontraction()
-        else:
-            self._decontracted_graph.add_node(node)
+        if self._decontraction is not None:
+            self._decontraction.add_node(node)
 
     def _update_removed_node(self, node: Supernode):
         super()._update_removed_node(node)
 
-        if not self._decontracted_graph:
-            self._decontracted_graph = self.dec_graph.complete_decontraction()
-        else:
-            self._decontracted_graph.remove_node(node)
+        if self._decontraction is not None:
+            self._decontraction.remove_node(node)
 
     @abstractmethod
     def _update_added_edge(self, superedge: Superedge):
@@ -71,10 +80,11 @@ class DecontractionEdgeBasedContractionScheme(EdgeBasedContractionScheme, ABC):
     def set_decontracted_graph(self):
         """
         Sets the complete decontraction of the graph of this scheme.
-        This method is used to lazily set the decontracted graph during the update procedures.
+        This method is used to build the decontracted graph during the update procedures before the graph of this
+        scheme is modified.
         """
-        if not self._decontracted_graph:
-            self._decontracted_graph = self.dec_graph.complete_decontraction()
+        if self._decontraction is None:
+            self._decontraction = self.dec_graph.complete_decontraction()
 
     def _add_edge_to_decontraction(self, edge: Superedge):
         """
@@ -83,10 +93,8 @@ class DecontractionEdgeBasedContractionScheme(EdgeBasedContractionScheme, ABC):
 
         :param edge: the superedge to add to the complete decontraction
         """
-        if not self._decontracted_graph:
-            self._decontracted_graph = self.dec_graph.complete_decontraction()
-        else:
-            self._decontracted_graph.add_edge(Superedge(edge.tail, edge.head))
+        if self._decontraction is not None:
+            self._decontraction.add_edge(edge)
 
     def _remove_edge_from_decontraction(self, edge: Superedge):
         """
@@ -95,7 +103,5 @@ class DecontractionEdgeBasedContractionScheme(EdgeBasedContractionScheme, ABC):
 
         :param edge: the superedge to remove from the complete decontraction
         """
-        if not self._decontracted_graph:
-            self._decontracted_graph = self.dec_graph.complete_decontraction()
-        else:
-            self._decontracted_graph.remove_edge(Superedge(edge.tail, edge.head))
+        if self._decontraction is not None:
+            self._decontraction.remove_edge(edge)
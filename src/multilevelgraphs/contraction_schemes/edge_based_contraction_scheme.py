@@ -2,7 +2,7 @@ from abc import ABC, abstractmethod
 from typing import Callable, Dict, Any, Set
 
 from multilevelgraphs.dec_graphs import DecGraph, Supernode, Superedge
-from multilevelgraphs.contraction_schemes import ContractionScheme, CompTable, ComponentSet
+from multilevelgraphs.contraction_schemes import ContractionScheme, CompTable
 
 
 class EdgeBasedContractionScheme(ContractionScheme, ABC):
@@ -44,10 +44,10 @@ class EdgeBasedContractionScheme(ContractionScheme, ABC):
     def _update_added_node(self, node: Supernode):
         # A new dummy supernode is created for the new node, in order to provide a temporary supernode for the new node
         # during following update procedures before the _update_graph procedure.
-        new_c_set = ComponentSet(self._get_component_set_id(), {node}, **(self._c_set_attr_function({node})))
+        # Being new, the node is only in the singleton component set created for it.
+        new_c_set = self._singleton_c_set(node)
         self.component_sets_table.add_set(new_c_set)
-        f_c_set = frozenset(self.component_sets_table[node])
-        dummy_supernode = Supernode(self._get_supernode_id(), level=self.level, component_sets=f_c_set)
+        dummy_supernode = Supernode(self._get_supernode_id(), level=self.level, component_sets=frozenset((new_c_set,)))
         dummy_supernode.add_node(node)
         node.supernode = dummy_supernode
         self.update_quadruple.add_v_plus(dummy_supernode)
@@ -1,8 +1,31 @@
-from typing import Iterable, Set
+import collections.abc
+from typing import AbstractSet, Iterable, Iterator, Set
 
 from multilevelgraphs.dec_graphs import Supernode, Superedge
 
 
+class _SetView(collections.abc.Set):
+    """
+    A read-only view of a set, reflecting its changes without copying its elements.
+    """
+    __slots__ = ('_elements',)
+
+    def __init__(self, elements: Set):
+        self._elements = elements
+
+    def __contains__(self, element) -> bool:
+        return element in self._elements
+
+    def __iter__(self) -> Iterator:
+        return iter(self._elements)
+
+    def __len__(self) -> int:
+        return len(self._elements)
+
+    def __repr__(self):
+        return repr(self._elements)
+
+
 class UpdateQuadruple:
     """
     A quadruple of sets of supernodes and superedges that represent an update in the decontractible graph of a
@@ -19,6 +42,8 @@ class UpdateQuadruple:
     The update quadruple is managed in order to maintain itself minimal, that is, ``v_plus`` and ``v_minus``
     are disjoint and ``e_plus`` and ``e_minus`` are disjoint.
     """
+    __slots__ = ('_v_plus', '_v_minus', '_e_plus', '_e_minus')
+
     _v_plus: Set[Supernode]
     _v_minus: Set[Supernode]
     _e_plus: Set[Superedge]
@@ -35,36 +60,36 @@ class UpdateQuadruple:
         self._e_minus = set(e_minus) if e_minus else set()
 
     @property
-    def v_plus(self) -> Set[Supernode]:
+    def v_plus(self) -> AbstractSet[Supernode]:
         """
-        Returns a copy of the set of supernodes that have been added.
-        :return: a copy of the set of supernodes that have been added
+        Returns a read-only view of the set of supernodes that have been added.
+        :return: a read-only view of the set of supernodes that have been added
         """
-        return set(self._v_plus)
+        return _SetView(self._v_plus)
 
     @property
-    def v_minus(self) -> Set[Supernode]:
+    def v_minus(self) -> AbstractSet[Supernode]:
         """
-        Returns a copy of the set of supernodes that have been removed.
-        :return: a copy of the set of supernodes that have been removed
+        Returns a read-only view of the set of supernodes that have been removed.
+        :return: a read-only view of the set of supernodes that have been removed
         """
-        return set(self._v_minus)
+        return _SetView(self._v_minus)
 
     @property
-    def e_plus(self) -> Set[Superedge]:
+    def e_plus(self) -> AbstractSet[Superedge]:
         """
-        Returns a copy of the set of superedges that have been added.
-        :return: a copy of the set of superedges that have been added
+        Returns a read-only view of the set of superedges that have been added.
+        :return: a read-only view of the set of superedges that have been added
         """
-        return set(self._e_plus)
+        return _SetView(self._e_plus)
 
     @property
-    def e_minus(self) -> Set[Superedge]:
+    def e_minus(self) -> AbstractSet[Superedge]:
         """
-        Returns a copy of the set of superedges that have been removed.
-        :return: a copy of the set of superedges that have been removed
+        Returns a read-only view of the set of superedges that have been removed.
+        :return: a read-only view of the set of superedges that have been removed
         """
-        return set(self._e_minus)
+        return _SetView(self._e_minus)
 
     def add_v_plus(self, supernode: Supernode):
         """
@@ -114,6 +139,62 @@ class UpdateQuadruple:
         else:
             self._e_plus.remove(superedge)
 
+    def add_v_plus_from(self, supernodes: Iterable[Supernode]):
+        """
+        Adds the given supernodes to the set of supernodes that have been added.
+        The supernodes that are in the set of supernodes that have been removed are removed from that set instead.
+
+        :param supernodes: the supernodes to add
+        """
+        self._add_from(self._v_plus, self._v_minus, supernodes)
+
+    def add_v_minus_from(self, supernodes: Iterable[Supernode]):
+        """
+        Adds the given supernodes to the set of supernodes that have been removed.
+        The supernodes that are in the set of supernodes that have been added are removed from that set instead.
+
+        :param supernodes: the supernodes to add
+        """
+        self._add_from(self._v_minus, self._v_plus, supernodes)
+
+    def add_e_plus_from(self, superedges: Iterable[Superedge]):
+        """
+        Adds the given superedges to the set of superedges that have been added.
+        The superedges that are in the set of superedges that have been removed are removed from that set instead.
+
+        :param superedges: the superedges to add
+        """
+        self._add_from(self._e_plus, self._e_minus, superedges)
+
+    def add_e_minus_from(self, superedges: Iterable[Superedge]):
+        """
+        Adds the given superedges to the set of superedges that have been removed.
+        The superedges that are in the set of superedges that have been added are removed from that set instead.
+
+        :param superedges: the superedges to add
+        """
+        self._add_from(self._e_minus, self._e_plus, superedges)
+
+    @staticmethod
+    def _add_from(target: Set, opposite: Set, elements: Iterable):
+        """
+        Adds the given elements to the target set, except for the ones in the opposite set, which are removed from
+        it instead.
+        The sets are updated with set operations, so that the elements are not added one at a time.
+
+        :param target: the set to which the elements are added
+        :param opposite: the set from which the elements are removed, if present
+        :param elements: the elements to add
+        """
+        if not isinstance(elements, (set, frozenset)):
+            elements = set(elements)
+        cancelled = opposite.intersection(elements)
+        if cancelled:
+            opposite.difference_update(cancelled)
+            target.update(elements.difference(cancelled))
+        else:
+            target.update(elements)
+
     def has_updates(self) -> bool:
         """
         Returns True if there are any supernodes or superedges in any of the sets of the update quadruple,
@@ -138,7 +219,9 @@ class UpdateQuadruple:
                f'e_minus={self._e_minus})'
 
     def __eq__(self, other):
-        return self._v_plus == other.v_plus \
-            and self._v_minus == other.v_minus \
-            and self._e_plus == other.e_plus \
-            and self._e_minus == other.e_minus
\ No newline at end of file
+        if not isinstance(other, UpdateQuadruple):
+            return NotImplemented
+        return self._v_plus == other._v_plus \
+            and self._v_minus == other._v_minus \
+            and self._e_plus == other._e_plus \
+            and self._e_minus == other._e_minus
\ No newline at end of file
@@ -90,7 +90,7 @@ class CliquesContractionScheme(EdgeBasedContractionScheme):
             for clique in intersection_cliques:
                 self.component_sets_table.add_set(
                     ComponentSet(self._get_component_set_id(),
-                                 set.union(set(), *(self.dec_graph.V[key].dec.nodes() for key in clique)) |
+                                 set().union(*(self.dec_graph.V[key].dec.V.values() for key in clique)) |
                                  {edge.tail, edge.head})
                 )
 
@@ -124,9 +124,11 @@ class CliquesContractionScheme(EdgeBasedContractionScheme):
             new_cliques_candidates: List[Set[Supernode]] = []
 
             # Cliques that contain both edge.tail and edge.head are removed. Two possible new maximal cliques are
-            # collected for each of them.
+            # collected for each of them. The difference of a component set already is a new set, while the removed
+            # component set itself is not reduced in place, since it is still referenced by its supernode until the
+            # graph is updated.
             for c_set in set.intersection(self.component_sets_table[edge.tail], self.component_sets_table[edge.head]):
-                new_cliques_candidates += [set(c_set - {edge.tail}), set(c_set - {edge.head})]
+                new_cliques_candidates += [c_set - {edge.tail}, c_set - {edge.head}]
                 self.component_sets_table.remove_set(c_set)
 
             # For each new maximal clique candidate, if it is not a subset of any other clique, it is added to the
@@ -149,8 +151,9 @@ class CliquesContractionScheme(EdgeBasedContractionScheme):
 
         :return: the undirected graph of cliques
         """
-        undirected_version = self.dec_graph.graph().to_undirected(reciprocal=self._reciprocal)
-        for und_edge in undirected_version.edges():
+        # The edges are removed from a copy, since the undirected graph of the decontractible graph is cached
+        undirected_version = self.dec_graph.undirected_graph(reciprocal=self._reciprocal).copy()
+        for und_edge in list(undirected_version.edges()):
             if not self._are_supernodes_adjacent(*und_edge):
                 undirected_version.remove_edge(*und_edge)
         return undirected_version
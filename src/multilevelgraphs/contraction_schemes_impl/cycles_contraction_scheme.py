@@ -1,4 +1,5 @@
-from typing import Callable, Set, Dict, Any, Generator, Tuple
+import itertools
+from typing import Callable, Set, Dict, Any, Generator, Tuple, Hashable, List, Optional
 import networkx as nx
 
 from multilevelgraphs.contraction_schemes import DecontractionEdgeBasedContractionScheme, CompTable, ComponentSet
@@ -21,18 +22,37 @@ class CyclesContractionScheme(DecontractionEdgeBasedContractionScheme):
 
     The maximal attribute of the scheme determines whether only maximal simple cycles are considered.
 
+    Since the simple cycles of distinct strongly connected components are independent, the enumeration performed by
+    the contraction function can be distributed over a pool of worker processes, one component at a time.
+
     Attributes
     ----------
     _maximal : bool
         boolean value that determines whether only maximal simple cycles are considered
+    _workers : Optional[int]
+        the number of worker processes used to enumerate the simple cycles in the contraction function,
+        if None or lower than 2 the cycles are enumerated in the calling process
+    _johnson_state : JohnsonState
+        the working state of the cycle search, reused by every update of this scheme
+    _scc_ids : Optional[Dict[Hashable, int]]
+        a mapping between the keys of the nodes in the complete decontraction and the identifier of their strongly
+        connected component, lazily computed and maintained during the updates of this scheme
+    _scc_members : Dict[int, Set[Hashable]]
+        a mapping between the identifiers of the strongly connected components and the keys of their nodes
     """
     _maximal: bool
+    _workers: Optional[int]
+    _johnson_state: 'JohnsonState'
+    _scc_ids: Optional[Dict[Hashable, int]]
+    _scc_members: Dict[int, Set[Hashable]]
+    _scc_id_counter: int
 
     def __init__(self,
                  supernode_attr_function: Callable[[Supernode], Dict[str, Any]] = None,
                  superedge_attr_function: Callable[[Superedge], Dict[str, Any]] = None,
                  c_set_attr_function: Callable[[Set[Supernode]], Dict[str, Any]] = None,
-                 maximal: bool = True):
+                 maximal: bool = True,
+                 workers: Optional[int] = None):
         """
         Initializes a contraction scheme based on the contraction function by simple cycles.
         A simple cycle, or elementary circuit, is a closed path where no node appears twice.
@@ -44,9 +64,16 @@ class CyclesContractionScheme(DecontractionEdgeBasedContractionScheme):
         :param superedge_attr_function: a function that returns the attributes to assign to each superedge of this scheme
         :param c_set_attr_function: a function that returns the attributes to assign to each component set of this scheme
         :param maximal: if True, only maximal simple cycles are considered
+        :param workers: the number of worker processes used to enumerate the simple cycles of distinct strongly
+        connected components in parallel, if None or lower than 2 no worker process is used
         """
         super().__init__(supernode_attr_function, superedge_attr_function, c_set_attr_function)
         self._maximal = maximal
+        self._workers = workers
+        self._johnson_state = JohnsonState()
+        self._scc_ids = None
+        self._scc_members = dict()
+        self._scc_id_counter = 0
 
     def contraction_name(self) -> str:
         return "simple" + ("_maximal" if self._maximal else "") + "_cycles"
@@ -55,10 +82,13 @@ class CyclesContractionScheme(DecontractionEdgeBasedContractionScheme):
         return CyclesContractionScheme(self._supernode_attr_function,
                                        self._superedge_attr_function,
                                        self._c_set_attr_function,
-                                       self._maximal)
+                                       self._maximal,
+                                       self._workers)
 
     def contraction_function(self, dec_graph: DecGraph) -> CompTable:
-        comp_sets = self._component_set_from_cycles(simple_cycles(dec_graph))
+        self._scc_ids = None
+        cycles = simple_cycles(dec_graph, self._workers)
+        comp_sets = self._component_set_from_cycles(cycles)
 
         if self._maximal:
             comp_table = CompTable(maximal=self._maximal)
@@ -68,20 +98,19 @@ class CyclesContractionScheme(DecontractionEdgeBasedContractionScheme):
         else:
             comp_table = CompTable(comp_sets, maximal=self._maximal)
 
-        for node in dec_graph.V.values():
-            if node not in comp_table:
-                comp_table.add_set(ComponentSet(self._get_component_set_id(),
-                                                {node},
-                                                **(self._c_set_attr_function({node}))))
+        comp_table.add_sets([self._singleton_c_set(node) for node in dec_graph.V.values() if node not in comp_table])
 
-        comp_table.modified.clear()
+        comp_table.clear_modified()
 
         return comp_table
 
     def _component_set_from_cycles(self, cycles: Generator[Tuple[Supernode, ...], None, None]) -> Generator[ComponentSet, None, None]:
+        attrs = self._singleton_attrs
         for cycle in cycles:
             cycle_set = set(cycle)
-            yield ComponentSet(self._get_component_set_id(), cycle_set, **(self._c_set_attr_function(cycle_set)))
+            yield ComponentSet(self._get_component_set_id(),
+                               cycle_set,
+                               **(attrs if attrs is not None else self._c_set_attr_function(cycle_set)))
 
     def _update_added_edge(self, edge: Superedge):
         u = edge.tail.supernode
@@ -94,13 +123,41 @@ class CyclesContractionScheme(DecontractionEdgeBasedContractionScheme):
 
         self._add_edge_to_decontraction(edge)
 
-        # Find all the simple cycles that contain the new edge and track them in the component sets table
-        for new_circuit in self.cycle_search(self._decontracted_graph.graph(), [edge.tail.key, edge.head.key]):
+        if edge.tail == edge.head:
+            # A self-loop is a cycle by itself and does not change the strongly connected components
+            self.component_sets_table.add_set(ComponentSet(self._get_component_set_id(), {edge.tail}),
+                                              maximal=self._maximal)
+            return
+
+        graph = self._decontracted_graph.graph(ref=True)
+        tail_scc, head_scc = self._scc_of(edge.tail.key), self._scc_of(edge.head.key)
+        if tail_scc != head_scc:
+            # The new edge is part of some cycle only if it merges the strongly connected components on the paths
+            # from its head to its tail
+            reachable = nx.descendants(graph, edge.head.key)
+            if edge.tail.key not in reachable:
+                return
+            merged = reachable & nx.ancestors(graph, edge.tail.key)
+            merged.update((edge.tail.key, edge.head.key))
+            for scc in {self._scc_ids[key] for key in merged}:
+                del self._scc_members[scc]
+            tail_scc = self._set_scc(merged)
+
+        # Find all the simple cycles that contain the new edge and track them in the component sets table.
+        # Such cycles can only involve nodes in the strongly connected component of the edge.
+        for new_circuit in self.cycle_search(graph.subgraph(self._scc_members[tail_scc]),
+                                             [edge.tail.key, edge.head.key],
+                                             self._johnson_state):
             new_c_set = ComponentSet(self._get_component_set_id(),
                                      {self._decontracted_graph.V[node] for node in new_circuit})
             self.component_sets_table.add_set(new_c_set, maximal=self._maximal)
 
     def _update_removed_edge(self, edge: Superedge):
+        # The strongly connected components are looked up before the edge is removed from the decontraction
+        self.set_decontracted_graph()
+        tail_scc = self._scc_of(edge.tail.key)
+        same_scc = tail_scc == self._scc_of(edge.head.key)
+
         u = edge.tail.supernode
         v = edge.head.supernode
 
@@ -111,38 +168,213 @@ class CyclesContractionScheme(DecontractionEdgeBasedContractionScheme):
 
         self._remove_edge_from_decontraction(edge)
 
+        if not same_scc:
+            # The removed edge was not part of any cycle
+            return
+
+        if edge.tail == edge.head:
+            # A removed self-loop only breaks the cycle made of its node alone
+            for c_set in [c_set for c_set in self.component_sets_table[edge.tail] if len(c_set) == 1]:
+                self.component_sets_table.remove_set(c_set)
+            self.component_sets_table.add_singletons(self._get_component_set_id)
+            return
+
+        graph = self._decontracted_graph.graph(ref=True)
+
+        # Only the strongly connected component of the removed edge may be split
+        for scc in nx.strongly_connected_components(graph.subgraph(self._scc_members.pop(tail_scc))):
+            self._set_scc(scc)
+
         c_sets_intersection = \
             set.intersection(self.component_sets_table[edge.tail], self.component_sets_table[edge.head])
 
+        # Sub-cycles found for a component set may also be found for the following ones. They are added only after
+        # all broken component sets have been removed, since a sub-cycle of one of them would otherwise be rejected
+        # as a subset of another broken component set still in the table
+        sub_cycles = dict()
         for c_set in c_sets_intersection:
             # We look for possible alternative cycles that contain all nodes in c_set
             c_set_keys = frozenset({n.key for n in c_set})
-            cycles_in_c_set_with_tail = {frozenset(cycle) for cycle in
-                                         self.cycle_search(self._decontracted_graph.graph().subgraph(c_set_keys),
-                                                           [edge.tail.key])}
-            if c_set_keys not in cycles_in_c_set_with_tail:
+            # The induced subgraph is materialized once, so that the searches do not filter the neighbors of
+            # each node through a subgraph view of the whole graph
+            c_set_graph = graph.subgraph(c_set_keys).copy()
+
+            # A cycle through all nodes in c_set can only exist if they are still strongly connected.
+            # Otherwise, the cycles containing edge.tail are only needed to find the new maximal sub-cycles.
+            # The search stops as soon as a cycle through all nodes in c_set is found
+            found_full = False
+            cycles_in_c_set_with_tail = []
+            if self._maximal or nx.is_strongly_connected(c_set_graph):
+                for cycle in self.cycle_search(c_set_graph, [edge.tail.key], self._johnson_state):
+                    if len(cycle) == len(c_set_keys):
+                        found_full = True
+                        break
+                    cycles_in_c_set_with_tail.append(cycle)
+
+            if not found_full:
                 self.component_sets_table.remove_set(c_set)
 
                 # If the scheme is maximal, new maximal cycles that are sub-cycles of the removed cycle are considered.
                 # If not, the sub-cycles must be already tracked in the table.
                 if self._maximal:
-                    for cycle in cycles_in_c_set_with_tail:
-                        self.component_sets_table.add_set(ComponentSet(self._get_component_set_id(),
-                                                                       {self._decontracted_graph.V[key] for key in
-                                                                        cycle}),
-                                                          maximal=True)
-
-                    # All remaining cycles in c_set that does not contain edge.tail must be considered
-                    remaining_cycles_in_c_set = [
-                        {self._decontracted_graph.V[key] for key in cycle} for cycle in
-                        nx.simple_cycles(self._decontracted_graph.graph().subgraph(c_set_keys - {edge.tail.key}))
-                    ]
-                    for cycle in remaining_cycles_in_c_set:
-                        self.component_sets_table.add_set(ComponentSet(self._get_component_set_id(), cycle),
-                                                          maximal=True)
+                    # All remaining cycles in c_set that does not contain edge.tail must be considered as well
+                    c_set_graph.remove_node(edge.tail.key)
+                    for cycle in itertools.chain(cycles_in_c_set_with_tail, nx.simple_cycles(c_set_graph)):
+                        sub_cycles.setdefault(frozenset(cycle), None)
+
+        for cycle_keys in sub_cycles:
+            self.component_sets_table.add_set(ComponentSet(self._get_component_set_id(),
+                                                           {self._decontracted_graph.V[key] for key in cycle_keys}),
+                                              maximal=True)
+
         # Some nodes may no longer be part of any cycle
         self.component_sets_table.add_singletons(self._get_component_set_id)
 
+    def _update_added_node(self, node: Supernode):
+        super()._update_added_node(node)
+        if self._scc_ids is not None:
+            self._set_scc({node.key})
+
+    def _update_removed_node(self, node: Supernode):
+        super()._update_removed_node(node)
+        if self._scc_ids is not None:
+            del self._scc_members[self._scc_ids.pop(node.key)]
+
+    def _scc_of(self, key: Hashable) -> int:
+        """
+        Returns the identifier of the strongly connected component of the node with the given key in the complete
+        decontraction of the graph of this scheme.
+        The strongly connected components are computed the first time this method is called and are then
+        maintained by the update procedures of this scheme.
+
+        :param key: the key of the node
+        :return: the identifier of the strongly connected component of the node
+        """
+        if self._scc_ids is None:
+            self._scc_ids = dict()
+            self._scc_members = dict()
+            for scc in nx.strongly_connected_components(self._decontracted_graph.graph(ref=True)):
+                self._set_scc(scc)
+        return self._scc_ids[key]
+
+    def _set_scc(self, keys: Set[Hashable]) -> int:
+        """
+        Tracks the given set of node keys as a new strongly connected component.
+
+        :param keys: the keys of the nodes of the strongly connected component
+        :return: the identifier of the new strongly connected component
+        """
+        self._scc_id_counter += 1
+        self._scc_members[self._scc_id_counter] = set(keys)
+        for key in keys:
+            self._scc_ids[key] = self._scc_id_counter
+        return self._scc_id_counter
+
     @staticmethod
-    def cycle_search(graph: nx.Graph, path: list) -> Generator:
-        return nx.algorithms.cycles._johnson_cycle_search(graph, path)
+    def cycle_search(graph: nx.Graph, path: list, state: Optional['JohnsonState'] = None) -> Generator:
+        """
+        Enumerates the simple cycles of the given graph that begin with the given path, using the main loop of
+        Johnson's algorithm. The given path is modified during the search.
+
+        If a Johnson state is given, its structures are reused instead of allocating new ones. A state can only
+        be used by one search at a time, and starting a new search with it abandons the previous one.
+
+        :param graph: the graph
+        :param path: a cycle prefix, all the returned cycles begin with this prefix
+        :param state: the reusable working state of the search
+        :return: a generator of the cycles as lists of nodes
+        """
+        if state is None:
+            state = JohnsonState()
+        state.reset()
+
+        blocked = state.blocked
+        blocked.update(path)
+        neighbors = state.neighbors
+        b_lists = state.b_lists
+        dirty = state.dirty
+
+        def nbrs_of(node):
+            node_nbrs = neighbors.get(node)
+            if node_nbrs is None:
+                node_nbrs = neighbors[node] = list(graph[node])
+            return node_nbrs
+
+        start = path[0]
+        stack = [iter(nbrs_of(path[-1]))]
+        closed = [False]
+        while stack:
+            for w in stack[-1]:
+                if w == start:
+                    yield path[:]
+                    closed[-1] = True
+                elif w not in blocked:
+                    path.append(w)
+                    closed.append(False)
+                    stack.append(iter(nbrs_of(w)))
+                    blocked.add(w)
+                    break
+            else:
+                stack.pop()
+                v = path.pop()
+                if closed.pop():
+                    if closed:
+                        closed[-1] = True
+                    unblock_stack = {v}
+                    while unblock_stack:
+                        u = unblock_stack.pop()
+                        if u in blocked:
+                            blocked.remove(u)
+                            b_list = b_lists.get(u)
+                            if b_list:
+                                unblock_stack.update(b_list)
+                                b_list.clear()
+                else:
+                    for w in nbrs_of(v):
+                        b_list = b_lists.get(w)
+                        if b_list is None:
+                            b_list = b_lists[w] = set()
+                        if not b_list:
+                            dirty.append(w)
+                        b_list.add(v)
+
+
+class JohnsonState:
+    """
+    The working state of the main loop of Johnson's cycle search, which can be reused across consecutive searches
+    to avoid allocating its structures for every search.
+    Only the entries touched by the previous search are cleared when a new search starts.
+
+    Attributes
+    ----------
+    blocked : Set[Hashable]
+        the set of nodes currently blocked by the search
+    b_lists : Dict[Hashable, Set[Hashable]]
+        the B-lists of the search, mapping each node to the blocked nodes to release when the node is unblocked
+    dirty : List[Hashable]
+        the nodes whose B-list has been filled since the last reset
+    neighbors : Dict[Hashable, List[Hashable]]
+        the neighborhoods of the nodes visited by the current search
+    """
+    __slots__ = ('blocked', 'b_lists', 'dirty', 'neighbors')
+
+    blocked: Set[Hashable]
+    b_lists: Dict[Hashable, Set[Hashable]]
+    dirty: List[Hashable]
+    neighbors: Dict[Hashable, List[Hashable]]
+
+    def __init__(self):
+        self.blocked = set()
+        self.b_lists = dict()
+        self.dirty = []
+        self.neighbors = dict()
+
+    def reset(self):
+        """
+        Clears the state left by the previous search.
+        """
+        self.blocked.clear()
+        for node in self.dirty:
+            self.b_lists[node].clear()
+        self.dirty.clear()
+        self.neighbors.clear()
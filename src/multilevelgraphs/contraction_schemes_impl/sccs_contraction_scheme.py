@@ -43,10 +43,11 @@ class SCCsContractionScheme(EdgeBasedContractionScheme):
                                      self._c_set_attr_function)
 
     def contraction_function(self, dec_graph: DecGraph) -> CompTable:
-        sccs = strongly_connected_components(dec_graph)
-        return CompTable([ComponentSet(self._get_component_set_id(),
-                                       set(scc),
-                                       **(self._c_set_attr_function(set(scc)))) for scc in sccs])
+        new_id = self._get_component_set_id
+        attr_function = self._c_set_attr_function
+        # Each component is copied into a mutable set once, and the same set is given to the attribute function
+        scc_sets = map(set, strongly_connected_components(dec_graph))
+        return CompTable([ComponentSet(new_id(), scc_set, **(attr_function(scc_set))) for scc_set in scc_sets])
 
     def _update_added_edge(self, edge: Superedge):
         u = edge.tail.supernode
@@ -61,7 +62,7 @@ class SCCsContractionScheme(EdgeBasedContractionScheme):
                 if reach_supernodes:
                     for node in reach_supernodes:
                         self.component_sets_table.remove_set(next(iter(node.component_sets)))
-                    new_set = set.union(*[supernode.dec.nodes() for supernode in reach_supernodes])
+                    new_set = set().union(*(supernode.dec.V.values() for supernode in reach_supernodes))
                     self.component_sets_table.add_set(ComponentSet(self._get_component_set_id(),
                                                                    new_set,
                                                                    **(self._c_set_attr_function(new_set))))
@@ -77,7 +78,7 @@ class SCCsContractionScheme(EdgeBasedContractionScheme):
         :return: the set of supernodes that are both reachable from the start node and can reach the target node
         """
         can_reach_target_table = {target_node.key: True}
-        self._reach_dfs(self.dec_graph.graph(), start_node.key, can_reach_target_table)
+        self._reach_dfs(self.dec_graph.graph(ref=True), start_node.key, can_reach_target_table)
         return {self.dec_graph.V[node_key] for node_key, can_reach in can_reach_target_table.items() if can_reach}
 
     def _reach_dfs(self, graph: nx.DiGraph, u: Any, can_reach_target_table: Dict[Supernode, bool]):
@@ -96,8 +97,9 @@ class SCCsContractionScheme(EdgeBasedContractionScheme):
         else:
             u.remove_edge(edge)
             inner_reachable_nodes = self._reachable_nodes_from(u.dec, edge.tail)
-            if inner_reachable_nodes != u.dec.nodes():
-                h = u.dec.induced_subgraph(u.dec.nodes() - inner_reachable_nodes)
+            # The reachable nodes are a subset of the nodes of the decontraction
+            if len(inner_reachable_nodes) != u.dec.order():
+                h = u.dec.induced_subgraph_from_keys(u.dec.V.keys() - {node.key for node in inner_reachable_nodes})
                 sccs_in_h = strongly_connected_components(h)
 
                 self.component_sets_table.remove_set(next(iter(u.component_sets)))
@@ -105,12 +107,13 @@ class SCCsContractionScheme(EdgeBasedContractionScheme):
                                                                inner_reachable_nodes,
                                                                **(self._c_set_attr_function(inner_reachable_nodes))))
                 for scc in sccs_in_h:
+                    scc_set = set(scc)
                     self.component_sets_table.add_set(ComponentSet(self._get_component_set_id(),
-                                                                   set(scc),
-                                                                   **(self._c_set_attr_function(set(scc)))))
+                                                                   scc_set,
+                                                                   **(self._c_set_attr_function(scc_set))))
                 self._update_graph() # Updates graph structure for furthers updates
 
     @staticmethod
     def _reachable_nodes_from(dec_graph: DecGraph, node: Supernode) -> Set[Supernode]:
-        descendants = nx.descendants(dec_graph.graph(), node.key)
+        descendants = nx.descendants(dec_graph.graph(ref=True), node.key)
         return {dec_graph.V[key] for key in descendants}.union({node})
@@ -1,6 +1,7 @@
 from typing import Callable, Set, Dict, Any, List, Optional, Tuple
 from multilevelgraphs.contraction_schemes import DecontractionEdgeBasedContractionScheme, ComponentSet, CompTable
 from multilevelgraphs.dec_graphs import DecGraph, Supernode, Superedge
+from multilevelgraphs.contraction_schemes_impl.stars_kernels import only_adjacent_keys, adjacent_keys, star_indices
 
 
 class StarsContractionScheme(DecontractionEdgeBasedContractionScheme):
@@ -22,8 +23,12 @@ class StarsContractionScheme(DecontractionEdgeBasedContractionScheme):
     ----------
     _reciprocal : bool
         boolean value that determines how two nodes are considered adjacent in the original graph
+    _adjacency_cache : Dict[Supernode, Tuple[int, Optional[Supernode]]]
+        the adjacency of the supernodes of the complete decontraction already computed during the update procedures,
+        as returned by ``_adjacent_nodes``
     """
     _reciprocal: bool
+    _adjacency_cache: Dict[Supernode, Tuple[int, Optional[Supernode]]]
 
     def __init__(self,
                  supernode_attr_function: Callable[[Supernode], Dict[str, Any]] = None,
@@ -47,6 +52,7 @@ class StarsContractionScheme(DecontractionEdgeBasedContractionScheme):
         """
         super().__init__(supernode_attr_function, superedge_attr_function, c_set_attr_function)
         self._reciprocal = reciprocal
+        self._adjacency_cache = dict()
 
     def contraction_name(self) -> str:
         return "stars_" + ("" if self._reciprocal else "not_") + "rec"
@@ -58,18 +64,15 @@ class StarsContractionScheme(DecontractionEdgeBasedContractionScheme):
                                       self._reciprocal)
 
     def contraction_function(self, dec_graph: DecGraph) -> CompTable:
+        self._adjacency_cache.clear()
+        new_id = self._get_component_set_id
+        attr_function = self._c_set_attr_function
         stars = self._star_sets(dec_graph)
-        comp_table = CompTable([ComponentSet(self._get_component_set_id(),
-                                             star,
-                                             **(self._c_set_attr_function(star))) for star in stars])
+        comp_table = CompTable([ComponentSet(new_id(), star, **(attr_function(star))) for star in stars])
 
-        for node in dec_graph.V.values():
-            if node not in comp_table:
-                comp_table.add_set(ComponentSet(self._get_component_set_id(),
-                                                {node},
-                                                **(self._c_set_attr_function({node}))))
+        comp_table.add_sets([self._singleton_c_set(node) for node in dec_graph.V.values() if node not in comp_table])
 
-        comp_table.modified.clear()
+        comp_table.clear_modified()
 
         return comp_table
 
@@ -83,41 +86,101 @@ class StarsContractionScheme(DecontractionEdgeBasedContractionScheme):
         :param dec_graph: the decontracted graph
         :return: the list of star sets
         """
-        # Dictionary mapping supernodes at the center of a star with their corresponding star set
-        star_dict: Dict[Supernode, Set[Supernode]] = dict()
-        for supernode in dec_graph.V.values():
-            _, adj_node = self._adjacent_nodes(supernode, dec_graph)
-            if adj_node is not None and supernode not in star_dict:
-                star_dict.setdefault(adj_node, {adj_node}).add(supernode)
-
-        return list(star_dict.values())
+        nodes = list(dec_graph.V.values())
+        only_adjacent = only_adjacent_keys(dec_graph.E, self._reciprocal)
+        return [{nodes[i] for i in star} for star in star_indices(list(dec_graph.V), only_adjacent)]
 
     def _adjacent_nodes(self, supernode: Supernode, dec_graph: DecGraph) -> Tuple[int, Optional[Supernode]]:
         """
         Returns the number of adjacent supernodes of the given supernode in the given decontracted graph according to
-        the reciprocal parameter of this scheme, along with the only adjacent supernode as the second return value,
-        if such supernode exists.
+        the reciprocal parameter of this scheme, up to two, along with the only adjacent supernode as the second
+        return value, if such supernode exists.
         If more than one or no nodes are adjacent to the given supernode, None is returned as second return value.
+        Since the update procedures only need to distinguish between no, one and more adjacent supernodes, a count of
+        two stands for two or more adjacent supernodes, and the neighbors are not scanned further.
+
+        Neighbors are read from the adjacency of the given graph rather than from its compact adjacency, which would
+        be rebuilt after each change of the graph during the update procedures.
 
         :param supernode: the supernode
         :param dec_graph: the decontracted graph
-        :return: the number of adjacent nodes and the only adjacent supernode, if any
+        :return: the number of adjacent nodes, up to two, and the only adjacent supernode, if any
         """
-        adj_nodes = ({e.tail for e in dec_graph.in_edges(supernode)} &
-                     {e.head for e in dec_graph.out_edges(supernode)}) \
-            if self._reciprocal else \
-            ({e.tail for e in dec_graph.in_edges(supernode)} |
-             {e.head for e in dec_graph.out_edges(supernode)})
+        graph = dec_graph.graph(ref=True)
+        count, only_key = adjacent_keys(graph.pred[supernode.key], graph.succ[supernode.key], self._reciprocal)
+        return (1, dec_graph.V[only_key]) if count == 1 else (count, None)
 
-        return len(adj_nodes), adj_nodes.pop() if len(adj_nodes) == 1 else None
+    def _decontraction_adjacency(self, supernode: Supernode) -> Tuple[int, Optional[Supernode]]:
+        """
+        Returns the result of ``_adjacent_nodes`` for the given supernode in the complete decontraction of the graph
+        of this scheme, computing it only if it is not cached.
+        Since the adjacency of a supernode only depends on its incident edges, the update procedures only
+        invalidate the cached adjacency of the endpoints of the updated edges.
+
+        :param supernode: the supernode
+        :return: the number of adjacent nodes and the only adjacent supernode, if any
+        """
+        adjacency = self._adjacency_cache.get(supernode)
+        if adjacency is None:
+            adjacency = self._adjacency_cache[supernode] = self._adjacent_nodes(supernode, self._decontracted_graph)
+        return adjacency
+
+    def _update_cached_adjacency(self,
+                                 node: Supernode,
+                                 other: Supernode,
+                                 prev_adjacency: Tuple[int, Optional[Supernode]],
+                                 added: bool):
+        """
+        Updates the cached adjacency of the given node in the complete decontraction of the graph of this scheme,
+        after an edge between the given node and the other given node has been added or removed.
+        The adjacency is derived from the previous one without scanning the neighbors of the node, except when a
+        removal breaks the adjacency of a node with two or more adjacent nodes, whose count cannot be decremented
+        since it is capped at two.
+
+        :param node: the endpoint of the edge whose adjacency is updated
+        :param other: the other endpoint of the edge
+        :param prev_adjacency: the adjacency of the node before the change
+        :param added: True if the edge has been added, False if it has been removed
+        """
+        edges = self._decontracted_graph.E
+        forward, backward = (node.key, other.key) in edges, (other.key, node.key) in edges
+        adjacent_now = (forward and backward) if self._reciprocal else (forward or backward)
+
+        count, only = prev_adjacency
+        if added and adjacent_now:
+            # Before the addition, two distinct nodes were adjacent only if they were not required to be reciprocal
+            # and the edge in the other direction was already there
+            adjacent_before = not self._reciprocal and node != other and forward and backward
+            if not adjacent_before:
+                count, only = (1, other) if count == 0 else (2, None)
+        elif not added and not adjacent_now:
+            # Before the removal, the nodes were adjacent unless they were required to be reciprocal and the edge in
+            # the other direction was missing
+            adjacent_before = not self._reciprocal or node == other or forward or backward
+            if adjacent_before:
+                if count != 1:
+                    self._adjacency_cache.pop(node, None)
+                    return
+                count, only = 0, None
+
+        self._adjacency_cache[node] = (count, only)
+
+    def _update_added_node(self, node: Supernode):
+        super()._update_added_node(node)
+        self._adjacency_cache.pop(node, None)
+
+    def _update_removed_node(self, node: Supernode):
+        super()._update_removed_node(node)
+        self._adjacency_cache.pop(node, None)
 
     def _update_added_edge(self, edge: Superedge):
         self.set_decontracted_graph()
 
+        adjacency = self._decontraction_adjacency
         a, b = edge.tail, edge.head
         prev_adj = dict()
-        prev_adj[a] = self._adjacent_nodes(a, self._decontracted_graph)
-        prev_adj[b] = self._adjacent_nodes(b, self._decontracted_graph)
+        prev_adj[a] = adjacency(a)
+        prev_adj[b] = adjacency(b)
 
         if a.supernode == b.supernode:
             a.supernode.add_edge(edge)
@@ -125,47 +188,31 @@ class StarsContractionScheme(DecontractionEdgeBasedContractionScheme):
             self._add_edge_in_superedge(a.supernode.key, b.supernode.key, edge)
 
         self._add_edge_to_decontraction(edge)
+        self._update_cached_adjacency(a, b, prev_adj[a], added=True)
+        if a != b:
+            self._update_cached_adjacency(b, a, prev_adj[b], added=True)
         current_adj = dict()
-        current_adj[a] = self._adjacent_nodes(a, self._decontracted_graph)
-        current_adj[b] = self._adjacent_nodes(b, self._decontracted_graph)
+        current_adj[a] = adjacency(a)
+        current_adj[b] = adjacency(b)
+        self._add_only_adjacent_nodes(prev_adj, current_adj)
 
         # Nodes are ordered by the number of adjacent nodes in the decontracted graph in descending order
         if prev_adj[a][0] < prev_adj[b][0]:
              a, b = b, a
 
-        for node in [a, b]:
-            if prev_adj[node][0] == 1 and current_adj[node][0] != 1:
-                # If the node was not part of a two-nodes star
-                if self._adjacent_nodes(prev_adj[node][1], self._decontracted_graph)[0] != 1:
-                    set_to_split = next(iter(self.component_sets_table[node]))
-                    self.component_sets_table.remove_set(set_to_split)
-                    self.component_sets_table.add_set(ComponentSet(self._get_component_set_id(),
-                                                                   {node},
-                                                                   **(self._c_set_attr_function({node}))))
-                    self.component_sets_table.add_set(ComponentSet(self._get_component_set_id(),
-                                                                   set_to_split - {node},
-                                                                   **(self._c_set_attr_function(set_to_split - {node})))
-                                                      )
-
-            elif prev_adj[node][0] == 0 and current_adj[node][0] != 0:
-                singleton_set = next(iter(self.component_sets_table[node]))
-                self.component_sets_table.remove_set(singleton_set)
-                other_node = b if node == a else a
-                other_set = next(iter(self.component_sets_table[other_node]))
-                self.component_sets_table.remove_set(other_set)
-                self.component_sets_table.add_set(ComponentSet(self._get_component_set_id(),
-                                                               other_set | {node},
-                                                               **(self._c_set_attr_function(other_set | {node})))
-                                                  )
+        for node, other in ((a, b), (b, a)):
+            transition = self._ADDED_EDGE_TRANSITIONS.get((prev_adj[node][0], current_adj[node][0]))
+            if transition is not None and transition(self, node, other, prev_adj, current_adj):
                 break
 
     def _update_removed_edge(self, edge: Superedge):
         self.set_decontracted_graph()
 
+        adjacency = self._decontraction_adjacency
         a, b = edge.tail, edge.head
         prev_adj = dict()
-        prev_adj[a] = self._adjacent_nodes(a, self._decontracted_graph)
-        prev_adj[b] = self._adjacent_nodes(b, self._decontracted_graph)
+        prev_adj[a] = adjacency(a)
+        prev_adj[b] = adjacency(b)
 
         if a.supernode == b.supernode:
             a.supernode.remove_edge(edge)
@@ -173,37 +220,97 @@ class StarsContractionScheme(DecontractionEdgeBasedContractionScheme):
             self._remove_edge_in_superedge(a.supernode.key, b.supernode.key, edge)
 
         self._remove_edge_from_decontraction(edge)
+        self._update_cached_adjacency(a, b, prev_adj[a], added=False)
+        if a != b:
+            self._update_cached_adjacency(b, a, prev_adj[b], added=False)
         current_adj = dict()
-        current_adj[a] = self._adjacent_nodes(a, self._decontracted_graph)
-        current_adj[b] = self._adjacent_nodes(b, self._decontracted_graph)
+        current_adj[a] = adjacency(a)
+        current_adj[b] = adjacency(b)
+        self._add_only_adjacent_nodes(current_adj, current_adj)
 
         # Nodes are ordered by the number of adjacent nodes in the decontracted graph in ascending order
         if prev_adj[a][0] > prev_adj[b][0]:
             a, b = b, a
 
-        for node in [a, b]:
-            if prev_adj[node][0] > 1 and current_adj[node][0] == 1:
-                # If the node is now not part of a two-nodes star
-                if self._adjacent_nodes(current_adj[node][1], self._decontracted_graph)[0] != 1:
-                    singleton_set = next(iter(self.component_sets_table[node]))
-                    self.component_sets_table.remove_set(singleton_set)
-                    adj_node_set = next(iter(self.component_sets_table[current_adj[node][1]]))
-                    self.component_sets_table.remove_set(adj_node_set)
-                    self.component_sets_table.add_set(ComponentSet(self._get_component_set_id(),
-                                                                   adj_node_set | {node},
-                                                                   **(self._c_set_attr_function(adj_node_set | {node})))
-                                                      )
-
-            elif prev_adj[node][0] == 1 and current_adj[node][0] == 0:
-                set_to_split = next(iter(self.component_sets_table[node]))
-                self.component_sets_table.remove_set(set_to_split)
-                self.component_sets_table.add_set(ComponentSet(self._get_component_set_id(),
-                                                               {node},
-                                                               **(self._c_set_attr_function({node}))))
-                self.component_sets_table.add_set(ComponentSet(self._get_component_set_id(),
-                                                               set_to_split - {node},
-                                                               **(self._c_set_attr_function(set_to_split - {node})))
-                                                  )
-                other_node = b if node == a else a
-                if prev_adj[other_node][0] == 1 and current_adj[other_node][0] == 0:
-                    break
+        for node, other in ((a, b), (b, a)):
+            transition = self._REMOVED_EDGE_TRANSITIONS.get((prev_adj[node][0], current_adj[node][0]))
+            if transition is not None and transition(self, node, other, prev_adj, current_adj):
+                break
+
+    def _add_only_adjacent_nodes(self,
+                                 endpoints_adj: Dict[Supernode, Tuple[int, Optional[Supernode]]],
+                                 current_adj: Dict[Supernode, Tuple[int, Optional[Supernode]]]):
+        """
+        Adds to the given current adjacency of the endpoints of an updated edge the current adjacency of the only
+        adjacent node of each endpoint having exactly one adjacent node in the given endpoints adjacency.
+        This way, the transition handlers can tell whether an endpoint is or was part of a two-nodes star from the
+        adjacency already gathered for the update, without querying the adjacency of the other node of the star.
+
+        :param endpoints_adj: the adjacency of the endpoints whose only adjacent nodes are added
+        :param current_adj: the current adjacency of the endpoints, extended in place
+        """
+        for adjacency_count, adj_node in list(endpoints_adj.values()):
+            if adjacency_count == 1 and adj_node not in current_adj:
+                current_adj[adj_node] = self._decontraction_adjacency(adj_node)
+
+    # The transitions of an endpoint of an updated edge are identified by its number of adjacent nodes, up to two,
+    # before and after the update. Each transition handler receives the endpoint, the other endpoint and the
+    # adjacency of both endpoints before and after the update, where the current adjacency also holds the one of
+    # their only adjacent nodes, and returns True if the other endpoint must not be handled.
+
+    def _lost_only_adjacent(self, node: Supernode, other: Supernode,
+                            prev_adj: Dict[Supernode, Tuple[int, Optional[Supernode]]],
+                            current_adj: Dict[Supernode, Tuple[int, Optional[Supernode]]]) -> bool:
+        # If the node was not part of a two-nodes star
+        if current_adj[prev_adj[node][1]][0] != 1:
+            self._leave_star(node)
+        return False
+
+    def _found_first_adjacent(self, node: Supernode, other: Supernode,
+                              prev_adj: Dict[Supernode, Tuple[int, Optional[Supernode]]],
+                              current_adj: Dict[Supernode, Tuple[int, Optional[Supernode]]]) -> bool:
+        self._join_star(node, other)
+        return True
+
+    def _left_with_only_adjacent(self, node: Supernode, other: Supernode,
+                                 prev_adj: Dict[Supernode, Tuple[int, Optional[Supernode]]],
+                                 current_adj: Dict[Supernode, Tuple[int, Optional[Supernode]]]) -> bool:
+        # If the node is now not part of a two-nodes star
+        if current_adj[current_adj[node][1]][0] != 1:
+            self._join_star(node, current_adj[node][1])
+        return False
+
+    def _lost_last_adjacent(self, node: Supernode, other: Supernode,
+                            prev_adj: Dict[Supernode, Tuple[int, Optional[Supernode]]],
+                            current_adj: Dict[Supernode, Tuple[int, Optional[Supernode]]]) -> bool:
+        self._leave_star(node)
+        # The two nodes of a dissolved two-nodes star are both moved by leaving the star once
+        return prev_adj[other][0] == 1 and current_adj[other][0] == 0
+
+    _ADDED_EDGE_TRANSITIONS = {(1, 0): _lost_only_adjacent, (1, 2): _lost_only_adjacent,
+                               (0, 1): _found_first_adjacent, (0, 2): _found_first_adjacent}
+    _REMOVED_EDGE_TRANSITIONS = {(2, 1): _left_with_only_adjacent, (1, 0): _lost_last_adjacent}
+
+    def _join_star(self, node: Supernode, adj_node: Supernode):
+        """
+        Moves the given node from its singleton component set to the component set of the given adjacent node.
+        The component set of the adjacent node is extended in place, so that only the row of the given node is
+        modified in the component sets table.
+
+        :param node: the node joining the star
+        :param adj_node: the adjacent node in the star
+        """
+        table = self.component_sets_table
+        table.merge_sets(table.only_set(node), table.only_set(adj_node))
+
+    def _leave_star(self, node: Supernode):
+        """
+        Moves the given node from its star to a new singleton component set.
+        The component set of the star is reduced in place, so that only the row of the given node is modified in the
+        component sets table.
+
+        :param node: the node leaving the star
+        """
+        table = self.component_sets_table
+        table.remove_from_set(table.only_set(node), node)
+        table.add_set(self._singleton_c_set(node))
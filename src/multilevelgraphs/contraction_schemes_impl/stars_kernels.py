@@ -0,0 +1,122 @@
+from typing import Any, Dict, List, Mapping, Tuple
+
+# The functions of this module are the inner loops of the stars contraction scheme.
+# They only work on plain keys, indices and dictionaries, with type annotations on all their parameters, so that the
+# module can optionally be compiled to a C extension with mypyc (see setup.py). When it is not compiled, the same
+# module is imported as pure Python.
+
+
+def only_adjacent_keys(edges: Dict[Any, Any], reciprocal: bool) -> Dict[Any, Any]:
+    """
+    Returns the key of the only adjacent node of each node having exactly one adjacent node in the graph with the
+    given edges, indexed by the key of the node.
+    If reciprocal is True, two nodes are adjacent if there is an edge between them in both directions, otherwise
+    they are adjacent if there is an edge between them in at least one direction.
+    The adjacent nodes of all the nodes are found with a single sweep over the edges, where a node is discarded as
+    soon as a second adjacent node is found for it.
+
+    :param edges: a dictionary whose keys are the (tail key, head key) pairs of the edges of the graph
+    :param reciprocal: if True, two nodes are adjacent only if there is an edge between them in both directions
+    :return: the dictionary of the keys of the only adjacent nodes
+    """
+    # Nodes with more than one adjacent node are mapped to a marker, so that each endpoint of an edge is handled
+    # with a single dictionary lookup
+    many_adjacent = object()
+    adjacent: Dict[Any, Any] = dict()
+
+    for tail_key, head_key in edges:
+        if reciprocal:
+            # The reverse edge, if any, accounts for the adjacency of the head
+            if (head_key, tail_key) not in edges:
+                continue
+        else:
+            previous = adjacent.setdefault(head_key, tail_key)
+            if previous is not many_adjacent and previous != tail_key:
+                adjacent[head_key] = many_adjacent
+        previous = adjacent.setdefault(tail_key, head_key)
+        if previous is not many_adjacent and previous != head_key:
+            adjacent[tail_key] = many_adjacent
+
+    return {key: adjacent_key for key, adjacent_key in adjacent.items() if adjacent_key is not many_adjacent}
+
+
+def adjacent_keys(predecessors: Mapping[Any, Any], successors: Mapping[Any, Any], reciprocal: bool) -> Tuple[int, Any]:
+    """
+    Returns the number of adjacent nodes of a node with the given predecessors and successors, up to two, along with
+    the key of the only adjacent node as the second return value, if such node exists, or None otherwise.
+    If reciprocal is True, only nodes that are both predecessors and successors are adjacent.
+    Since a count of two stands for two or more adjacent nodes, the neighbors are not scanned further.
+
+    :param predecessors: the adjacency of the node by its predecessors keys
+    :param successors: the adjacency of the node by its successors keys
+    :param reciprocal: if True, two nodes are adjacent only if there is an edge between them in both directions
+    :return: the number of adjacent nodes, up to two, and the key of the only adjacent node, if any
+    """
+    count = 0
+    only_key = None
+    if reciprocal:
+        if len(predecessors) > len(successors):
+            predecessors, successors = successors, predecessors
+        for key in predecessors:
+            if key in successors:
+                if count:
+                    return 2, None
+                count, only_key = 1, key
+    else:
+        for key in predecessors:
+            if count:
+                return 2, None
+            count, only_key = 1, key
+        for key in successors:
+            if key not in predecessors:
+                if count:
+                    return 2, None
+                count, only_key = 1, key
+
+    return count, only_key
+
+
+def star_indices(keys: List[Any], only_adjacent: Dict[Any, Any]) -> List[List[int]]:
+    """
+    Returns the stars of the nodes with the given keys as lists of their indices in the given list of keys.
+    Each node with only one adjacent node is joined to it in a disjoint-set forest over the node indices. Since the
+    center of a star can only have one adjacent node in a star of two nodes, the resulting disjoint sets are exactly
+    the stars.
+    The stars are returned in the order of their first non-root node, each listing its non-root nodes in order and
+    then its root. Nodes that are not part of any star are not returned.
+
+    :param keys: the keys of the nodes
+    :param only_adjacent: the key of the only adjacent node of each node having exactly one adjacent node
+    :return: the list of stars as lists of node indices
+    """
+    index: Dict[Any, int] = {key: i for i, key in enumerate(keys)}
+    parent: List[int] = list(range(len(keys)))
+    for i, key in enumerate(keys):
+        if key in only_adjacent:
+            root_i, root_j = _find(parent, i), _find(parent, index[only_adjacent[key]])
+            if root_i != root_j:
+                parent[root_i] = root_j
+
+    stars: Dict[int, List[int]] = dict()
+    for i in range(len(keys)):
+        root = _find(parent, i)
+        if root != i:
+            stars.setdefault(root, []).append(i)
+    for root, star in stars.items():
+        star.append(root)
+
+    return list(stars.values())
+
+
+def _find(parent: List[int], i: int) -> int:
+    """
+    Returns the root of the given index in the given disjoint-set forest, halving the path to the root.
+
+    :param parent: the parent index of each index of the forest
+    :param i: the index
+    :return: the root of the index
+    """
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
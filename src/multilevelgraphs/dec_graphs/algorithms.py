@@ -1,7 +1,16 @@
 import networkx as nx
-from typing import Set, FrozenSet, Tuple, Generator
+from concurrent.futures import ProcessPoolExecutor
+from typing import Set, FrozenSet, Tuple, Generator, Optional, List, Hashable
 from multilevelgraphs.dec_graphs import DecGraph, Supernode
 
+try:
+    import rustworkx as rx
+except ImportError:
+    rx = None  # The rustworkx backend is optional, and NetworkX is used when it is not installed
+
+NETWORKX = 'networkx'
+RUSTWORKX = 'rustworkx'
+
 
 def maximal_cliques(dec_graph: DecGraph, reciprocal: bool = False) -> Generator[Set[Supernode], None, None]:
     """
@@ -14,6 +23,9 @@ def maximal_cliques(dec_graph: DecGraph, reciprocal: bool = False) -> Generator[
     version of Bron-Kerbosch algorithm (1973) [1]_, as adapted by Tomita, Tanaka and Takahashi (2006) [2]_
     and discussed in Cazals and Karande (2008) [3]_.
 
+    The cliques are computed the first time they are requested and are reused until the structure of the given
+    decontractible graph changes.
+
     Parameters
     ----------
     dec_graph : DecGraph
@@ -38,12 +50,29 @@ def maximal_cliques(dec_graph: DecGraph, reciprocal: bool = False) -> Generator[
 
     .. [3] Cazals, F. and Karande, C. "A note on the problem of reporting maximal cliques", Theoretical Computer Science, Volume 407, Issues 1–3, 6 November 2008, Pages 564–568, <https://doi.org/10.1016/j.tcs.2008.05.010 >
     """
-    undirected_graph = dec_graph.graph().to_undirected(reciprocal=reciprocal)
-    cliques = nx.find_cliques(undirected_graph)
-    yield from map(lambda c: set(map(lambda n: dec_graph.V[n], c)), cliques)
+    # The cliques are cached as tuples, and each of them is returned as a new set that callers are free to modify
+    for clique in dec_graph.cached_result(('maximal_cliques', reciprocal),
+                                          lambda graph: _maximal_cliques(graph, reciprocal)):
+        yield set(clique)
+
+
+def _maximal_cliques(dec_graph: DecGraph, reciprocal: bool) -> List[Tuple[Supernode, ...]]:
+    """
+    Returns the list of maximal cliques in the given decontractible graph as tuples of supernodes.
+
+    :param dec_graph: the decontractible graph
+    :param reciprocal: if True, only edges that appear in both directions are considered
+    :return: the list of maximal cliques
+    """
+    # The cached undirected version of the graph is only read by the clique search
+    undirected_graph = dec_graph.undirected_graph(reciprocal=reciprocal)
+    get_supernode = dec_graph.V.__getitem__
+    return [tuple(map(get_supernode, clique)) for clique in nx.find_cliques(undirected_graph)]
 
 
-def simple_cycles(dec_graph: DecGraph) -> Generator[Tuple[Supernode, ...], None, None]:
+def simple_cycles(dec_graph: DecGraph,
+                  workers: Optional[int] = None,
+                  backend: str = NETWORKX) -> Generator[Tuple[Supernode, ...], None, None]:
     """
     Enumerates all the simple cycles in the given decontractible graph as a set of list of supernodes.
     A simple cycle, or elementary circuit, is a closed path where no node appears twice.
@@ -54,10 +83,24 @@ def simple_cycles(dec_graph: DecGraph) -> Generator[Tuple[Supernode, ...], None,
     iterator/generator version of Johnson's algorithm [4]_, enhanced by some well-known preprocessing techniques
     that restrict the attention to strongly connected components of the graph.
 
+    Since the simple cycles of distinct strongly connected components are independent, the enumeration can be
+    distributed over a pool of worker processes, one non-trivial component at a time. In this case, self-loops are
+    returned first, and the cycles of each component are returned as soon as its enumeration is completed, in the
+    order of the components.
+
+    If the rustworkx backend is selected and the rustworkx library is installed, the cycles are found by its native
+    implementation of Johnson's algorithm instead, and the workers parameter is ignored.
+    If rustworkx is not installed, the NetworkX implementation is used.
+
     Parameters
     ----------
     dec_graph : DecGraph
         The decontractible graph.
+    workers : Optional[int]
+        The number of worker processes used to enumerate the simple cycles of distinct strongly connected components
+        in parallel. If None or lower than 2, the cycles are enumerated in the calling process.
+    backend : str
+        The library used to enumerate the cycles, either 'networkx' (default) or 'rustworkx'.
 
     Returns
     -------
@@ -71,11 +114,51 @@ def simple_cycles(dec_graph: DecGraph) -> Generator[Tuple[Supernode, ...], None,
 
     .. [4] Johnson D. B. , "Finding all the elementary circuits of a directed graph," SIAM Journal on Computing, vol. 4, no. 1, pp. 77-84, 1975. https://doi.org/10.1137/0204007
     """
-    cycles = nx.simple_cycles(dec_graph.graph())
-    yield from map(lambda c: tuple(map(lambda n: dec_graph.V[n], c)), cycles)
+    get_supernode = dec_graph.V.__getitem__
+    # The search does not modify the graph, so the internal graph is used instead of a copy
+    graph = dec_graph.graph(ref=True)
+    if _use_rustworkx(backend):
+        for key in nx.nodes_with_selfloops(graph):
+            yield (get_supernode(key),)
+        rx_graph, nodes = _rustworkx_graph(dec_graph)
+        for cycle in rx.simple_cycles(rx_graph):
+            yield tuple(map(nodes.__getitem__, cycle))
+        return
+
+    if workers is None or workers < 2:
+        for cycle in nx.simple_cycles(graph):
+            yield tuple(map(get_supernode, cycle))
+        return
+
+    for key in nx.nodes_with_selfloops(graph):
+        yield (get_supernode(key),)
+
+    scc_graphs = []
+    for scc in nx.strongly_connected_components(graph):
+        if len(scc) > 1:
+            scc_graph = graph.subgraph(scc).copy()
+            scc_graph.remove_edges_from(list(nx.selfloop_edges(scc_graph)))
+            scc_graphs.append(scc_graph)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for cycles in executor.map(_scc_simple_cycles, scc_graphs):
+            for cycle in cycles:
+                yield tuple(map(get_supernode, cycle))
+
+
+def _scc_simple_cycles(scc_graph: nx.DiGraph) -> List[List[Hashable]]:
+    """
+    Returns all the simple cycles of the given graph, which is expected to be strongly connected.
+    Defined at module level so that it can be sent to worker processes.
 
+    :param scc_graph: the graph induced by a strongly connected component
+    :return: the list of simple cycles as lists of node keys
+    """
+    return list(nx.simple_cycles(scc_graph))
 
-def strongly_connected_components(dec_graph: DecGraph) -> Generator[FrozenSet[Supernode], None, None]:
+
+def strongly_connected_components(dec_graph: DecGraph,
+                                  backend: str = NETWORKX) -> Generator[FrozenSet[Supernode], None, None]:
     """
     Enumerates all the strongly connected components in the given decontractible graph as a set of sets of supernodes.
     A strongly connected component (SCC) of a decontractible (directed) graph is a maximal subgraph in which
@@ -83,11 +166,19 @@ def strongly_connected_components(dec_graph: DecGraph) -> Generator[FrozenSet[Su
 
     The implementation is based on the NetworkX library. More precisely, the SCCs are found using the
     Kosaraju's algorithm [5]_.
+    The SCCs are computed the first time they are requested and are reused until the structure of the given
+    decontractible graph changes.
+
+    If the rustworkx backend is selected and the rustworkx library is installed, the SCCs are found by its native
+    implementation instead.
+    If rustworkx is not installed, the NetworkX implementation is used.
 
     Parameters
     ----------
     dec_graph : DecGraph
         the decontractible graph
+    backend : str
+        the library used to find the SCCs, either 'networkx' (default) or 'rustworkx'
 
     Returns
     -------
@@ -101,5 +192,56 @@ def strongly_connected_components(dec_graph: DecGraph) -> Generator[FrozenSet[Su
 
     .. [5] Sharir M. , "A strong-connectivity algorithm and its applications in data flow analysis", Computers & Mathematics with Applications, 1981 - Elsevier. https://doi.org/10.1016/0898-1221(81)90008-0
     """
-    sccs = nx.kosaraju_strongly_connected_components(dec_graph.graph())
-    yield from map(lambda c: frozenset(map(lambda n: dec_graph.V[n], c)), sccs)
+    use_rustworkx = _use_rustworkx(backend)
+    yield from dec_graph.cached_result(('strongly_connected_components', use_rustworkx),
+                                       lambda graph: _strongly_connected_components(graph, use_rustworkx))
+
+
+def _strongly_connected_components(dec_graph: DecGraph, use_rustworkx: bool) -> List[FrozenSet[Supernode]]:
+    """
+    Returns the list of strongly connected components in the given decontractible graph as sets of supernodes.
+
+    :param dec_graph: the decontractible graph
+    :param use_rustworkx: if True, the components are found by the rustworkx implementation
+    :return: the list of strongly connected components
+    """
+    if use_rustworkx:
+        rx_graph, nodes = _rustworkx_graph(dec_graph)
+        return [frozenset(map(nodes.__getitem__, scc)) for scc in rx.strongly_connected_components(rx_graph)]
+
+    # The search does not modify the graph, so the internal graph is used instead of a copy
+    get_supernode = dec_graph.V.__getitem__
+    return [frozenset(map(get_supernode, scc))
+            for scc in nx.kosaraju_strongly_connected_components(dec_graph.graph(ref=True))]
+
+
+def _use_rustworkx(backend: str) -> bool:
+    """
+    Returns True if the given backend is rustworkx and the rustworkx library is installed, False if the NetworkX
+    implementation must be used.
+    If the given backend is not supported, rises a ValueError.
+
+    :param backend: the name of the backend
+    :return: True if the rustworkx implementation must be used, False otherwise
+    """
+    if backend not in (NETWORKX, RUSTWORKX):
+        raise ValueError(f"Unsupported backend '{backend}', expected '{NETWORKX}' or '{RUSTWORKX}'.")
+    return backend == RUSTWORKX and rx is not None
+
+
+def _rustworkx_graph(dec_graph: DecGraph) -> Tuple['rx.PyDiGraph', List[Supernode]]:
+    """
+    Returns a rustworkx directed graph with the same structure as the given decontractible graph, without its
+    self-loops, along with the supernodes indexed by the indices of the corresponding nodes of the rustworkx graph.
+    The graph is built from the compact adjacency of the decontractible graph, so the dense indices of its nodes are
+    the same ids of the compact adjacency.
+
+    :param dec_graph: the decontractible graph
+    :return: the rustworkx graph and the supernodes indexed by node index
+    """
+    adjacency = dec_graph.compact_adjacency()
+    rx_graph = rx.PyDiGraph(multigraph=False)
+    rx_graph.add_nodes_from(range(len(adjacency.nodes)))
+    rx_graph.add_edges_from_no_data([(i, j) for i in range(len(adjacency.nodes))
+                                     for j in adjacency.successors(i) if i != j])
+    return rx_graph, adjacency.nodes
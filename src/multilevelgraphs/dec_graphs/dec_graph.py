@@ -1,5 +1,7 @@
-from typing import Optional, Set, Dict, Any, Iterable, FrozenSet
+from array import array
+from typing import Optional, Set, Dict, Any, Iterable, FrozenSet, List, Hashable, Callable
 import networkx as nx
+from multilevelgraphs.dec_graphs.dec_graph_kernels import decontraction_dicts, decontraction_nodes
 
 
 class DecGraph:
@@ -83,27 +85,45 @@ class DecGraph:
     directly included, so a supernode with key 1 can host a supernode with key 1 in its decontraction.
 
     """
+    __slots__ = ('V', 'E', '_graph', '_compact_adjacency', '_undirected_graphs', '_results')
+
     V: Dict[Any, 'Supernode']
     E: Dict[Any, 'Superedge']
     _graph: nx.DiGraph
+    _compact_adjacency: Optional['CompactAdjacency']
+    _undirected_graphs: Optional[Dict[bool, nx.Graph]]
+    _results: Optional[Dict[Hashable, Any]]
 
-    def __init__(self, dict_V: Dict[Any, 'Supernode'] = None, dict_E: Dict[Any, 'Superedge'] = None):
+    def __init__(self, dict_V: Dict[Any, 'Supernode'] = None, dict_E: Dict[Any, 'Superedge'] = None,
+                 copy: bool = True):
         """
         Initializes a decontractible graph with the given supernodes and superedges described by V and E
         dictionaries, that map the keys of supernodes and superedges to the corresponding objects.
-        A shallow copy of the given dictionaries is made, so changes in the original dictionaries will not affect
-        the decontractible graph.
+        By default, a shallow copy of the given dictionaries is made, so changes in the original dictionaries will
+        not affect the decontractible graph.
+        If copy is False, the given dictionaries are used directly by the decontractible graph, so they must not be
+        modified afterward other than through the decontractible graph.
 
         If no supernodes and superedges are given, an empty decontractible graph is created.
 
         :param dict_V: the dictionary of supernodes
         :param dict_E: the dictionary of superedges
+        :param copy: if True, the given dictionaries are copied
         """
         self._graph = nx.DiGraph()
-        self.V = dict(dict_V) if dict_V is not None else dict()
-        self.E = dict(dict_E) if dict_E is not None else dict()
+        if dict_V is None:
+            self.V = dict()
+        else:
+            self.V = dict_V.copy() if copy else dict_V
+        if dict_E is None:
+            self.E = dict()
+        else:
+            self.E = dict_E.copy() if copy else dict_E
         self._graph.add_nodes_from(self.V.keys())
         self._graph.add_edges_from(self.E.keys())
+        self._compact_adjacency = None
+        self._undirected_graphs = None  # Maps the reciprocal flag to the undirected graph, created on first access
+        self._results = None  # Results of the algorithms on the current structure, created on first access
 
     def nodes(self) -> Set['Supernode']:
         """
@@ -137,6 +157,28 @@ class DecGraph:
         """
         return set(self.E.keys())
 
+    def has_node(self, supernode: 'Supernode') -> bool:
+        """
+        Returns True if the given supernode is in the decontractible graph, as a membership test in the set returned
+        by ``nodes`` would, without building such set.
+
+        :param supernode: the supernode to look for
+        :return: True if the supernode is in the decontractible graph
+        """
+        node = self.V.get(supernode.key)
+        return node is not None and hash(node) == hash(supernode)
+
+    def has_edge(self, superedge: 'Superedge') -> bool:
+        """
+        Returns True if the given superedge is in the decontractible graph, as a membership test in the set returned
+        by ``edges`` would, without building such set.
+
+        :param superedge: the superedge to look for
+        :return: True if the superedge is in the decontractible graph
+        """
+        edge = self.E.get((superedge.tail.key, superedge.head.key))
+        return edge is not None and hash(edge) == hash(superedge)
+
     def degree(self, node: 'Supernode') -> int:
         """
         Returns the degree of a supernode in the decontractible graph, which is the number of superedges that have
@@ -145,7 +187,7 @@ class DecGraph:
         :param node: the supernode to get the degree
         :return: the degree of the supernode
         """
-        return self.graph().degree(node.key)
+        return len(self._graph.succ[node.key]) + len(self._graph.pred[node.key])
 
     def forward_star(self, node: 'Supernode') -> Set['Supernode']:
         """
@@ -155,7 +197,7 @@ class DecGraph:
         :param node: the supernode to get the forward star
         :return: the forward star of the supernode
         """
-        return {self.V[key] for key in self.graph().successors(node.key)}
+        return {self.V[key] for key in self._graph.successors(node.key)}
 
     def reverse_star(self, node: 'Supernode') -> Set['Supernode']:
         """
@@ -165,7 +207,7 @@ class DecGraph:
         :param node: the supernode to get the reverse star
         :return: the reverse star of the supernode
         """
-        return {self.V[key] for key in self.graph().predecessors(node.key)}
+        return {self.V[key] for key in self._graph.predecessors(node.key)}
 
     def out_edges(self, node: 'Supernode') -> Set['Superedge']:
         """
@@ -174,7 +216,8 @@ class DecGraph:
         :param node: the supernode to get the out edges
         :return: the set of superedges that have the given supernode as tail
         """
-        return {self.E[(node.key, head.key)] for head in self.forward_star(node)}
+        edges, key = self.E, node.key
+        return {edges[(key, head_key)] for head_key in self._graph.succ[key]}
 
     def in_edges(self, node: 'Supernode') -> Set['Superedge']:
         """
@@ -183,7 +226,8 @@ class DecGraph:
         :param node: the supernode to get the in edges
         :return: the set of superedges that have the given supernode as head
         """
-        return {self.E[(tail.key, node.key)] for tail in self.reverse_star(node)}
+        edges, key = self.E, node.key
+        return {edges[(tail_key, key)] for tail_key in self._graph.pred[key]}
 
     def graph(self, ref: bool = False, attr: bool = False) -> nx.DiGraph:
         """
@@ -203,14 +247,82 @@ class DecGraph:
             return self._graph
         elif attr:
             graph = nx.DiGraph()
-            for n in self.nodes():
+            for n in self.V.values():
                 graph.add_node(n.key, **n.attr)
-            for e in self.edges():
+            for e in self.E.values():
                 graph.add_edge(e.tail.key, e.head.key, **e.attr)
             return graph
         else:
             return nx.DiGraph(self._graph)
 
+    def compact_adjacency(self) -> 'CompactAdjacency':
+        """
+        Returns a compact array-based snapshot of the adjacency of this decontractible graph, where supernodes are
+        mapped to dense integer ids and their forward and reverse stars are stored in CSR (compressed sparse row)
+        format.
+        The snapshot is built on first access and reused until the structure of this decontractible graph changes,
+        so it should be preferred over ``in_edges`` and ``out_edges`` when neighbors are visited repeatedly in a
+        read-only phase.
+
+        :return: the compact adjacency of this decontractible graph
+        """
+        if self._compact_adjacency is None:
+            self._compact_adjacency = CompactAdjacency(self)
+        return self._compact_adjacency
+
+    def undirected_graph(self, reciprocal: bool = False) -> nx.Graph:
+        """
+        Returns the undirected version of this decontractible graph as a simple undirected graph, keeping only edges
+        that appear in both directions if reciprocal is True, or all edges otherwise.
+        The undirected graph is built on first access and reused until the structure of this decontractible graph
+        changes, so it must be treated as read-only; a copy should be made before modifying it.
+
+        :param reciprocal: If True, only edges that appear in both directions are kept in the undirected graph.
+        :return: the corresponding NetworkX undirected graph
+        """
+        if self._undirected_graphs is None:
+            self._undirected_graphs = dict()
+        undirected_graph = self._undirected_graphs.get(reciprocal)
+        if undirected_graph is None:
+            # Edges are added in a single pass over the adjacency of the directed graph, in the same order used by
+            # NetworkX to_undirected, without copying the (empty) attribute dictionaries of nodes and edges
+            succ = self._graph.succ
+            if reciprocal:
+                pred = self._graph.pred
+                edges = ((u, v) for u, nbrs in succ.items() for v in nbrs if v in pred[u])
+            else:
+                edges = ((u, v) for u, nbrs in succ.items() for v in nbrs)
+            undirected_graph = nx.Graph()
+            undirected_graph.add_nodes_from(succ)
+            undirected_graph.add_edges_from(edges)
+            self._undirected_graphs[reciprocal] = undirected_graph
+        return undirected_graph
+
+    def cached_result(self, key: Hashable, function: Callable[['DecGraph'], Any]) -> Any:
+        """
+        Returns the result of the given function applied to this decontractible graph, identified by the given key.
+        The result is computed on first access and reused until the structure of this decontractible graph changes,
+        so the function must only depend on the structure of the graph and its result must be treated as read-only.
+
+        :param key: the key identifying the function and its parameters
+        :param function: the function computing the result from this decontractible graph
+        :return: the result of the function
+        """
+        if self._results is None:
+            self._results = dict()
+        if key not in self._results:
+            self._results[key] = function(self)
+        return self._results[key]
+
+    def _structure_changed(self):
+        """
+        Discards the adjacency snapshots and the results cached for this decontractible graph after its structure has
+        changed.
+        """
+        self._compact_adjacency = None
+        self._undirected_graphs = None
+        self._results = None
+
     def add_node(self, supernode: 'Supernode'):
         """
         Adds a supernode to the decontractible graph.
@@ -220,6 +332,7 @@ class DecGraph:
         """
         self.V[supernode.key] = supernode
         self._graph.add_node(supernode.key)
+        self._structure_changed()
 
     def add_edge(self, superedge: 'Superedge'):
         """
@@ -236,6 +349,7 @@ class DecGraph:
         if (superedge.tail.key, superedge.head.key) not in self.E:
             self.E[(superedge.tail.key, superedge.head.key)] = superedge
             self._graph.add_edge(superedge.tail.key, superedge.head.key)
+            self._structure_changed()
 
     def remove_node(self, supernode: 'Supernode'):
         """
@@ -245,13 +359,41 @@ class DecGraph:
 
         :param supernode: the supernode to be removed
         """
-        for edge in self.in_edges(supernode):
-            self.remove_edge(edge)
-        for edge in self.out_edges(supernode):
-            self.remove_edge(edge)
+        self._remove_node_key(supernode.key)
+        self._structure_changed()
+
+    def remove_nodes_from(self, supernodes: Iterable['Supernode']):
+        """
+        Removes the given supernodes from the decontractible graph, as ``remove_node`` does for each of them, but
+        discarding the cached structure of the graph only once.
+        If a supernode has a key which is not in the graph, rise a KeyError.
 
-        self.V.pop(supernode.key)
-        self._graph.remove_node(supernode.key)
+        :param supernodes: the supernodes to be removed
+        """
+        try:
+            for supernode in supernodes:
+                self._remove_node_key(supernode.key)
+        finally:
+            self._structure_changed()
+
+    def _remove_node_key(self, key: Any):
+        """
+        Removes the supernode with the given key and its incident superedges from the decontractible graph, without
+        discarding the cached structure of the graph.
+
+        :param key: the key of the supernode to be removed
+        """
+        # The incident superedges are found by the keys of the adjacent supernodes, while the edges of the graph
+        # are removed along with the node
+        edges = self.E
+        for tail_key in self._graph.pred[key]:
+            edges.pop((tail_key, key))
+        for head_key in self._graph.succ[key]:
+            # A self-loop has already been removed as an in edge
+            edges.pop((key, head_key), None)
+
+        self.V.pop(key)
+        self._graph.remove_node(key)
 
     def remove_edge(self, superedge: 'Superedge'):
         """
@@ -263,6 +405,7 @@ class DecGraph:
         """
         self.E.pop((superedge.tail.key, superedge.head.key))
         self._graph.remove_edge(superedge.tail.key, superedge.head.key)
+        self._structure_changed()
 
     def height(self) -> int:
         """
@@ -271,10 +414,14 @@ class DecGraph:
 
         :return: the height of the decontractible graph
         """
-        if not self.nodes():
-            return -1
-        else:
-            return max(node.height() for node in self.nodes())
+        # The hierarchy trees of the supernodes are visited one level at a time, rather than recursively asking each
+        # supernode for its height, as the height is the number of non-empty levels minus one
+        height = -1
+        level = list(self.V.values())
+        while level:
+            height += 1
+            level = [node for supernode in level for node in supernode.dec.V.values()]
+        return height
 
     def order(self) -> int:
         """
@@ -282,7 +429,7 @@ class DecGraph:
 
         :return: the order of the decontractible graph
         """
-        return len(self.nodes())
+        return len(self.V)
 
     def complete_decontraction(self) -> 'DecGraph':
         """
@@ -295,21 +442,16 @@ class DecGraph:
         decontraction, the complete decontraction will contain all supernodes and superedges in those non-empty
         decontractions.
 
+        If the endpoints of some superedge in the decontractions are not included in the decontractions of the
+        supernodes, a ValueError is raised.
+
         :return: the complete decontraction of this decontractible graph
         """
-        complete_decontraction = DecGraph()
-
-        for node in self.nodes():
-            for n in node.dec.nodes():
-                complete_decontraction.add_node(n)
-            for e in node.dec.edges():
-                complete_decontraction.add_edge(e)
-
-        for edge in self.edges():
-            for e in edge.dec:
-                complete_decontraction.add_edge(e)
-
-        return complete_decontraction
+        # The dictionaries of supernodes and superedges are collected first, so that the adjacency of the complete
+        # decontraction is built once. As in add_node and add_edge, the last supernode and the first superedge with a
+        # given key are kept, and the endpoints of the superedges are checked once all the supernodes are collected.
+        dict_V, dict_E = decontraction_dicts(list(self.V.values()), list(self.E.values()))
+        return DecGraph(dict_V, dict_E, copy=False)
 
     def induced_subgraph(self, nodes: Iterable['Supernode']) -> 'DecGraph':
         """
@@ -323,7 +465,7 @@ class DecGraph:
         :param nodes: the set of supernodes to induce the subgraph
         :return: the induced subgraph
         """
-        return self.induced_subgraph_from_keys(set(map(lambda n: n.key, nodes)))
+        return self.induced_subgraph_from_keys({node.key for node in nodes})
 
     def induced_subgraph_from_keys(self, nodes_keys: Set) -> 'DecGraph':
         """
@@ -338,9 +480,12 @@ class DecGraph:
         :param nodes_keys: the set of supernodes keys to induce the subgraph
         :return: the induced subgraph
         """
-        induced_subgraph = nx.induced_subgraph(self._graph, self.nodes_keys() & nodes_keys)
-        return DecGraph(dict_V={key: self.V[key] for key in induced_subgraph.nodes()},
-                        dict_E={key: self.E[key] for key in induced_subgraph.edges()})
+        dict_V = {key: node for key, node in self.V.items() if key in nodes_keys}
+        succ, edges = self._graph.succ, self.E
+        return DecGraph(dict_V=dict_V,
+                        dict_E={(tail_key, head_key): edges[(tail_key, head_key)]
+                                for tail_key in dict_V for head_key in succ[tail_key] if head_key in dict_V},
+                        copy=False)
 
     def deepcopy(self, supernode_memo: 'Supernode' = None):
         """
@@ -363,17 +508,29 @@ class DecGraph:
         for k in self.E:
             e_copies[k] = self.E[k].deepcopy(v_copies)
 
-        dec_graph_copy = DecGraph(v_copies, e_copies)
+        dec_graph_copy = DecGraph(v_copies, e_copies, copy=False)
 
         # Component sets attributes are substituted with deep copies once the graph is constructed.
         # The attribute supernode_memo is used as a flag to indicate that this is the first call to deepcopy.
+        # Only the supernodes of the complete decontraction of each level are needed to copy the component sets of
+        # the level above, so the levels are flattened without building their superedges and adjacency.
+        # A component set shared by several supernodes of a level is copied once, and its copy is shared as well.
         if supernode_memo is None:
-            current_graph = dec_graph_copy
-            while current_graph.nodes():
-                current_dec = current_graph.complete_decontraction()
-                for node in current_graph.nodes():
-                    node.component_sets = frozenset(c_set.deepcopy(current_dec.V) for c_set in node.component_sets)
-                current_graph = current_dec
+            current_nodes = dec_graph_copy.V
+            while current_nodes:
+                dec_nodes = decontraction_nodes(list(current_nodes.values()))
+                c_set_copies: Dict[int, Any] = dict()
+                for node in current_nodes.values():
+                    if not node.component_sets:
+                        continue
+                    copies = []
+                    for c_set in node.component_sets:
+                        c_set_copy = c_set_copies.get(id(c_set))
+                        if c_set_copy is None:
+                            c_set_copy = c_set_copies[id(c_set)] = c_set.deepcopy(dec_nodes)
+                        copies.append(c_set_copy)
+                    node.component_sets = frozenset(copies)
+                current_nodes = dec_nodes
 
         return dec_graph_copy
 
@@ -389,26 +546,19 @@ class DecGraph:
         :param other: the other decontractible graph to compare
         :return: True if this decontractible graph is equal to the other
         """
-        other_nodes = other.nodes()
-        self_nodes = self.nodes()
-        if len(other_nodes) != len(self_nodes):
+        # Graphs with different keys are told apart by comparing the key views, before any decontraction is compared
+        if self.V.keys() != other.V.keys() or self.E.keys() != other.E.keys():
             return False
-        for other_node in other_nodes:
-            if other_node not in self_nodes:
-                return False
-            self_node = self.V[other_node.key]
-            if self_node.dec != other_node.dec:
-                return False
 
-        other_edges = other.edges()
-        self_edges = self.edges()
-        if len(other_edges) != len(self_edges):
-            return False
-        for other_edge in other_edges:
-            if other_edge not in self_edges:
+        # Supernodes and superedges with the same keys are further compared by their hash, as a membership test in
+        # the sets of supernodes and superedges would
+        for key, other_node in other.V.items():
+            self_node = self.V[key]
+            if hash(self_node) != hash(other_node) or self_node.dec != other_node.dec:
                 return False
-            self_edge = self.E[(other_edge.tail.key, other_edge.head.key)]
-            if self_edge.dec != other_edge.dec:
+        for key, other_edge in other.E.items():
+            self_edge = self.E[key]
+            if hash(self_edge) != hash(other_edge) or self_edge.dec != other_edge.dec:
                 return False
 
         return True
@@ -437,6 +587,12 @@ class Supernode:
     attr: Dict[str, Any]
         a dictionary of custom attributes and values to be added to the supernode
 
+    Notes
+    -----
+    The hash of a supernode is computed once from its key and level when the supernode is created, so that supernodes
+    are hashed at the cost of an attribute lookup in the sets and dictionaries where they are stored.
+    For this reason, the key and the level of a supernode should not be modified after its creation.
+
     Examples
     --------
     A supernode can be created indicating a key of any type and any other optional attribute, that are typically
@@ -455,7 +611,7 @@ class Supernode:
         print(supernode['weight']) # 20
     """
 
-    __slots__ = ('key', 'level', 'dec', 'component_sets', 'supernode', 'attr')
+    __slots__ = ('key', 'level', 'dec', 'component_sets', 'supernode', 'attr', '_hash')
 
     def __init__(self, key,
                  level: int = None,
@@ -476,6 +632,7 @@ class Supernode:
         """
         self.key = key
         self.level = level
+        self._hash = hash((key, level))
         self.dec = dec if dec is not None else DecGraph()
         self.component_sets = component_sets if component_sets is not None else frozenset()
         self.supernode = supernode
@@ -549,9 +706,17 @@ class Supernode:
         Returns the number of 0-height supernodes this supernode represents.
         This number is the amount of leaf supernodes in the hierarchy tree of supernodes contracted into this supernode.
         """
-        if self.dec.order() == 0:
-            return 1
-        return sum(node.size() for node in self.dec.nodes())
+        # The hierarchy tree is visited with an explicit stack rather than recursively. The result is not cached, since
+        # the decontractible graphs of the descendants can be changed directly, without passing through this supernode
+        size = 0
+        stack = [self]
+        while stack:
+            nodes = stack.pop().dec.V
+            if nodes:
+                stack.extend(nodes.values())
+            else:
+                size += 1
+        return size
 
     def deepcopy(self, supernode: 'Supernode' = None):
         """
@@ -573,6 +738,9 @@ class Supernode:
                          **self.attr)
 
     def __eq__(self, other):
+        # Supernodes are mostly compared with themselves, as in the checks on the supernodes of the endpoints of edges
+        if self is other:
+            return True
         if not isinstance(other, Supernode):
             return False
         return self.key == other.key
@@ -584,7 +752,16 @@ class Supernode:
         return iter(self.dec.nodes())
 
     def __hash__(self):
-        return hash((self.key, self.level))
+        return self._hash
+
+    def __getstate__(self):
+        # The hash is not pickled, as the hash of the key may differ in other interpreters
+        return {slot: getattr(self, slot) for slot in self.__slots__ if slot != '_hash'}
+
+    def __setstate__(self, state: Dict[str, Any]):
+        for slot, value in state.items():
+            setattr(self, slot, value)
+        self._hash = hash((self.key, self.level))
 
     def __str__(self):
         return "(Key: " + str(self.key) + ", " + \
@@ -630,6 +807,11 @@ class Superedge:
     attr: Dict[str, Any]
         a dictionary of custom attributes and values to be added to the superedge
 
+    Notes
+    -----
+    As for supernodes, the hash of a superedge is computed once from its tail and head when the superedge is created,
+    which therefore should not be replaced afterwards.
+
     Examples
     --------
     A superedge can be created indicating the reference to the tail and head supernodes objects and any other
@@ -650,7 +832,7 @@ class Superedge:
         superedge['weight'] = 20
         print(superedge['weight']) # 20
     """
-    __slots__ = ('tail', 'head', 'level', 'dec', 'attr')
+    __slots__ = ('tail', 'head', 'level', 'dec', 'attr', '_hash')
 
     def __init__(self, tail: 'Supernode', head: 'Supernode', level: int = None, dec: Set['Superedge'] = None, **attr):
         """
@@ -664,9 +846,11 @@ class Superedge:
         """
         self.tail = tail
         self.head = head
+        self._hash = hash((tail, head))
         self.dec = dec if dec is not None else set()
+        has_tail, has_head = self.tail.dec.has_node, self.head.dec.has_node
         for e in self.dec:
-            if e.tail not in self.tail.dec.nodes() or e.head not in self.head.dec.nodes():
+            if not has_tail(e.tail) or not has_head(e.head):
                 raise ValueError('The supernodes of the superedge to be added must be included in tail and head'
                                  'decontractions respectively.')
         if level is not None and (
@@ -691,7 +875,7 @@ class Superedge:
 
         :param superedge: the superedge to be added
         """
-        if superedge.tail not in self.tail.dec.nodes() or superedge.head not in self.head.dec.nodes():
+        if not self.tail.dec.has_node(superedge.tail) or not self.head.dec.has_node(superedge.head):
             raise ValueError('The supernodes of the superedge to be added must be included in tail and head'
                              'decontractions respectively.')
         if self.level is not None and superedge.level != self.level - 1:
@@ -729,9 +913,16 @@ class Superedge:
         Returns the number of 0-height superedges this superedge represents.
         This number is the amount of leaf superedges in the hierarchy tree of superedges contracted into this superedge.
         """
-        if not self.dec:
-            return 1
-        return sum(e.size() for e in self.dec)
+        # The hierarchy tree is visited with an explicit stack rather than recursively
+        size = 0
+        stack = [self]
+        while stack:
+            edges = stack.pop().dec
+            if edges:
+                stack.extend(edges)
+            else:
+                size += 1
+        return size
 
     def deepcopy(self, v_copies: Dict = None):
         """
@@ -752,6 +943,8 @@ class Superedge:
                          **self.attr)
 
     def __eq__(self, other):
+        if self is other:
+            return True
         if not isinstance(other, Superedge):
             return False
         return self.tail == other.tail and self.head == other.head
@@ -763,7 +956,16 @@ class Superedge:
         return iter(self.dec)
 
     def __hash__(self):
-        return hash((self.tail, self.head))
+        return self._hash
+
+    def __getstate__(self):
+        # The hash is not pickled, as the hashes of the supernodes may differ in other interpreters
+        return {slot: getattr(self, slot) for slot in self.__slots__ if slot != '_hash'}
+
+    def __setstate__(self, state: Dict[str, Any]):
+        for slot, value in state.items():
+            setattr(self, slot, value)
+        self._hash = hash((self.tail, self.head))
 
     def __str__(self):
         return str(self.tail) + ' -> ' + str(self.head)
@@ -787,3 +989,67 @@ class Superedge:
         :param attr: the attributes to be added to the superedge
         """
         self.attr.update(attr)
+
+
+class CompactAdjacency:
+    """
+    A read-only structure-of-arrays snapshot of the adjacency of a decontractible graph.
+
+    Each supernode of the decontractible graph is assigned a dense integer id, and the ids of its successors and
+    predecessors are stored contiguously in typed arrays following the CSR (compressed sparse row) layout, so that
+    visiting the neighbors of a supernode does not require any access to superedge objects.
+
+    Attributes
+    ----------
+    nodes : List[Supernode]
+        the supernodes of the decontractible graph, indexed by their id
+    index : Dict[Any, int]
+        a dictionary mapping the keys of the supernodes to their id
+    out_indptr : array
+        the successors of the supernode with id i are stored in ``out_indices[out_indptr[i]:out_indptr[i + 1]]``
+    out_indices : array
+        the concatenation of the ids of the successors of all the supernodes
+    in_indptr : array
+        the predecessors of the supernode with id i are stored in ``in_indices[in_indptr[i]:in_indptr[i + 1]]``
+    in_indices : array
+        the concatenation of the ids of the predecessors of all the supernodes
+    """
+    __slots__ = ('nodes', 'index', 'out_indptr', 'out_indices', 'in_indptr', 'in_indices')
+
+    def __init__(self, dec_graph: DecGraph):
+        """
+        Builds the compact adjacency of the given decontractible graph.
+
+        :param dec_graph: the decontractible graph
+        """
+        self.nodes: List[Supernode] = list(dec_graph.V.values())
+        self.index: Dict[Any, int] = {node.key: i for i, node in enumerate(self.nodes)}
+        self.out_indptr, self.out_indices = self._build(dec_graph._graph.succ, self.nodes, self.index)
+        self.in_indptr, self.in_indices = self._build(dec_graph._graph.pred, self.nodes, self.index)
+
+    @staticmethod
+    def _build(adjacency, nodes: List['Supernode'], index: Dict[Any, int]):
+        indptr = array('l', [0])
+        indices = array('l')
+        for node in nodes:
+            indices.extend(index[key] for key in adjacency[node.key])
+            indptr.append(len(indices))
+        return indptr, indices
+
+    def successors(self, i: int) -> array:
+        """
+        Returns the ids of the successors of the supernode with the given id.
+
+        :param i: the id of the supernode
+        :return: the ids of the successors of the supernode
+        """
+        return self.out_indices[self.out_indptr[i]:self.out_indptr[i + 1]]
+
+    def predecessors(self, i: int) -> array:
+        """
+        Returns the ids of the predecessors of the supernode with the given id.
+
+        :param i: the id of the supernode
+        :return: the ids of the predecessors of the supernode
+        """
+        return self.in_indices[self.in_indptr[i]:self.in_indptr[i + 1]]
@@ -0,0 +1,68 @@
+from typing import Any, Dict, List, Tuple
+
+# The functions of this module are the inner loops of the traversals of decontractible graphs.
+# They only work on dictionaries and on the ``dec`` attribute of supernodes and superedges, with type annotations on
+# all their parameters, so that the module can optionally be compiled to a C extension with mypyc (see setup.py).
+# When it is not compiled, the same module is imported as pure Python.
+
+
+def decontraction_dicts(supernodes: List[Any], superedges: List[Any]) -> Tuple[Dict[Any, Any], Dict[Any, Any]]:
+    """
+    Returns the dictionaries of supernodes and superedges of the complete decontraction of a decontractible graph
+    with the given supernodes and superedges, indexed by their keys.
+    As when they are added one at a time to a decontractible graph, the last supernode and the first superedge with a
+    given key are kept, and the dictionaries of superedges of a decontraction are merged at once when none of their
+    keys is already included.
+    If the endpoints of some superedge are not among the supernodes, a ValueError is raised.
+
+    :param supernodes: the supernodes of the decontractible graph
+    :param superedges: the superedges of the decontractible graph
+    :return: the dictionaries of supernodes and superedges of the complete decontraction
+    """
+    dict_V: Dict[Any, Any] = dict()
+    dict_E: Dict[Any, Any] = dict()
+    for supernode in supernodes:
+        dec = supernode.dec
+        dict_V.update(dec.V)
+        _merge_first(dict_E, dec.E)
+
+    for superedge in superedges:
+        for edge in superedge.dec:
+            dict_E.setdefault((edge.tail.key, edge.head.key), edge)
+
+    # The endpoints are checked once all the supernodes are collected, rather than for each superedge as it is added
+    for tail_key, head_key in dict_E:
+        if tail_key not in dict_V or head_key not in dict_V:
+            raise ValueError(
+                'The supernodes of the superedge to be added must be included in the decontractible graph.')
+
+    return dict_V, dict_E
+
+
+def decontraction_nodes(supernodes: List[Any]) -> Dict[Any, Any]:
+    """
+    Returns the dictionary of supernodes of the complete decontraction of a decontractible graph with the given
+    supernodes, indexed by their keys, as ``decontraction_dicts`` does without collecting the superedges.
+
+    :param supernodes: the supernodes of the decontractible graph
+    :return: the dictionary of supernodes of the complete decontraction
+    """
+    dict_V: Dict[Any, Any] = dict()
+    for supernode in supernodes:
+        dict_V.update(supernode.dec.V)
+    return dict_V
+
+
+def _merge_first(target: Dict[Any, Any], source: Dict[Any, Any]):
+    """
+    Adds the items of the source dictionary to the target dictionary, keeping the values of the keys already in the
+    target dictionary.
+
+    :param target: the dictionary to extend
+    :param source: the dictionary of the items to add
+    """
+    if target.keys().isdisjoint(source):
+        target.update(source)
+    else:
+        for key, value in source.items():
+            target.setdefault(key, value)
@@ -1,22 +1,43 @@
+import io
+import shutil
+import tempfile
 import time
 import xml.etree.ElementTree as ET
-from typing import Dict, Any, Callable, Tuple
-from multilevelgraphs import MultilevelGraph, __version__, Supernode, Superedge
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import lru_cache
+from itertools import chain
+from types import MappingProxyType
+from typing import Dict, Any, Callable, Tuple, Optional, Hashable, Iterable, List, Mapping, Deque, Union
+from multilevelgraphs import MultilevelGraph, __version__, DecGraph, Supernode, Superedge
+
+
+# A color as the attributes of a viz:color element, or as a tuple of the red, green, blue and alpha strings
+Color = Union[Dict[str, str], Tuple[str, str, str, str]]
+
+# Tags of the elements created for each node and edge, shared by all the writers
+_NODE = 'node'
+_NODES = 'nodes'
+_EDGE = 'edge'
+_ATTVALUES = 'attvalues'
+_ATTVALUE = 'attvalue'
+_VIZ_COLOR = 'viz:color'
+_VIZ_SIZE = 'viz:size'
+_VIZ_THICKNESS = 'viz:thickness'
 
 
 def _default_node_label_func(supernode: Supernode) -> str:
     return str(supernode['label']) if 'label' in supernode.attr else str(supernode.key)
 
 
-def _default_node_color_func(supernode: Supernode) -> Tuple[str, str, str, str]:
-    if 'color' in supernode.attr and isinstance(supernode['color'], Tuple) and len(supernode['color']) == 3 and \
-            all((isinstance(c, int) and 0 <= c <= 255) for c in supernode['color']):
-        return str(supernode['color'][0]), str(supernode['color'][1]), str(supernode['color'][2]), "1.0"
+def _default_node_color_func(supernode: Supernode) -> Dict[str, str]:
+    color = _custom_color(supernode.attr.get('color'))
+    if color:
+        return color
     elif supernode.supernode:
-        hashcode = hash(supernode.supernode.key)
+        return _hash_color(supernode.supernode.key)
     else:
-        hashcode = hash(supernode.key)
-    return str((hashcode & 0xFF0000) >> 16), str((hashcode & 0x00FF00) >> 8), str(hashcode & 0x0000FF), "1.0"
+        return _hash_color(supernode.key)
 
 
 def _default_node_size_func(supernode: Supernode) -> str:
@@ -26,15 +47,56 @@ def _default_node_size_func(supernode: Supernode) -> str:
         return str(supernode.size() * 10)
 
 
-def _default_edge_color_func(edge: Superedge) -> Tuple[str, str, str, str]:
-    if 'color' in edge.attr and isinstance(edge['color'], Tuple) and len(edge['color']) == 3 and \
-            all((isinstance(c, int) and 0 <= c <= 255) for c in edge['color']):
-        return str(edge['color'][0]), str(edge['color'][1]), str(edge['color'][2]), "1.0"
+def _default_edge_color_func(edge: Superedge) -> Dict[str, str]:
+    color = _custom_color(edge.attr.get('color'))
+    if color:
+        return color
     elif edge.tail.supernode and edge.head.supernode and edge.tail.supernode == edge.head.supernode:
-        hashcode = hash(edge.tail.supernode.key)
-        return str((hashcode & 0xFF0000) >> 16), str((hashcode & 0x00FF00) >> 8), str(hashcode & 0x0000FF), "1.0"
+        return _hash_color(edge.tail.supernode.key)
     else:
-        return "0", "0", "0", "1.0"
+        return _BLACK
+
+
+def _custom_color(color: Any) -> Optional[Dict[str, str]]:
+    """
+    Returns the attributes of a viz:color element with the given custom color, if it is a tuple of three integers
+    between 0 and 255, or None otherwise.
+    """
+    if isinstance(color, tuple) and len(color) == 3:
+        r, g, b = color
+        if type(r) is int and type(g) is int and type(b) is int and 0 <= r <= 255 and 0 <= g <= 255 and 0 <= b <= 255:
+            return {'r': _BYTE_STRINGS[r], 'g': _BYTE_STRINGS[g], 'b': _BYTE_STRINGS[b], 'a': "1.0"}
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _hash_color(key: Hashable, a: str = "1.0") -> Dict[str, str]:
+    """
+    Returns the attributes of a viz:color element with a color based on the hash of the given supernode key.
+    Since the colors of all the children of a supernode are computed from the same key, the results are cached:
+    the returned dictionary is shared and must not be modified.
+    """
+    hashcode = hash(key)
+    return {'r': _BYTE_STRINGS[(hashcode >> 16) & 0xFF],
+            'g': _BYTE_STRINGS[(hashcode >> 8) & 0xFF],
+            'b': _BYTE_STRINGS[hashcode & 0xFF],
+            'a': a}
+
+
+def _color_attributes(color: Color) -> Dict[str, str]:
+    """
+    Returns the attributes of the viz:color element of the given color, which is either already a dictionary of such
+    attributes or a tuple of the red, green, blue and alpha strings.
+    """
+    if isinstance(color, dict):
+        return color
+    r, g, b, a = color
+    return {'r': str(r), 'g': str(g), 'b': str(b), 'a': str(a)}
+
+
+# Decimal strings of all the values of a color component
+_BYTE_STRINGS = tuple(str(i) for i in range(256))
+_BLACK = {'r': "0", 'g': "0", 'b': "0", 'a': "1.0"}
 
 
 def _default_edge_thickness_func(edge: Superedge) -> str:
@@ -44,7 +106,7 @@ def _default_edge_thickness_func(edge: Superedge) -> str:
         return str(edge.size())
 
 
-def write_gexf(ml_graph: MultilevelGraph, file_path: str, description: str = None):
+def write_gexf(ml_graph: MultilevelGraph, file_path: str, description: str = None, workers: Optional[int] = None):
     """
     Write a GEXF file for the given MultilevelGraph in the specified file path.
     The produced GEXF file will contain just the core information, in order to retain the graph structure and
@@ -55,27 +117,28 @@ def write_gexf(ml_graph: MultilevelGraph, file_path: str, description: str = Non
     :param ml_graph: the MultilevelGraph to write
     :param file_path: the path of the file to write
     :param description: a description of the graph to add in the metadata of the GEXF file
+    :param workers: the number of worker processes used to serialize the top-level nodes in parallel, if None or lower
+        than 2 no worker process is used
     """
-    writer = GEXFWriter(ml_graph, description=description)
-    for supernode in ml_graph.get_graph(ml_graph.height(), deepcopy=False).nodes():
-        _add_node_and_children(writer, supernode)
+    levels = _levels(ml_graph)
+    with GEXFWriter(ml_graph, description=description, workers=workers) as writer:
+        _add_nodes(writer, levels[-1].nodes())
 
-    for key, edge in [key_edge for i in range(ml_graph.height())
-                      for key_edge in ml_graph.get_graph(i, deepcopy=False).E.items()]:
-        superedge_attr = edge.attr
-        if edge.level:
-            superedge_attr |= {'level': edge.level}
-        writer.add_edge(str(key), str(edge.tail.key), str(edge.head.key), attributes=superedge_attr)
+        for key, edge in chain.from_iterable(dec_graph.E.items() for dec_graph in levels[:-1]):
+            level = edge.level
+            superedge_attr = {**edge.attr, 'level': level} if level else edge.attr
+            writer.add_edge_plain(str(key), str(edge.tail.key), str(edge.head.key), attributes=superedge_attr)
 
-    writer.write(file_path)
+        writer.write(file_path)
 
 
 def write_gexf_for_viz(ml_graph: MultilevelGraph, file_path: str, description: str = None,
                        node_label_func: Callable[[Supernode], str] = _default_node_label_func,
-                       node_color_func: Callable[[Supernode], Tuple[str, str, str, str]] = _default_node_color_func,
+                       node_color_func: Callable[[Supernode], Color] = _default_node_color_func,
                        node_size_func: Callable[[Supernode], str] = _default_node_size_func,
-                       edge_color_func: Callable[[Superedge], Tuple[str, str, str, str]] = _default_edge_color_func,
-                       edge_thickness_func: Callable[[Superedge], str] = _default_edge_thickness_func):
+                       edge_color_func: Callable[[Superedge], Color] = _default_edge_color_func,
+                       edge_thickness_func: Callable[[Superedge], str] = _default_edge_thickness_func,
+                       workers: Optional[int] = None):
     """
     Write a GEXF file for the given MultilevelGraph in the specified file path.
     The produced GEXF file will contain all the information for visualization such as visual attributes and
@@ -94,99 +157,203 @@ def write_gexf_for_viz(ml_graph: MultilevelGraph, file_path: str, description: s
     :param description: a description of the graph to add in the metadata of the GEXF file
     :param node_label_func: a function that takes a Supernode and returns the label for the node. The default function
         returns the key of the supernode if a 'label' custom attribute is not present.
-    :param node_color_func: a function that takes a Supernode and returns the color for the node. The default function
+    :param node_color_func: a function that takes a Supernode and returns the color for the node, either as a
+        dictionary with the 'r', 'g', 'b' and 'a' string attributes of the viz:color element, such as
+        ``{'r': "255", 'g': "0", 'b': "0", 'a': "1.0"}``, or as a tuple of the same four strings. The default function
         returns a color based on the hash of the supernode key if a 'color' custom attribute is not present.
     :param node_size_func: a function that takes a Supernode and returns the size for the node. The default function
         returns the size of the supernode multiplied by 10 if a 'size' custom attribute is not present.
-    :param edge_color_func: a function that takes a Superedge and returns the color for the edge. The default function
-        returns a color based on the hash of the supernode key if a 'color' custom attribute is not present.
+    :param edge_color_func: a function that takes a Superedge and returns the color for the edge, in one of the
+        formats accepted for the node color. The default function returns a color based on the hash of the supernode
+        key if a 'color' custom attribute is not present.
     :param edge_thickness_func: a function that takes a Superedge and returns the thickness for the edge. The default
         function returns the size of the edge if a 'thickness' custom attribute is not present.
+    :param workers: the number of worker processes used to serialize the top-level nodes in parallel, if None or lower
+        than 2 no worker process is used
+    """
+    levels = _levels(ml_graph)
+    with GEXFWriter(ml_graph, description=description, workers=workers) as writer:
+        _add_nodes(writer, levels[-1].nodes(), node_label_func, node_color_func, node_size_func)
+
+        writer.add_edge_attribute('same_level', bool)
+        for key, edge in chain.from_iterable(dec_graph.E.items() for dec_graph in levels):
+            level = edge.level
+            if level:
+                superedge_attr = {**edge.attr, 'level': level, 'same_level': "1"}
+            else:
+                superedge_attr = {**edge.attr, 'same_level': "1"}
+            writer.add_edge(str(key), str(edge.tail.key), str(edge.head.key),
+                            color=edge_color_func(edge),
+                            thickness=edge_thickness_func(edge),
+                            attributes=superedge_attr)
+        writer.write(file_path)
+
+
+def _levels(ml_graph: MultilevelGraph) -> List[DecGraph]:
+    """
+    Returns the decontractible graphs of all the levels of the given multilevel graph, from the lowest to the highest,
+    retrieving each of them just once and without copying them.
     """
-    writer = GEXFWriter(ml_graph, description=description)
-    for supernode in ml_graph.get_graph(ml_graph.height(), deepcopy=False).nodes():
-        _add_node_and_children(writer, supernode, node_label_func, node_color_func, node_size_func)
-
-    writer.add_edge_attribute('same_level', bool)
-    for key, edge in [key_edge for i in range(ml_graph.height()+1)
-                      for key_edge in ml_graph.get_graph(i, deepcopy=False).E.items()]:
-        superedge_attr = edge.attr
-        if edge.level:
-            superedge_attr |= {'level': edge.level}
-        writer.add_edge(str(key), str(edge.tail.key), str(edge.head.key),
-                        color=edge_color_func(edge),
-                        thickness=edge_thickness_func(edge),
-                        attributes=superedge_attr | {'same_level': "1"})
-    writer.write(file_path)
-
-
-def _add_node_and_children(writer: 'GEXFWriter', supernode: Supernode,
-                           node_label_func: Callable[[Supernode], str] = None,
-                           node_color_func: Callable[[Supernode], Tuple[str, str, str, str]] = None,
-                           node_size_func: Callable[[Supernode], str] = None,
-                           supernode_element: ET.Element = None):
-
-    # Gather supernode attributes
-    supernode_attr = supernode.attr
-    if supernode.level:
-        supernode_attr |= {'level': supernode.level}
-    if supernode.supernode:
-        supernode_attr |= {'supernode': supernode.supernode}
-    if supernode.component_sets:
-        supernode_attr |= {'component_sets': supernode.component_sets}
-
-    # Add supernode
-    node_element = writer.add_node(node_id=str(supernode.key),
-                                   label=node_label_func(supernode) if node_label_func else None,
-                                   color=node_color_func(supernode) if node_color_func else None,
-                                   size=node_size_func(supernode) if node_size_func else None,
-                                   parent=supernode_element,
-                                   attributes=supernode_attr)
-
-    # Add children and edges between children and their supernode
-    for child in supernode.dec.nodes():
-        _add_node_and_children(writer, child, node_label_func, node_color_func, node_size_func, node_element)
-
-        # If the GEXF is for visualization, add an extra edge between the child and the supernode
-        if node_label_func is not None:
-            # Edges between children and supernode have their color set to the child color and are made semi-transparent
-            # in the visualization to distinguish them from the edges between supernodes of the same level
-            edge_color = _default_node_color_func(child)
-            edge_color = (edge_color[0], edge_color[1], edge_color[2], "0.3")
-            writer.add_edge(edge_id="(" + child.key + ", " + supernode.key + ")",
-                            source_id=str(child.key),
-                            target_id=str(supernode.key),
-                            color=edge_color,
+    return [ml_graph.get_graph(i, deepcopy=False) for i in range(ml_graph.height() + 1)]
+
+
+def _add_nodes(writer: 'GEXFWriter', supernodes: Iterable[Supernode],
+               node_label_func: Callable[[Supernode], str] = None,
+               node_color_func: Callable[[Supernode], Color] = None,
+               node_size_func: Callable[[Supernode], str] = None):
+    """
+    Adds the given top-level supernodes to the writer, along with all their descendants.
+    If the node functions are given, the visualization attributes of the nodes are added too, as well as an extra edge
+    between each child and its supernode.
+
+    The hierarchy is traversed depth-first with an explicit stack, so that all the descendants of a top-level node are
+    added before the next top-level node. Each stack entry is either a supernode to add, along with the element of its
+    supernode, or the extra edge between a child and its supernode, to be added after all the descendants of the child.
+    """
+    viz = node_label_func is not None
+    # String values of the supernode attribute, which is shared by all the children of a supernode
+    supernode_strings: Dict[Supernode, str] = dict()
+    stack: List[Tuple[Supernode, Optional[ET.Element], Optional[Supernode]]] = \
+        [(supernode, None, None) for supernode in reversed(list(supernodes))]
+    while stack:
+        supernode, supernode_element, parent = stack.pop()
+
+        if parent is not None:
+            # Edges between children and supernode have their color set to the child color and are made
+            # semi-transparent in the visualization to distinguish them from the edges between supernodes of the
+            # same level
+            writer.add_edge(edge_id="(" + str(supernode.key) + ", " + str(parent.key) + ")",
+                            source_id=str(supernode.key),
+                            target_id=str(parent.key),
+                            color=_child_edge_color(supernode),
                             attributes={'same_level': "0"})
+            continue
+
+        # Gather supernode attributes, without modifying the attributes of the supernode
+        extra_attr = {}
+        if supernode.level:
+            extra_attr['level'] = supernode.level
+        parent_supernode = supernode.supernode
+        if parent_supernode:
+            parent_string = supernode_strings.get(parent_supernode)
+            if parent_string is None:
+                parent_string = supernode_strings[parent_supernode] = str(parent_supernode)
+            extra_attr['supernode'] = parent_string
+        if supernode.component_sets:
+            extra_attr['component_sets'] = supernode.component_sets
+        supernode_attr = {**supernode.attr, **extra_attr} if extra_attr else supernode.attr
+
+        # Add supernode
+        if viz:
+            node_element = writer.add_node(node_id=str(supernode.key),
+                                           label=node_label_func(supernode),
+                                           color=node_color_func(supernode),
+                                           size=node_size_func(supernode),
+                                           parent=supernode_element,
+                                           attributes=supernode_attr)
+        else:
+            node_element = writer.add_node_plain(node_id=str(supernode.key),
+                                                 parent=supernode_element,
+                                                 attributes=supernode_attr)
+
+        # Add children, followed by the edges between each child and the supernode if the GEXF is for visualization
+        for child in reversed(list(supernode.dec.nodes())):
+            if viz:
+                stack.append((child, None, supernode))
+            stack.append((child, node_element, None))
+
+
+def _child_edge_color(child: Supernode) -> Dict[str, str]:
+    """
+    Returns the attributes of the semi-transparent viz:color element of the edge between the given child and its
+    supernode, which has the default color of the child.
+    """
+    if 'color' in child.attr or not child.supernode:
+        return _default_node_color_func(child) | {'a': "0.3"}
+    return _hash_color(child.supernode.key, "0.3")
 
 
-class GEXF:
-    versions = {
-        "1.3": {
-            "NS_GEXF": 'http://gexf.net/1.3',
-            "NS_VIZ": "http://www.gexf.net/1.3/viz",
-            "NS_XSI": 'http://www.w3.org/2001/XMLSchema-instance',
-            "SCHEMALOCATION": " ".join([
-                'http://gexf.net/1.3,'
-                'http://gexf.net/1.3/gexf.xsd']),
-            "VERSION": "1.3",
-        }
+def _escape_attribute(text: str) -> str:
+    """
+    Escapes the given attribute value in the same way as the ElementTree serializer.
+    """
+    if "&" in text:
+        text = text.replace("&", "&amp;")
+    if "<" in text:
+        text = text.replace("<", "&lt;")
+    if ">" in text:
+        text = text.replace(">", "&gt;")
+    if "\"" in text:
+        text = text.replace("\"", "&quot;")
+    if "\r" in text:
+        text = text.replace("\r", "&#13;")
+    if "\n" in text:
+        text = text.replace("\n", "&#10;")
+    if "\t" in text:
+        text = text.replace("\t", "&#09;")
+    return text
+
+
+# Namespaces and schema locations of the supported GEXF versions
+GEXF_VERSIONS: Dict[str, Dict[str, str]] = {
+    "1.3": {
+        "NS_GEXF": 'http://gexf.net/1.3',
+        "NS_VIZ": "http://www.gexf.net/1.3/viz",
+        "NS_XSI": 'http://www.w3.org/2001/XMLSchema-instance',
+        "SCHEMALOCATION": " ".join([
+            'http://gexf.net/1.3,'
+            'http://gexf.net/1.3/gexf.xsd']),
+        "VERSION": "1.3",
     }
+}
 
-    types: Dict[type, str] = dict([
-        (int, "integer"),
-        (float, "float"),
-        (bool, "boolean"),
-        (str, "string")
-    ])
+# GEXF types of the attribute values, any other type is written as a string
+GEXF_TYPES: Mapping[type, str] = MappingProxyType({
+    int: "integer",
+    float: "float",
+    bool: "boolean",
+    str: "string"
+})
+_DEFAULT_GEXF_TYPE = "string"
 
 
 class GEXFWriter:
+    """
+    A writer of GEXF files for multilevel graphs.
+
+    Nodes and edges are not kept in memory until the file is written: each top-level node is serialized, along with
+    all its descendants, as soon as the next top-level node is added, while each edge is serialized as soon as it is
+    added. Serialized elements are buffered in temporary spool files, which are kept in memory up to a maximum size,
+    and are copied into the GEXF file by the ``write`` method, after the attributes discovered while adding nodes and
+    edges.
+
+    For this reason, all the descendants of a top-level node must be added before the next top-level node.
+    The file can be written more than once, possibly after adding further nodes and edges, and the spool files are
+    only released by the ``close`` method, which is also called when the writer is used as a context manager.
+
+    If a number of workers is given, top-level nodes are serialized by a pool of worker processes, while the
+    following top-level nodes are being added, and their serializations are buffered in the same order in which they
+    were added.
+    """
+    # Maximum number of top-level nodes sent to the worker processes and not yet buffered, per worker
+    _MAX_PENDING_SERIALIZATIONS = 4
+    # Maximum number of characters kept in memory by each spool file before rolling over to disk
+    _SPOOL_MAX_SIZE = 1 << 22
+    # Size of the buffer of the GEXF file and of the chunks copied from the spool files into it
+    _WRITE_BUFFER_SIZE = 1 << 20
+    # Indentation of nodes and edges in the GEXF file, that is, the level of the <node> and <edge> elements
+    _ELEMENT_LEVEL = 3
+
+    __slots__ = ('gexf', 'encoding', 'prettyprint', 'graph', 'node_attributes', 'edge_attributes', 'nodes', 'edges',
+                 '_node_attr_types', '_edge_attr_types', '_nodes_spool', '_edges_spool', '_pending_node',
+                 '_child_nodes_containers', '_workers', '_executor', '_serializations')
+
     def __init__(self, ml_graph: MultilevelGraph,
                  version: str = "1.3",
                  encoding: str = "utf-8",
                  prettyprint: bool = True,
-                 description: str = None):
+                 description: str = None,
+                 workers: Optional[int] = None):
         """
         Create a GEXFWriter object to write a GEXF file for a multilevel graph.
 
@@ -195,13 +362,16 @@ class GEXFWriter:
         :param encoding: the encoding of the GEXF file to write
         :param prettyprint: if True, the GEXF file will be written with indentation and newlines for better readability
         :param description: a description of the graph to add in the meta element
+        :param workers: the number of worker processes used to serialize top-level nodes in parallel, if None or lower
+            than 2 no worker process is used
         """
+        gexf_version = GEXF_VERSIONS[version]
         self.gexf = ET.Element('gexf',
-                               {'xmlns': GEXF.versions[version]["NS_GEXF"],
-                                'xmlns:viz': GEXF.versions[version]["NS_VIZ"],
-                                'xmlns:xsi': GEXF.versions[version]["NS_XSI"],
-                                'xsi:schemaLocation': GEXF.versions[version]["SCHEMALOCATION"],
-                                'version': GEXF.versions[version]["VERSION"]})
+                               {'xmlns': gexf_version["NS_GEXF"],
+                                'xmlns:viz': gexf_version["NS_VIZ"],
+                                'xmlns:xsi': gexf_version["NS_XSI"],
+                                'xsi:schemaLocation': gexf_version["SCHEMALOCATION"],
+                                'version': gexf_version["VERSION"]})
         self.encoding = encoding
         self.prettyprint = prettyprint
         self.graph = ET.SubElement(self.gexf, 'graph', {'mode': 'static', 'defaultedgetype': 'directed'})
@@ -211,8 +381,18 @@ class GEXFWriter:
         self.edge_attributes = ET.SubElement(self.graph, 'attributes', {'class': 'edge'})
         self.nodes = ET.SubElement(self.graph, 'nodes')
         self.edges = ET.SubElement(self.graph, 'edges')
-        self.nodes_attr_set = set()
-        self.edges_attr_set = set()
+        # Types of the node and edge attributes found so far, declared in the GEXF file when it is written
+        self._node_attr_types: Dict[str, type] = dict()
+        self._edge_attr_types: Dict[str, type] = dict()
+        self._nodes_spool = tempfile.SpooledTemporaryFile(max_size=self._SPOOL_MAX_SIZE, mode='w+', encoding='utf-8')
+        self._edges_spool = tempfile.SpooledTemporaryFile(max_size=self._SPOOL_MAX_SIZE, mode='w+', encoding='utf-8')
+        self._pending_node: Optional[ET.Element] = None
+        # The <nodes> child elements of the pending nodes, to avoid scanning their children when adding new nodes
+        self._child_nodes_containers: Dict[ET.Element, ET.Element] = dict()
+        self._workers = workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+        # The serializations of top-level nodes submitted to the worker processes, in the order of the nodes
+        self._serializations: Deque[Future] = deque()
 
         # Make meta element a non-graph element
         # Also add lastmodifieddate as attribute, not tag
@@ -224,96 +404,250 @@ class GEXFWriter:
         self.gexf.append(meta_element)
 
     def add_node_attribute(self, attr_name: str, attr_type: type):
-        if attr_name not in self.nodes_attr_set:
-            ET.SubElement(self.node_attributes, 'attribute',
-                          {'id': attr_name,
-                           'title': attr_name.title(),
-                           'type': GEXF.types.setdefault(attr_type, 'string')})
-            self.nodes_attr_set.add(attr_name)
+        self._node_attr_types.setdefault(attr_name, attr_type)
 
     def add_edge_attribute(self, attr_name: str, attr_type: type):
-        if attr_name not in self.edges_attr_set:
-            ET.SubElement(self.edge_attributes, 'attribute',
-                          {'id': attr_name,
-                           'title': attr_name.title(),
-                           'type': GEXF.types.setdefault(attr_type, 'string')})
-            self.edges_attr_set.add(attr_name)
+        self._edge_attr_types.setdefault(attr_name, attr_type)
 
     def add_node(self, node_id: str,
                  label: str = None,
-                 color: Tuple[str, str, str, str] = None,
+                 color: Color = None,
                  size: str = None,
                  parent: ET.Element = None,
                  attributes: Dict[str, Any] = None) -> ET.Element:
 
         # Create node element
         if label:
-            node = ET.Element('node', {'id': node_id, 'label': label})
+            node = ET.Element(_NODE, {'id': node_id, 'label': label})
         else:
-            node = ET.Element('node', {'id': node_id})
+            node = ET.Element(_NODE, {'id': node_id})
 
         # Add custom attributes
         if attributes:
-            attvalues = ET.SubElement(node, 'attvalues')
-            for attr_name, value in attributes.items():
-                self.add_node_attribute(attr_name, type(value))
-                ET.SubElement(attvalues, 'attvalue', {'for': attr_name, 'value': str(value)})
+            self._add_node_attvalues(node, attributes)
 
         # Add visualization attributes
         if color:
-            ET.SubElement(node, 'viz:color', {'r': color[0], 'g': color[1], 'b': color[2], 'a': color[3]})
+            ET.SubElement(node, _VIZ_COLOR, _color_attributes(color))
         if size:
-            ET.SubElement(node, 'viz:size', {'value': size})
+            ET.SubElement(node, _VIZ_SIZE, {'value': size})
 
-        # Add node to the graph or to the parent node nodes
-        if parent is not None:
-            if not parent.find('nodes'):
-                ET.SubElement(parent, 'nodes')
-            parent.find('nodes').append(node)
-        else:
-            self.nodes.append(node)
+        self._attach_node(node, parent)
+        return node
 
+    def add_node_plain(self, node_id: str,
+                       parent: ET.Element = None,
+                       attributes: Dict[str, Any] = None) -> ET.Element:
+        """
+        Adds a node without label and visualization attributes, as done by :meth:`add_node` when none of them is given.
+        """
+        node = ET.Element(_NODE, {'id': node_id})
+        if attributes:
+            self._add_node_attvalues(node, attributes)
+        self._attach_node(node, parent)
         return node
 
     def add_edge(self, edge_id: str, source_id: str, target_id: str,
-                 color: Tuple[str, str, str, str] = None,
+                 color: Color = None,
                  thickness: str = None,
                  attributes: Dict[str, Any] = None):
 
-        # Create edge element
-        edge = ET.SubElement(self.edges, 'edge', {'id': edge_id, 'source': source_id, 'target': target_id})
-
-        # Add visualization attributes
-        if attributes:
-            attvalues = ET.SubElement(edge, 'attvalues')
-            for attr_id, value in attributes.items():
-                self.add_edge_attribute(attr_id, type(value))
-                ET.SubElement(attvalues, 'attvalue', {'for': attr_id, 'value': str(value)})
-
         # Add visualization attributes
+        viz_elements = []
         if color:
-            ET.SubElement(edge, 'viz:color', {'r': color[0], 'g': color[1], 'b': color[2], 'a': color[3]})
+            viz_elements.append(f'<{_VIZ_COLOR} ' + ' '.join(f'{name}="{_escape_attribute(value)}"'
+                                                         for name, value in _color_attributes(color).items()) + ' />')
         if thickness:
-            ET.SubElement(edge, 'viz:thickness', {'value': thickness})
+            viz_elements.append(f'<{_VIZ_THICKNESS} value="{_escape_attribute(thickness)}" />')
+
+        self._write_edge(edge_id, source_id, target_id, attributes, viz_elements)
+
+    def add_edge_plain(self, edge_id: str, source_id: str, target_id: str, attributes: Dict[str, Any] = None):
+        """
+        Adds an edge without visualization attributes, as done by :meth:`add_edge` when none of them is given.
+        """
+        self._write_edge(edge_id, source_id, target_id, attributes)
+
+    def write(self, file_path: str):
+        """
+        Writes the GEXF file in the given file path, including all the nodes and edges added to this writer.
+
+        :param file_path: the path of the file to write
+        """
+        self._flush_node()
+        self._drain_serializations(0)
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        self._declare_attributes()
+
+        # The spooled nodes and edges are copied in place of the placeholder text of the empty container elements
+        placeholders = []
+        for container, spool in [(self.nodes, self._nodes_spool), (self.edges, self._edges_spool)]:
+            if spool.tell():
+                container.text = f"@{container.tag}-{id(spool)}@"
+                placeholders.append((container.text, spool))
+
+        if self.prettyprint:
+            ET.indent(self.gexf)
+            self.gexf.tail = "\n"
+        document = ET.tostring(self.gexf, encoding='unicode')
+        closing_indentation = "\n" + "  " * (self._ELEMENT_LEVEL - 1) if self.prettyprint else ""
+
+        with open(file_path, 'w', buffering=self._WRITE_BUFFER_SIZE, encoding=self.encoding,
+                  errors='xmlcharrefreplace') as file:
+            file.write(f"<?xml version='1.0' encoding='{self.encoding}'?>\n")
+            for placeholder, spool in placeholders:
+                before, document = document.split(placeholder, 1)
+                file.write(before)
+                spool.seek(0)
+                shutil.copyfileobj(spool, file, self._WRITE_BUFFER_SIZE)
+                file.write(closing_indentation)
+            file.write(document)
+
+        # The spool files are kept open, so that further nodes and edges can be added and the file written again
+        for container, spool in [(self.nodes, self._nodes_spool), (self.edges, self._edges_spool)]:
+            container.text = None
+            spool.seek(0, io.SEEK_END)
+
+    def close(self):
+        """
+        Releases the spool files and the worker processes of this writer, after which no node or edge can be added and
+        the file can no longer be written.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+        self._serializations.clear()
+        self._nodes_spool.close()
+        self._edges_spool.close()
+
+    def __enter__(self) -> 'GEXFWriter':
+        return self
 
-    def write(self, file_path):
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _declare_attributes(self):
+        """
+        Adds the declarations of all the node and edge attributes found while adding nodes and edges to the attributes
+        elements, in the order in which they were found, replacing the declarations of any previous write.
+        """
+        for attributes, attr_types in [(self.node_attributes, self._node_attr_types),
+                                       (self.edge_attributes, self._edge_attr_types)]:
+            del attributes[:]
+            for attr_name, attr_type in attr_types.items():
+                ET.SubElement(attributes, 'attribute',
+                              {'id': attr_name,
+                               'title': attr_name.title(),
+                               'type': GEXF_TYPES.get(attr_type, _DEFAULT_GEXF_TYPE)})
+
+    def _add_node_attvalues(self, node: ET.Element, attributes: Dict[str, Any]):
+        attvalues = ET.SubElement(node, _ATTVALUES)
+        node_attr_types = self._node_attr_types
+        sub_element = ET.SubElement
+        for attr_name, value in attributes.items():
+            if attr_name not in node_attr_types:
+                node_attr_types[attr_name] = type(value)
+            sub_element(attvalues, _ATTVALUE,
+                        {'for': attr_name, 'value': value if value.__class__ is str else str(value)})
+
+    def _write_edge(self, edge_id: str, source_id: str, target_id: str,
+                    attributes: Optional[Dict[str, Any]],
+                    viz_elements: List[str] = ()):
+        """
+        Serializes an edge into the edges spool file.
+        Edges have all the same flat structure, so they are formatted directly as strings, producing the same output
+        as the serialization of the corresponding elements.
+
+        :param edge_id: the id of the edge
+        :param source_id: the id of the source node
+        :param target_id: the id of the target node
+        :param attributes: the custom attributes of the edge
+        :param viz_elements: the serialized visualization elements of the edge
+        """
         if self.prettyprint:
-            self._indent(self.gexf)
-        tree = ET.ElementTree(self.gexf)
-        tree.write(file_path, encoding=self.encoding, xml_declaration=True)
-
-    def _indent(self, elem, level=0):
-        # in-place prettyprint formatter
-        i = "\n" + "  " * level
-        if len(elem):
-            if not elem.text or not elem.text.strip():
-                elem.text = i + "  "
-            if not elem.tail or not elem.tail.strip():
-                elem.tail = i
-            for elem in elem:
-                self._indent(elem, level + 1)
-            if not elem.tail or not elem.tail.strip():
-                elem.tail = i
+            edge_indent = "\n" + "  " * self._ELEMENT_LEVEL
+            child_indent = edge_indent + "  "
+            attvalue_indent = child_indent + "  "
+        else:
+            edge_indent = child_indent = attvalue_indent = ""
+
+        parts = [f'{edge_indent}<{_EDGE} id="{_escape_attribute(edge_id)}" source="{_escape_attribute(source_id)}" '
+                 f'target="{_escape_attribute(target_id)}"']
+        if not attributes and not viz_elements:
+            parts.append(' />')
+        else:
+            parts.append('>')
+            if attributes:
+                parts.append(f'{child_indent}<{_ATTVALUES}>')
+                edge_attr_types = self._edge_attr_types
+                for attr_id, value in attributes.items():
+                    if attr_id not in edge_attr_types:
+                        edge_attr_types[attr_id] = type(value)
+                    parts.append(f'{attvalue_indent}<{_ATTVALUE} for="{_escape_attribute(attr_id)}" '
+                                 f'value="{_escape_attribute(value if value.__class__ is str else str(value))}" />')
+                parts.append(f'{child_indent}</{_ATTVALUES}>')
+            for viz_element in viz_elements:
+                parts.append(child_indent + viz_element)
+            parts.append(f'{edge_indent}</{_EDGE}>')
+
+        self._edges_spool.write(''.join(parts))
+
+    def _attach_node(self, node: ET.Element, parent: Optional[ET.Element]):
+        """
+        Adds the given node to the nodes of its parent node, or serializes the previous top-level node and keeps the
+        given one pending until all its descendants are added.
+        """
+        if parent is not None:
+            container = self._child_nodes_containers.get(parent)
+            if container is None:
+                container = self._child_nodes_containers[parent] = ET.SubElement(parent, _NODES)
+            container.append(node)
         else:
-            if level and (not elem.tail or not elem.tail.strip()):
-                elem.tail = i
+            self._flush_node()
+            self._pending_node = node
+
+    def _flush_node(self):
+        """
+        Serializes the pending top-level node, along with all its descendants, into the nodes spool file.
+        """
+        if self._pending_node is not None:
+            if self._workers is not None and self._workers > 1:
+                if self._executor is None:
+                    self._executor = ProcessPoolExecutor(max_workers=self._workers)
+                self._serializations.append(self._executor.submit(_serialize_element, self._pending_node,
+                                                                  self.prettyprint, self._ELEMENT_LEVEL))
+                self._drain_serializations(self._workers * self._MAX_PENDING_SERIALIZATIONS)
+            else:
+                self._nodes_spool.write(_serialize_element(self._pending_node, self.prettyprint, self._ELEMENT_LEVEL))
+            self._pending_node = None
+            self._child_nodes_containers.clear()
+
+    def _drain_serializations(self, max_pending: int):
+        """
+        Buffers the serializations of top-level nodes completed by the worker processes into the nodes spool file,
+        in the order of the nodes, waiting for them until at most the given number of serializations is pending.
+
+        :param max_pending: the maximum number of serializations left pending
+        """
+        serializations = self._serializations
+        while serializations and (len(serializations) > max_pending or serializations[0].done()):
+            self._nodes_spool.write(serializations.popleft().result())
+
+
+def _serialize_element(element: ET.Element, prettyprint: bool, level: int) -> str:
+    """
+    Serializes the given node element, indenting it according to its level in the GEXF file if pretty printing is
+    enabled.
+    This is a module-level function so that it can be run by the worker processes of a writer.
+
+    :param element: the node element to serialize
+    :param prettyprint: if True, the element is indented
+    :param level: the level of the element in the GEXF file
+    :return: the serialized element
+    """
+    if prettyprint:
+        ET.indent(element, level=level)
+        return "\n" + "  " * level + ET.tostring(element, encoding='unicode')
+    return ET.tostring(element, encoding='unicode')
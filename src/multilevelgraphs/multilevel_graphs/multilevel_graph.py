@@ -110,10 +110,10 @@ class MultilevelGraph:
         The natural transformation produced by this method maintains keys and attributes of the nodes and edges
         of the original graph.
         """
-        vs = dict(map(lambda c: (c[0], Supernode(key=c[0], level=0, **c[1])), graph.nodes(data=True)))
-        es = dict(map(lambda t: ((t[0], t[1]), Superedge(tail=vs[t[0]], head=vs[t[1]], level=0, **t[2])),
-                      graph.edges(data=True)))
-        return DecGraph(vs, es)
+        vs = {key: Supernode(key=key, level=0, **attr) for key, attr in graph.nodes(data=True)}
+        es = {(tail, head): Superedge(tail=vs[tail], head=vs[head], level=0, **attr)
+              for tail, head, attr in graph.edges(data=True)}
+        return DecGraph(vs, es, copy=False)
 
     def build_contraction_schemes(self, upper_level: int = None):
         """
@@ -216,8 +216,8 @@ class MultilevelGraph:
         """
         if 1 <= level <= self.height():
             self.build_contraction_schemes(level)
-            return set([c_set.copy() for c_set in
-                        self._contraction_schemes[level-1].component_sets_table.get_all_c_sets()])
+            return {c_set.copy() for c_set in
+                    self._contraction_schemes[level-1].component_sets_table.get_all_c_sets()}
         else:
             return None
 
@@ -333,10 +333,20 @@ class MultilevelGraph:
 
         :param graph: the NetworkX graph to be merged into the base graph
         """
-        for node in graph.nodes(data=True):
-            self.add_node(node[0], **node[1])
-        for edge in graph.edges(data=True):
-            self.add_edge(edge[0], edge[1], **edge[2])
+        nodes, edges = self._dec_graph_0.V, self._dec_graph_0.E
+        new_nodes = [Supernode(key, level=0, **attr) for key, attr in graph.nodes(data=True) if key not in nodes]
+        for new_node in new_nodes:
+            self._dec_graph_0.add_node(new_node)
+
+        new_edges = [Superedge(nodes[tail_key], nodes[head_key], level=0, **attr)
+                     for tail_key, head_key, attr in graph.edges(data=True) if (tail_key, head_key) not in edges]
+        for new_edge in new_edges:
+            self._dec_graph_0.add_edge(new_edge)
+
+        if new_nodes or new_edges:
+            self._base_update_quadruple.add_v_plus_from(new_nodes)
+            self._base_update_quadruple.add_e_plus_from(new_edges)
+            self._invalidate_all_schemes()
 
     def _invalidate_all_schemes(self):
         for scheme in self._contraction_schemes:
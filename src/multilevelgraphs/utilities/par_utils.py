@@ -1,16 +1,31 @@
+from concurrent.futures import ProcessPoolExecutor
 from multiprocessing.pool import ThreadPool
 from functools import reduce
+from typing import Optional
 
 
 class ParUtils:
 
+    # Inputs with fewer items are mapped sequentially, since dispatching them to a pool costs more than the work
+    SEQUENTIAL_THRESHOLD = 64
+
     @staticmethod
-    def par_map(func, iterable):
+    def par_map(func, iterable, workers: Optional[int] = None):
         """
         Parallel map function.
-        """
+        Inputs with fewer than ``SEQUENTIAL_THRESHOLD`` items are mapped sequentially.
+        If workers is greater than 1, the items are mapped by that many worker processes in chunks of about a quarter
+        of the items per worker, so the function and the items must be picklable. Otherwise, they are mapped by a pool
+        of threads.
+        """
+        items = list(iterable)
+        if len(items) < ParUtils.SEQUENTIAL_THRESHOLD:
+            return list(map(func, items))
+        if workers is not None and workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(func, items, chunksize=max(1, -(-len(items) // (workers * 4)))))
         with ThreadPool() as p:
-            return p.map(func, iterable)
+            return p.map(func, items)
 
     @staticmethod
     def par_reduce(associative_func, iterable):
@@ -0,0 +1,134 @@
+import unittest
+
+from multilevelgraphs import Supernode, ComponentSet
+from multilevelgraphs.contraction_schemes import CompTable
+
+
+class CompTableTest(unittest.TestCase):
+
+    def setUp(self):
+        self.nodes = [Supernode(i, 0) for i in range(5)]
+
+    def test_add_maximal_set(self):
+        table = CompTable(maximal=True)
+        table.add_set(ComponentSet(1, {self.nodes[0], self.nodes[1]}), maximal=True)
+        table.add_set(ComponentSet(2, {self.nodes[0], self.nodes[1], self.nodes[2]}), maximal=True)
+        table.add_set(ComponentSet(3, {self.nodes[1], self.nodes[2]}), maximal=True)
+        table.add_set(ComponentSet(4, {self.nodes[0], self.nodes[1], self.nodes[2]}), maximal=True)
+
+        self.assertEqual({2}, {c_set.key for c_set in table.get_all_c_sets()})
+
+    def test_add_maximal_set_after_removals(self):
+        table = CompTable(maximal=True)
+        c_sets = [ComponentSet(1, {self.nodes[0], self.nodes[1]}),
+                  ComponentSet(2, {self.nodes[2], self.nodes[3]}),
+                  ComponentSet(3, {self.nodes[3], self.nodes[4]})]
+        for c_set in c_sets:
+            table.add_set(c_set, maximal=True)
+        table.remove_set(c_sets[0])
+        del table[self.nodes[0]]
+
+        table.add_set(ComponentSet(4, {self.nodes[1], self.nodes[2], self.nodes[3]}), maximal=True)
+        table.add_set(ComponentSet(5, {self.nodes[1], self.nodes[3]}), maximal=True)
+        self.assertEqual({3, 4}, {c_set.key for c_set in table.get_all_c_sets()})
+        self.assertEqual({4}, {c_set.key for c_set in table[self.nodes[2]]})
+
+    def test_add_sets(self):
+        table = CompTable()
+        table.add_sets([ComponentSet(1, {self.nodes[0], self.nodes[1]}), ComponentSet(2, {self.nodes[2]})])
+        self.assertEqual({1, 2}, {c_set.key for c_set in table.get_all_c_sets()})
+        self.assertEqual(set(self.nodes[:3]), table.modified)
+
+        table.add_sets([ComponentSet(3, {self.nodes[0], self.nodes[1], self.nodes[2]}),
+                        ComponentSet(4, {self.nodes[3]})], maximal=True)
+        self.assertEqual({3, 4}, {c_set.key for c_set in table.get_all_c_sets()})
+
+    def test_find_set(self):
+        table = CompTable([ComponentSet(1, {self.nodes[0], self.nodes[1]}),
+                           ComponentSet(2, {self.nodes[2]})])
+
+        self.assertEqual(1, table.find_set({self.nodes[1], self.nodes[0]}).key)
+        self.assertEqual(2, table.find_set(frozenset({self.nodes[2]})).key)
+        self.assertIsNone(table.find_set({self.nodes[0]}))
+
+        table.remove_set(table.find_set({self.nodes[2]}))
+        self.assertIsNone(table.find_set({self.nodes[2]}))
+
+        # Component sets modified after their addition are not found by their previous supernodes
+        c_set = table.find_set({self.nodes[0], self.nodes[1]})
+        c_set.add(self.nodes[3])
+        self.assertIsNone(table.find_set({self.nodes[0], self.nodes[1]}))
+
+    def test_fingerprints_built_on_first_lookup(self):
+        table = CompTable([ComponentSet(1, {self.nodes[0], self.nodes[1]})])
+        c_set = ComponentSet(3, {self.nodes[3]})
+        table.add_set(ComponentSet(2, {self.nodes[2]}))
+        table.add_set(c_set)
+        table.remove_set(c_set)
+        self.assertIsNone(table._fingerprints)
+
+        self.assertEqual(2, table.find_set({self.nodes[2]}).key)
+        table.add_set(ComponentSet(4, {self.nodes[4]}))
+        self.assertEqual({frozenset({self.nodes[0], self.nodes[1]}), frozenset({self.nodes[2]}),
+                          frozenset({self.nodes[4]})}, set(table._fingerprints))
+
+    def test_fingerprints_forget_untracked_sets(self):
+        table = CompTable([ComponentSet(1, {self.nodes[0], self.nodes[1]})])
+        table.find_set({self.nodes[0]})
+        for i in range(2, 100):
+            table[self.nodes[2]] = {ComponentSet(i, {self.nodes[2]})}
+            table.add_set(ComponentSet(-i, {self.nodes[3]}))
+            del table[self.nodes[3]]
+
+        self.assertEqual(2, len(table.get_all_c_sets()))
+        self.assertEqual(len(table.get_all_c_sets()), len(table._fingerprints))
+        self.assertEqual(table.get_all_c_sets(), set(table._fingerprints.values()))
+
+    def test_add_to_and_remove_from_set(self):
+        c_set = ComponentSet(1, {self.nodes[0], self.nodes[1]})
+        table = CompTable([c_set], maximal=True)
+        table.modified.clear()
+
+        table.add_to_set(c_set, self.nodes[2])
+        self.assertEqual({self.nodes[2]}, table.modified)
+        self.assertEqual({c_set}, table[self.nodes[2]])
+        self.assertIs(c_set, table.find_set({self.nodes[0], self.nodes[1], self.nodes[2]}))
+        table.add_set(ComponentSet(2, {self.nodes[1], self.nodes[2]}), maximal=True)
+        self.assertEqual({1}, {c_set.key for c_set in table.get_all_c_sets()})
+
+        table.remove_from_set(c_set, self.nodes[0])
+        self.assertEqual(set(), table[self.nodes[0]])
+        self.assertIs(c_set, table.find_set({self.nodes[1], self.nodes[2]}))
+        table.add_singletons(iter(range(10, 20)).__next__)
+        self.assertEqual({self.nodes[0]}, set(table.only_set(self.nodes[0])))
+
+    def test_merge_sets(self):
+        c_sets = [ComponentSet(1, {self.nodes[0], self.nodes[1]}), ComponentSet(2, {self.nodes[2], self.nodes[3]})]
+        table = CompTable(c_sets, maximal=True)
+        table.modified.clear()
+
+        table.merge_sets(c_sets[1], c_sets[0])
+        self.assertEqual({self.nodes[2], self.nodes[3]}, table.modified)
+        self.assertEqual({1}, {c_set.key for c_set in table.get_all_c_sets()})
+        self.assertTrue(all(table.only_set(node) is c_sets[0] for node in self.nodes[:4]))
+        self.assertIs(c_sets[0], table.find_set(self.nodes[:4]))
+
+        # Subsets of the merged component set are no longer maximal
+        table.add_set(ComponentSet(3, {self.nodes[1], self.nodes[2]}), maximal=True)
+        self.assertEqual({1}, {c_set.key for c_set in table.get_all_c_sets()})
+
+    def test_clear_modified(self):
+        c_set = ComponentSet(1, {self.nodes[0]})
+        table = CompTable([c_set, ComponentSet(2, {self.nodes[1]})])
+        table.remove_set(c_set)
+        del table[self.nodes[1]]
+
+        table.clear_modified()
+        self.assertEqual(set(), table.modified)
+        self.assertEqual(set(), table._emptied)
+        table.add_singletons(iter(range(10, 20)).__next__)
+        self.assertEqual(set(), table.get_all_c_sets())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,9 @@
 import unittest
+import networkx as nx
 
-from multilevelgraphs import DecGraph, Supernode, Superedge, CyclesContractionScheme
+from multilevelgraphs import DecGraph, Supernode, Superedge, CyclesContractionScheme, MultilevelGraph
 from multilevelgraphs.contraction_schemes import UpdateQuadruple
+from multilevelgraphs.dec_graphs import simple_cycles
 
 
 class CycleContractionSchemeTest(unittest.TestCase):
@@ -37,6 +39,44 @@ class CycleContractionSchemeTest(unittest.TestCase):
                          contracted_graph.E[(sample_graph.V[1].supernode.key, sample_graph.V[3].supernode.key)].dec)
         self.assertEqual(sample_graph, contracted_graph.complete_decontraction())
 
+    def test_contract_with_workers(self):
+        sample_graph = self._sample_dec_graph()
+        sample_graph.add_node(Supernode(6, level=0, weight=5))
+        sample_graph.add_node(Supernode(7, level=0, weight=5))
+        sample_graph.add_edge(Superedge(sample_graph.V[6], sample_graph.V[7]))
+        sample_graph.add_edge(Superedge(sample_graph.V[7], sample_graph.V[6]))
+        sample_graph.add_edge(Superedge(sample_graph.V[5], sample_graph.V[6]))
+        sample_graph.add_node(Supernode(8, level=0, weight=5))
+        sample_graph.add_edge(Superedge(sample_graph.V[8], sample_graph.V[8]))
+        sample_graph.add_edge(Superedge(sample_graph.V[7], sample_graph.V[7]))
+
+        for maximal in [True, False]:
+            expected = CyclesContractionScheme(maximal=maximal).contraction_function(sample_graph)
+            scheme = CyclesContractionScheme(maximal=maximal, workers=2)
+            found = scheme.contraction_function(sample_graph)
+            self.assertEqual({frozenset(c_set) for c_set in expected.get_all_c_sets()},
+                             {frozenset(c_set) for c_set in found.get_all_c_sets()})
+            self.assertEqual(2, scheme.clone()._workers)
+
+    def test_simple_cycles_with_workers(self):
+        sample_graph = self._sample_dec_graph()
+        sample_graph.add_edge(Superedge(sample_graph.V[5], sample_graph.V[5]))
+
+        expected = {frozenset(cycle) for cycle in simple_cycles(sample_graph)}
+        found = list(simple_cycles(sample_graph, workers=2))
+        self.assertEqual(len(expected), len(found))
+        self.assertEqual(expected, {frozenset(cycle) for cycle in found})
+        self.assertEqual((sample_graph.V[5],), found[0])
+
+    def test_simple_cycles_backends(self):
+        sample_graph = self._sample_dec_graph()
+        sample_graph.add_edge(Superedge(sample_graph.V[5], sample_graph.V[5]))
+
+        # The NetworkX implementation is used when rustworkx is not installed
+        self.assertEqual({frozenset(cycle) for cycle in simple_cycles(sample_graph)},
+                         {frozenset(cycle) for cycle in simple_cycles(sample_graph, backend='rustworkx')})
+        self.assertRaises(ValueError, list, simple_cycles(sample_graph, backend='igraph'))
+
     def test_contract_with_supernode_attr_function(self):
         def supernode_attr_function(supernode: Supernode):
             return {"weight": sum([node['weight'] for node in supernode.dec.nodes()]) + 1}
@@ -192,6 +232,37 @@ class CycleContractionSchemeTest(unittest.TestCase):
                          {frozenset(c_set) for c_set in scheme.component_sets_table.get_all_c_sets()})
         self.assertEqual(sample_graph, scheme.dec_graph.complete_decontraction())
 
+    def test_update_removed_edge_shared_by_maximal_cycles(self):
+        graph = nx.DiGraph([(0, 1), (1, 2), (2, 3), (3, 0), (2, 4), (4, 0), (2, 1)])
+        dec_graph = MultilevelGraph.natural_transformation(graph)
+        scheme = CyclesContractionScheme(maximal=True)
+        scheme.contract(dec_graph)
+
+        # Both maximal cycles are broken, and their common sub-cycle becomes maximal only after both are removed
+        removed_edge = dec_graph.E[(0, 1)]
+        dec_graph.remove_edge(removed_edge)
+        scheme.update(UpdateQuadruple(v_plus=set(), v_minus=set(), e_plus=set(), e_minus={removed_edge}))
+
+        self.assertEqual({frozenset({dec_graph.V[1], dec_graph.V[2]}), frozenset({dec_graph.V[0]}),
+                          frozenset({dec_graph.V[3]}), frozenset({dec_graph.V[4]})},
+                         {frozenset(c_set) for c_set in scheme.component_sets_table.get_all_c_sets()})
+        self.assertEqual(dec_graph, scheme.dec_graph.complete_decontraction())
+
+    def test_update_removed_edge_non_maximal(self):
+        sample_graph = self._sample_dec_graph()
+        scheme = CyclesContractionScheme(maximal=False)
+        scheme.contract(sample_graph)
+
+        removed_edge = sample_graph.E[(2, 4)]
+        sample_graph.remove_edge(removed_edge)
+        quadruple = UpdateQuadruple(v_plus=set(), v_minus=set(), e_plus=set(), e_minus={removed_edge})
+        scheme.update(quadruple)
+
+        self.assertEqual({frozenset({sample_graph.V[1], sample_graph.V[2], sample_graph.V[3]}),
+                          frozenset({sample_graph.V[3], sample_graph.V[4], sample_graph.V[5]})},
+                         {frozenset(c_set) for c_set in scheme.component_sets_table.get_all_c_sets()})
+        self.assertEqual(sample_graph, scheme.dec_graph.complete_decontraction())
+
     def test_update_removed_node_and_edge(self):
         sample_graph = self._sample_dec_graph()
         scheme = CyclesContractionScheme(maximal=True)
@@ -282,6 +353,47 @@ class CycleContractionSchemeTest(unittest.TestCase):
         self.assertEqual({60}, {c_set['weight'] for c_set in scheme.component_sets_table[sample_graph.V[5]]})
         self.assertEqual({60}, {c_set['weight'] for c_set in sample_graph.V[1].supernode.component_sets})
 
+    def test_scc_cache_after_updates(self):
+        sample_graph = self._sample_dec_graph()
+        scheme = CyclesContractionScheme(maximal=True)
+        scheme.contract(sample_graph)
+
+        removed_edge = sample_graph.E[(4, 3)]
+        sample_graph.remove_edge(removed_edge)
+        new_node = Supernode(6, level=0, weight=10)
+        sample_graph.add_node(new_node)
+        new_edge = Superedge(sample_graph.V[5], sample_graph.V[6], weight=5)
+        sample_graph.add_edge(new_edge)
+        scheme.update(UpdateQuadruple(v_plus={new_node}, e_plus={new_edge}, e_minus={removed_edge}))
+
+        self.assertEqual({frozenset(scc) for scc in nx.strongly_connected_components(sample_graph.graph())},
+                         {frozenset(scc) for scc in scheme._scc_members.values()})
+
+        new_edge = Superedge(sample_graph.V[6], sample_graph.V[3], weight=5)
+        sample_graph.add_edge(new_edge)
+        scheme.update(UpdateQuadruple(e_plus={new_edge}))
+
+        self.assertEqual({frozenset({1, 2, 3, 5, 6}), frozenset({4})},
+                         {frozenset(scc) for scc in scheme._scc_members.values()})
+        self.assertEqual({frozenset({sample_graph.V[1], sample_graph.V[2], sample_graph.V[3]}),
+                          frozenset({sample_graph.V[3], sample_graph.V[5], sample_graph.V[6]}),
+                          frozenset({sample_graph.V[4]})},
+                         {frozenset(c_set) for c_set in scheme.component_sets_table.get_all_c_sets()})
+
+    def test_cycle_search_with_reused_state(self):
+        graph = self._sample_dec_graph().graph()
+        state = CyclesContractionScheme(maximal=True)._johnson_state
+        for edge in graph.edges():
+            expected = {frozenset(cycle) for cycle in
+                        nx.algorithms.cycles._johnson_cycle_search(graph, list(edge))}
+            found = {frozenset(cycle) for cycle in CyclesContractionScheme.cycle_search(graph, list(edge), state)}
+            self.assertEqual(expected, found)
+
+        # An abandoned search does not affect the following ones
+        next(CyclesContractionScheme.cycle_search(graph, [3, 5], state))
+        found = {frozenset(cycle) for cycle in CyclesContractionScheme.cycle_search(graph, [1], state)}
+        self.assertEqual({frozenset({1, 2, 3}), frozenset({1, 2, 4, 3})}, found)
+
     @staticmethod
     def _sample_dec_graph() -> DecGraph:
         graph = DecGraph()
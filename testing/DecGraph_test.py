@@ -1,5 +1,8 @@
+import pickle
 import unittest
-from multilevelgraphs import DecGraph, Supernode, Superedge
+import networkx as nx
+from multilevelgraphs import DecGraph, Supernode, Superedge, MultilevelGraph, CliquesContractionScheme
+from multilevelgraphs.dec_graphs import maximal_cliques, strongly_connected_components
 
 
 class DecGraphTest(unittest.TestCase):
@@ -106,6 +109,31 @@ class DecGraphTest(unittest.TestCase):
         self.assertEqual(2, len(self.test_superedges_1[0].dec))
         self.assertEqual(set(self.test_superedges_0[4:6]), self.test_superedges_1[0].dec)
 
+    def test_precomputed_hashes(self):
+        self.assertEqual(hash((3, 0)), hash(self.test_supernodes_0[3]))
+        self.assertNotEqual(hash(Supernode(3, 0)), hash(Supernode(3, 1)))
+        self.assertEqual(hash((self.test_supernodes_0[0], self.test_supernodes_0[1])), hash(self.test_superedges_0[0]))
+
+        # Precomputed hashes are not pickled, but recomputed when unpickling
+        supernode, superedge = pickle.loads(pickle.dumps((self.test_supernodes_0[3], self.test_superedges_0[0])))
+        self.assertEqual(hash(self.test_supernodes_0[3]), hash(supernode))
+        self.assertEqual(hash(self.test_superedges_0[0]), hash(superedge))
+        self.assertIn(supernode, {self.test_supernodes_0[3]})
+
+    def test_size(self):
+        self._build_test_graph_1()
+        self.assertEqual(1, self.test_supernodes_0[0].size())
+        self.assertEqual(2, self.test_supernodes_2[0].size())
+        self.assertEqual(4, self.test_supernodes_2[1].size())
+        self.assertEqual(1, self.test_superedges_0[1].size())
+        self.assertEqual(2, self.test_superedges_2[0].size())
+
+        # Sizes reflect changes made directly to the decontractible graphs of the descendants
+        self.test_supernodes_1[0].dec.add_node(self.test_supernodes_0[6])
+        self.assertEqual(3, self.test_supernodes_2[0].size())
+        self.test_supernodes_1[0].dec.remove_nodes_from([self.test_supernodes_0[0], self.test_supernodes_0[6]])
+        self.assertEqual(1, self.test_supernodes_2[0].size())
+
     def test_superedge_height(self):
         self.assertEqual(0, self.test_superedges_0[0].height())
         self.assertEqual(0, self.test_superedges_1[0].height())
@@ -193,6 +221,25 @@ class DecGraphTest(unittest.TestCase):
         dec_graph = self._build_test_graph_1()
         self.assertEqual(2, dec_graph.height())
 
+    def test_complete_decontraction_duplicate_and_missing_nodes(self):
+        # As with add_node, the last supernode with a given key is kept
+        duplicate = Supernode(0, 0)
+        self.test_supernodes_1[0].add_node(self.test_supernodes_0[0])
+        self.test_supernodes_1[1].add_node(duplicate)
+        self.test_supernodes_1[1].add_node(self.test_supernodes_0[1])
+        dec_graph = DecGraph()
+        dec_graph.add_node(self.test_supernodes_1[0])
+        dec_graph.add_node(self.test_supernodes_1[1])
+        self.assertIs(duplicate, dec_graph.complete_decontraction().V[0])
+
+        # As with add_edge, superedges whose endpoints are not among the supernodes are rejected
+        self.test_supernodes_1[1].dec.remove_node(duplicate)
+        self.test_superedges_1[0].add_edge(self.test_superedges_0[0])
+        dec_graph.add_edge(self.test_superedges_1[0])
+        self.assertEqual({0, 1}, set(dec_graph.complete_decontraction().V))
+        self.test_supernodes_1[1].dec.remove_node(self.test_supernodes_0[1])
+        self.assertRaises(ValueError, dec_graph.complete_decontraction)
+
     def test_complete_decontraction(self):
         dec_graph = self._build_test_graph_1()
         dec_graph_decontraction = dec_graph.complete_decontraction()
@@ -218,6 +265,43 @@ class DecGraphTest(unittest.TestCase):
         self.assertEqual(dec_graph.E[(0, 1)], dec_graph_copy.E[(0, 1)])
         self.assertNotEqual(id(dec_graph.E[(0, 1)]), id(dec_graph_copy.E[(0, 1)]))
 
+    def test_deepcopy_component_sets(self):
+        # Two triangles sharing the node 2, whose supernode belongs to both cliques
+        graph = nx.Graph([(0, 1), (1, 2), (2, 0), (2, 3), (3, 4), (4, 2)]).to_directed()
+        dec_graph = MultilevelGraph(graph, [CliquesContractionScheme()]).get_graph(1, deepcopy=False)
+        dec_graph_copy = dec_graph.deepcopy()
+
+        # Component sets shared among supernodes are copied once and refer to the copied subnodes
+        c_sets = {id(c_set): c_set for node in dec_graph_copy.nodes() for c_set in node.component_sets}
+        self.assertEqual(2, len(c_sets))
+        subnodes = dec_graph_copy.complete_decontraction().V
+        self.assertTrue(all(subnodes[subnode.key] is subnode for c_set in c_sets.values() for subnode in c_set))
+        self.assertTrue(all(subnode is not dec_graph.complete_decontraction().V[subnode.key]
+                            for c_set in c_sets.values() for subnode in c_set))
+
+    def test_equality(self):
+        def graph(level: int, edges) -> DecGraph:
+            nodes = {i: Supernode(i, level) for i in range(3)}
+            return DecGraph(nodes, {(t, h): Superedge(nodes[t], nodes[h]) for t, h in edges})
+
+        self.assertEqual(graph(0, [(0, 1), (1, 2)]), graph(0, [(1, 2), (0, 1)]))
+        self.assertNotEqual(graph(0, [(0, 1), (1, 2)]), graph(0, [(0, 1), (2, 1)]))
+        self.assertNotEqual(graph(0, [(0, 1)]), graph(1, [(0, 1)]))
+
+        other = graph(0, [(0, 1)])
+        other.V[2].dec.add_node(Supernode(3))
+        self.assertNotEqual(graph(0, [(0, 1)]), other)
+
+    def test_init_without_copy(self):
+        nodes = {i: self.test_supernodes_0[i] for i in range(2)}
+        edges = {(0, 1): self.test_superedges_0[0]}
+        self.assertIsNot(nodes, DecGraph(nodes, edges).V)
+
+        dec_graph = DecGraph(nodes, edges, copy=False)
+        self.assertIs(nodes, dec_graph.V)
+        self.assertIs(edges, dec_graph.E)
+        self.assertEqual({0}, set(dec_graph.graph(ref=True).predecessors(1)))
+
     def test_in_edges(self):
         dec_graph = self._build_test_graph_1()
         self.assertEqual(0, len(dec_graph.in_edges(self.test_supernodes_2[0])))
@@ -230,6 +314,137 @@ class DecGraphTest(unittest.TestCase):
         self.assertEqual(0, len(dec_graph.out_edges(self.test_supernodes_2[1])))
         self.assertEqual({self.test_superedges_2[0]}, dec_graph.out_edges(self.test_supernodes_2[0]))
 
+    def test_has_node_and_edge(self):
+        dec_graph = self._build_test_graph_1()
+        self.assertTrue(dec_graph.has_node(self.test_supernodes_2[0]))
+        self.assertTrue(dec_graph.has_node(Supernode(1, 2)))
+        self.assertFalse(dec_graph.has_node(Supernode(1, 1)))
+        self.assertFalse(dec_graph.has_node(Supernode(2, 2)))
+        self.assertTrue(dec_graph.has_edge(self.test_superedges_2[0]))
+        self.assertFalse(dec_graph.has_edge(Superedge(self.test_supernodes_2[1], self.test_supernodes_2[0])))
+        self.assertEqual(Supernode(1, 1) in dec_graph.nodes(), dec_graph.has_node(Supernode(1, 1)))
+
+    def test_remove_node_with_self_loop(self):
+        dec_graph = DecGraph()
+        nodes = self.test_supernodes_0[:3]
+        for node in nodes:
+            dec_graph.add_node(node)
+        for tail, head in [(0, 1), (1, 0), (1, 1), (1, 2), (2, 0)]:
+            dec_graph.add_edge(Superedge(nodes[tail], nodes[head]))
+
+        dec_graph.remove_node(nodes[1])
+        self.assertEqual({0, 2}, set(dec_graph.V))
+        self.assertEqual({(2, 0)}, set(dec_graph.E))
+        self.assertEqual({(2, 0)}, set(dec_graph.graph(ref=True).edges()))
+
+    def test_remove_nodes_from(self):
+        dec_graph = DecGraph()
+        nodes = self.test_supernodes_0[:4]
+        for node in nodes:
+            dec_graph.add_node(node)
+        for tail, head in [(0, 1), (1, 2), (2, 1), (2, 3), (3, 3)]:
+            dec_graph.add_edge(Superedge(nodes[tail], nodes[head]))
+        dec_graph.compact_adjacency()
+
+        dec_graph.remove_nodes_from([nodes[1], nodes[3]])
+        self.assertEqual({0, 2}, set(dec_graph.V))
+        self.assertEqual(dict(), dec_graph.E)
+        self.assertEqual([[], []], [list(dec_graph.compact_adjacency().successors(i)) for i in range(2)])
+
+    def test_compact_adjacency(self):
+        dec_graph = DecGraph()
+        for i in range(3):
+            dec_graph.add_node(self.test_supernodes_0[i])
+        dec_graph.add_edge(self.test_superedges_0[0])
+        dec_graph.add_edge(self.test_superedges_0[1])
+
+        adjacency = dec_graph.compact_adjacency()
+        self.assertIs(adjacency, dec_graph.compact_adjacency())
+        self.assertEqual({self.test_supernodes_0[1], self.test_supernodes_0[2]},
+                         {adjacency.nodes[i] for i in adjacency.successors(adjacency.index[0])})
+        self.assertEqual([adjacency.index[0]], list(adjacency.predecessors(adjacency.index[2])))
+        self.assertEqual(0, len(adjacency.successors(adjacency.index[1])))
+
+        dec_graph.remove_edge(self.test_superedges_0[1])
+        adjacency = dec_graph.compact_adjacency()
+        self.assertEqual(0, len(adjacency.predecessors(adjacency.index[2])))
+
+    def test_undirected_graph(self):
+        dec_graph = DecGraph()
+        for i in range(3):
+            dec_graph.add_node(self.test_supernodes_0[i])
+        dec_graph.add_edge(self.test_superedges_0[0])
+        dec_graph.add_edge(self.test_superedges_0[1])
+        dec_graph.add_edge(Superedge(self.test_supernodes_0[1], self.test_supernodes_0[0], 0))
+
+        # The cache is only created by the first request
+        self.assertIsNone(dec_graph._undirected_graphs)
+        undirected_graph = dec_graph.undirected_graph()
+        self.assertIs(undirected_graph, dec_graph.undirected_graph())
+        self.assertEqual({frozenset((0, 1)), frozenset((0, 2))}, {frozenset(e) for e in undirected_graph.edges()})
+        self.assertEqual([(0, 1)], list(dec_graph.undirected_graph(reciprocal=True).edges()))
+
+        dec_graph.remove_edge(self.test_superedges_0[1])
+        self.assertIsNone(dec_graph._undirected_graphs)
+        self.assertEqual([(0, 1)], list(dec_graph.undirected_graph().edges()))
+
+    def test_cached_result(self):
+        dec_graph = DecGraph()
+        for i in range(3):
+            dec_graph.add_node(self.test_supernodes_0[i])
+        calls = []
+
+        def order(graph: DecGraph) -> int:
+            calls.append(graph)
+            return len(graph.V)
+
+        # The cache is only created by the first request
+        self.assertIsNone(dec_graph._results)
+        self.assertEqual(3, dec_graph.cached_result('order', order))
+        self.assertEqual(3, dec_graph.cached_result('order', order))
+        self.assertEqual(1, len(calls))
+
+        dec_graph.add_edge(self.test_superedges_0[0])
+        self.assertIsNone(dec_graph._results)
+        self.assertEqual(3, dec_graph.cached_result('order', order))
+        self.assertEqual(2, len(calls))
+
+    def test_maximal_cliques_are_cached(self):
+        dec_graph = DecGraph()
+        for i in range(3):
+            dec_graph.add_node(self.test_supernodes_0[i])
+        dec_graph.add_edge(self.test_superedges_0[0])
+
+        cliques = list(maximal_cliques(dec_graph))
+        for clique in cliques:
+            clique.clear()
+        self.assertEqual({frozenset(self.test_supernodes_0[:2]), frozenset(self.test_supernodes_0[2:3])},
+                         {frozenset(clique) for clique in maximal_cliques(dec_graph)})
+
+        dec_graph.add_edge(self.test_superedges_0[1])
+        self.assertEqual(2, len(list(maximal_cliques(dec_graph))))
+
+    def test_strongly_connected_components_are_cached(self):
+        dec_graph = DecGraph()
+        for i in range(2):
+            dec_graph.add_node(self.test_supernodes_0[i])
+        dec_graph.add_edge(self.test_superedges_0[0])
+        calls = []
+
+        def recompute(graph: DecGraph):
+            calls.append(graph)
+            return []
+
+        # The second enumeration yields the same component objects, and the cached result is found under its key
+        sccs = list(strongly_connected_components(dec_graph))
+        self.assertEqual(2, len(sccs))
+        self.assertTrue(all(a is b for a, b in zip(sccs, strongly_connected_components(dec_graph))))
+        self.assertEqual(sccs, dec_graph.cached_result(('strongly_connected_components', False), recompute))
+        self.assertEqual(0, len(calls))
+
+        dec_graph.add_edge(Superedge(self.test_supernodes_0[1], self.test_supernodes_0[0], 0))
+        self.assertEqual([frozenset(self.test_supernodes_0[:2])], list(strongly_connected_components(dec_graph)))
+
     def _build_test_graph_1(self) -> DecGraph:
         for i in range(3):
             self.test_supernodes_1[i].add_node(self.test_supernodes_0[2 * i])
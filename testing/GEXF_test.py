@@ -0,0 +1,172 @@
+import multiprocessing
+import os
+import tempfile
+import unittest
+import xml.etree.ElementTree as ET
+import networkx as nx
+
+from multilevelgraphs import MultilevelGraph, SCCsContractionScheme, CliquesContractionScheme, write_gexf, \
+    write_gexf_for_viz
+from multilevelgraphs.io.GEXF import GEXFWriter
+
+NS = {'gexf': 'http://gexf.net/1.3', 'viz': 'http://www.gexf.net/1.3/viz'}
+
+
+class GEXFTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.directory.name, 'graph.gexf')
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_write_gexf(self):
+        ml_graph = self._sample_ml_graph()
+        write_gexf(ml_graph, self.file_path, description="sample")
+
+        root = ET.parse(self.file_path).getroot()
+        graph = root.find('gexf:graph', NS)
+        self.assertEqual('2', graph.get('height'))
+        self.assertEqual('sample', root.find('gexf:meta/gexf:description', NS).text)
+
+        # Nodes are nested in their supernodes
+        top_nodes = graph.findall('gexf:nodes/gexf:node', NS)
+        self.assertEqual(1, len(top_nodes))
+        self.assertEqual({'1_scc_1', '1_scc_2'},
+                         {n.get('id') for n in top_nodes[0].findall('gexf:nodes/gexf:node', NS)})
+        self.assertEqual({'1', '2', '3', '4'},
+                         {n.get('id') for n in top_nodes[0].findall('gexf:nodes/gexf:node/gexf:nodes/gexf:node', NS)})
+
+        edges = {(e.get('source'), e.get('target')): e for e in graph.findall('gexf:edges/gexf:edge', NS)}
+        self.assertEqual({('1', '2'), ('2', '1'), ('1', '3'), ('3', '4'), ('4', '3'), ('1_scc_2', '1_scc_1')},
+                         set(edges))
+        self.assertEqual('3', edges[('1', '2')].find("gexf:attvalues/gexf:attvalue[@for='weight']", NS).get('value'))
+
+        node_attributes = {a.get('id'): a.get('type')
+                           for a in graph.findall("gexf:attributes[@class='node']/gexf:attribute", NS)}
+        self.assertEqual('integer', node_attributes['level'])
+
+    def test_write_gexf_does_not_modify_attributes(self):
+        ml_graph = self._sample_ml_graph()
+        write_gexf(ml_graph, self.file_path)
+        write_gexf_for_viz(ml_graph, self.file_path)
+
+        for level in range(ml_graph.height() + 1):
+            dec_graph = ml_graph.get_graph(level, deepcopy=False)
+            self.assertTrue(all(not supernode.attr for supernode in dec_graph.nodes()))
+            self.assertTrue(all(set(edge.attr) <= {'weight'} for edge in dec_graph.edges()))
+
+    def test_write_gexf_escaped_edge_attributes(self):
+        graph = nx.DiGraph([('<a>', 'b & c', {'label': 'say "hi"\n\tthere'})])
+        write_gexf(MultilevelGraph(graph, [SCCsContractionScheme()]), self.file_path)
+
+        edge = ET.parse(self.file_path).getroot().find('gexf:graph/gexf:edges/gexf:edge', NS)
+        self.assertEqual(('<a>', 'b & c'), (edge.get('source'), edge.get('target')))
+        self.assertEqual('say "hi"\n\tthere',
+                         edge.find("gexf:attvalues/gexf:attvalue[@for='label']", NS).get('value'))
+
+    def test_write_gexf_multiple_top_level_nodes(self):
+        ml_graph = MultilevelGraph(nx.DiGraph([(1, 2), (2, 3), (4, 4)]), [SCCsContractionScheme()])
+        write_gexf(ml_graph, self.file_path)
+
+        graph = ET.parse(self.file_path).getroot().find('gexf:graph', NS)
+        top_nodes = graph.findall('gexf:nodes/gexf:node', NS)
+        self.assertEqual(4, len(top_nodes))
+        self.assertEqual({'1', '2', '3', '4'},
+                         {n.get('id') for top_node in top_nodes for n in top_node.findall('gexf:nodes/gexf:node', NS)})
+        self.assertEqual(3, len(graph.findall('gexf:edges/gexf:edge', NS)))
+
+    def test_write_gexf_for_viz(self):
+        graph = nx.DiGraph([('a', 'b'), ('b', 'a'), ('b', 'c')])
+        graph.nodes['c']['color'] = (10, 20, 30)
+        write_gexf_for_viz(MultilevelGraph(graph, [SCCsContractionScheme()]), self.file_path)
+
+        graph = ET.parse(self.file_path).getroot().find('gexf:graph', NS)
+        nodes = {n.get('id'): n for n in graph.iter('{%s}node' % NS['gexf'])}
+        self.assertEqual({'r': '10', 'g': '20', 'b': '30', 'a': '1.0'},
+                         nodes['c'].find('viz:color', NS).attrib)
+        self.assertEqual(nodes['a'].find('viz:color', NS).attrib, nodes['b'].find('viz:color', NS).attrib)
+
+        # Edges between children and supernodes are semi-transparent
+        edges = graph.findall('gexf:edges/gexf:edge', NS)
+        self.assertEqual(7, len(edges))
+        child_edges = [e for e in edges if e.find("gexf:attvalues/gexf:attvalue[@for='same_level']", NS).get('value') == '0']
+        self.assertEqual(3, len(child_edges))
+        self.assertTrue(all(e.find('viz:color', NS).get('a') == '0.3' for e in child_edges))
+
+    def test_write_gexf_for_viz_tuple_colors(self):
+        graph = nx.DiGraph([('a', 'b'), ('b', 'a'), ('b', 'c')])
+        write_gexf_for_viz(MultilevelGraph(graph, [SCCsContractionScheme()]), self.file_path,
+                           node_color_func=lambda supernode: ("10", "20", "30", "1.0"),
+                           edge_color_func=lambda edge: {'r': "40", 'g': "50", 'b': "60", 'a': "0.5"})
+
+        graph = ET.parse(self.file_path).getroot().find('gexf:graph', NS)
+        self.assertTrue(all(n.find('viz:color', NS).attrib == {'r': '10', 'g': '20', 'b': '30', 'a': '1.0'}
+                            for n in graph.iter('{%s}node' % NS['gexf'])))
+        same_level_edges = [e for e in graph.findall('gexf:edges/gexf:edge', NS)
+                            if e.find("gexf:attvalues/gexf:attvalue[@for='same_level']", NS).get('value') == '1']
+        self.assertEqual(4, len(same_level_edges))
+        self.assertTrue(all(e.find('viz:color', NS).attrib == {'r': '40', 'g': '50', 'b': '60', 'a': '0.5'}
+                            for e in same_level_edges))
+
+    def test_write_gexf_for_viz_integer_keys(self):
+        write_gexf_for_viz(self._sample_ml_graph(), self.file_path)
+
+        graph = ET.parse(self.file_path).getroot().find('gexf:graph', NS)
+        child_edges = {e.get('source'): e for e in graph.findall('gexf:edges/gexf:edge', NS)
+                       if e.find("gexf:attvalues/gexf:attvalue[@for='same_level']", NS).get('value') == '0'}
+        self.assertTrue({'1', '2', '3', '4'} <= set(child_edges))
+        self.assertEqual(f"(1, {child_edges['1'].get('target')})", child_edges['1'].get('id'))
+
+    def test_write_gexf_with_workers(self):
+        ml_graph = MultilevelGraph(nx.DiGraph([(1, 2), (2, 1), (2, 3), (4, 5), (5, 4), (6, 6)]),
+                                   [SCCsContractionScheme()])
+        parallel_file_path = os.path.join(self.directory.name, 'parallel_graph.gexf')
+        write_gexf_for_viz(ml_graph, self.file_path)
+        write_gexf_for_viz(ml_graph, parallel_file_path, workers=2)
+
+        with open(self.file_path) as file, open(parallel_file_path) as parallel_file:
+            self.assertEqual(file.read(), parallel_file.read())
+
+    def test_write_gexf_with_workers_releases_workers_on_error(self):
+        def edge_color_func(edge):
+            raise ValueError("no color")
+
+        ml_graph = MultilevelGraph(nx.DiGraph([(1, 2), (2, 1), (2, 3), (4, 5), (5, 4), (6, 6)]),
+                                   [SCCsContractionScheme()])
+        self.assertRaises(ValueError, write_gexf_for_viz, ml_graph, self.file_path, edge_color_func=edge_color_func,
+                          workers=2)
+        self.assertEqual([], multiprocessing.active_children())
+
+    def test_writer_writes_twice(self):
+        other_file_path = os.path.join(self.directory.name, 'other_graph.gexf')
+        writer = GEXFWriter(self._sample_ml_graph())
+        node = writer.add_node('1', attributes={'weight': 1})
+        writer.add_node('2', parent=node)
+        writer.add_edge('(1, 2)', '1', '2', attributes={'weight': 2})
+        writer.write(self.file_path)
+        writer.write(other_file_path)
+
+        with open(self.file_path) as file, open(other_file_path) as other_file:
+            self.assertEqual(file.read(), other_file.read())
+
+        # Nodes and edges added after a write are included in the next one, along with the previous ones
+        writer.add_node('3', attributes={'weight': 3})
+        writer.add_edge('(3, 1)', '3', '1')
+        writer.write(self.file_path)
+        writer.close()
+
+        graph = ET.parse(self.file_path).getroot().find('gexf:graph', NS)
+        self.assertEqual(['1', '3'], [n.get('id') for n in graph.findall('gexf:nodes/gexf:node', NS)])
+        self.assertEqual(['(1, 2)', '(3, 1)'], [e.get('id') for e in graph.findall('gexf:edges/gexf:edge', NS)])
+        self.assertEqual(1, len(graph.findall("gexf:attributes[@class='node']/gexf:attribute", NS)))
+
+    @staticmethod
+    def _sample_ml_graph() -> MultilevelGraph:
+        graph = nx.DiGraph([(1, 2, {'weight': 3}), (2, 1), (1, 3), (3, 4), (4, 3)])
+        return MultilevelGraph(graph, [SCCsContractionScheme(), CliquesContractionScheme()])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,22 @@
+import unittest
+
+from multilevelgraphs.utilities import ParUtils
+
+
+class ParUtilsTest(unittest.TestCase):
+
+    def test_par_map(self):
+        for size in (0, ParUtils.SEQUENTIAL_THRESHOLD - 1, 1000):
+            items = range(-size // 2, size // 2)
+            expected = [abs(i) for i in items]
+            self.assertEqual(expected, ParUtils.par_map(abs, items))
+            self.assertEqual(expected, ParUtils.par_map(lambda i: abs(i), iter(items)))
+            self.assertEqual(expected, ParUtils.par_map(abs, items, workers=2))
+
+    def test_par_reduce(self):
+        items = list(range(100))
+        self.assertEqual(sum(items), ParUtils.par_reduce(lambda a, b: a + b, items))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,6 +2,7 @@ import unittest
 
 from multilevelgraphs import DecGraph, Supernode, Superedge, SCCsContractionScheme
 from multilevelgraphs.contraction_schemes import UpdateQuadruple
+from multilevelgraphs.dec_graphs import strongly_connected_components
 
 
 class SccsContractionSchemeTest(unittest.TestCase):
@@ -168,6 +169,8 @@ class SccsContractionSchemeTest(unittest.TestCase):
         self.assertEqual(3, len(sample_graph.V[1].supernode.dec.edges()))
         self.assertEqual(2, len(sample_graph.V[4].supernode.dec.edges()))
         self.assertEqual(1, len(scheme.dec_graph.E[(sample_graph.V[1].supernode.key, sample_graph.V[4].supernode.key)].dec))
+        # The removed node is not referenced by the table after the update
+        self.assertEqual(set(), scheme.component_sets_table._emptied)
 
     def test_update_removed_edge_1(self):
         sample_graph = self._sample_dec_graph()
@@ -302,6 +305,14 @@ class SccsContractionSchemeTest(unittest.TestCase):
         self.assertEqual({30}, {c_set['weight'] for c_set in scheme.component_sets_table[sample_graph.V[5]]})
         self.assertEqual({60}, {c_set['weight'] for c_set in sample_graph.V[1].supernode.component_sets})
 
+    def test_strongly_connected_components_backends(self):
+        sample_graph = self._sample_dec_graph()
+
+        # The NetworkX implementation is used when rustworkx is not installed
+        self.assertEqual(set(strongly_connected_components(sample_graph)),
+                         set(strongly_connected_components(sample_graph, backend='rustworkx')))
+        self.assertRaises(ValueError, list, strongly_connected_components(sample_graph, backend='igraph'))
+
     @staticmethod
     def _sample_dec_graph() -> DecGraph:
         graph = DecGraph()
@@ -1,7 +1,9 @@
 import unittest
+import networkx as nx
 
-from multilevelgraphs import DecGraph, Supernode, Superedge, StarsContractionScheme
+from multilevelgraphs import DecGraph, Supernode, Superedge, StarsContractionScheme, MultilevelGraph
 from multilevelgraphs.contraction_schemes import UpdateQuadruple
+from multilevelgraphs.contraction_schemes_impl.stars_kernels import only_adjacent_keys, adjacent_keys, star_indices
 
 
 class StarsContractionSchemeTest(unittest.TestCase):
@@ -203,6 +205,8 @@ class StarsContractionSchemeTest(unittest.TestCase):
         self.assertEqual(3, len(sample_graph.V[5].supernode.dec.edges()))
         self.assertEqual(1, len(
             scheme.dec_graph.E[(sample_graph.V[3].supernode.key, sample_graph.V[5].supernode.key)].dec))
+        # The removed node is not referenced by the table after the update
+        self.assertEqual(set(), scheme.component_sets_table._emptied)
 
     def test_update_remove_edge(self):
         sample_graph = self._sample_dec_graph()
@@ -332,6 +336,22 @@ class StarsContractionSchemeTest(unittest.TestCase):
         for i in range(1, 10):
             self.assertEqual(1, len(sample_graph.V[i].supernode.component_sets))
         self.assertEqual(sample_graph, scheme.dec_graph.complete_decontraction())
+        # Stars are grown and shrunk in place without indexing the supernodes of the whole star
+        self.assertIsNone(scheme.component_sets_table._fingerprints)
+
+    def test_update_star_grown_twice(self):
+        ml_graph = MultilevelGraph(nx.DiGraph([(0, 1)]), [StarsContractionScheme()])
+        ml_graph.get_graph(1)
+        ml_graph.add_edge(2, 4)
+        ml_graph.get_graph(1)
+        ml_graph.add_edge(2, 5)
+        dec_graph = ml_graph.get_graph(1, deepcopy=False)
+        star = ml_graph.get_graph(0, deepcopy=False).V[2].supernode
+
+        self.assertEqual(2, len(dec_graph.V))
+        self.assertEqual(0, len(dec_graph.E))
+        self.assertEqual({2, 4, 5}, {node.key for node in star.dec.nodes()})
+        self.assertIs(star, ml_graph._contraction_schemes[0].supernode_table[star.component_sets])
 
     def test_update_attr_after_changes(self):
         def supernode_attr_function(supernode: Supernode):
@@ -367,6 +387,18 @@ class StarsContractionSchemeTest(unittest.TestCase):
         self.assertEqual({40}, {c_set['weight'] for c_set in scheme.component_sets_table[sample_graph.V[9]]})
         self.assertEqual({30}, {c_set['weight'] for c_set in sample_graph.V[1].supernode.component_sets})
 
+    def test_kernels(self):
+        edges = {(1, 2): None, (3, 2): None, (2, 4): None, (4, 2): None, (5, 6): None, (6, 5): None, (7, 7): None}
+        self.assertEqual({1: 2, 3: 2, 4: 2, 5: 6, 6: 5, 7: 7}, only_adjacent_keys(edges, reciprocal=False))
+        self.assertEqual({2: 4, 4: 2, 5: 6, 6: 5, 7: 7}, only_adjacent_keys(edges, reciprocal=True))
+
+        self.assertEqual((1, 2), adjacent_keys({2: None}, {2: None, 3: None}, reciprocal=True))
+        self.assertEqual((2, None), adjacent_keys({2: None}, {2: None, 3: None}, reciprocal=False))
+        self.assertEqual((0, None), adjacent_keys({}, {3: None}, reciprocal=True))
+
+        keys = [1, 2, 3, 4, 5, 6, 7]
+        self.assertEqual([[0, 2, 3, 1], [4, 5]], star_indices(keys, only_adjacent_keys(edges, reciprocal=False)))
+
     @staticmethod
     def _sample_dec_graph() -> DecGraph:
         graph = DecGraph()
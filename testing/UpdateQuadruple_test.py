@@ -0,0 +1,39 @@
+import unittest
+
+from multilevelgraphs import Supernode, Superedge
+from multilevelgraphs.contraction_schemes import UpdateQuadruple
+
+
+class UpdateQuadrupleTest(unittest.TestCase):
+
+    def setUp(self):
+        self.nodes = [Supernode(i, 0) for i in range(4)]
+        self.edges = [Superedge(self.nodes[i], self.nodes[i + 1], 0) for i in range(3)]
+
+    def test_add_from(self):
+        quadruple = UpdateQuadruple()
+        quadruple.add_v_plus_from(self.nodes[:2])
+        quadruple.add_v_minus_from(node for node in self.nodes[1:3])
+        quadruple.add_e_minus_from({self.edges[0]})
+        quadruple.add_e_plus_from(self.edges)
+
+        self.assertEqual(UpdateQuadruple(v_plus={self.nodes[0]}, v_minus={self.nodes[2]},
+                                         e_plus=set(self.edges[1:])), quadruple)
+
+    def test_add_from_matches_single_additions(self):
+        quadruple = UpdateQuadruple(v_plus=self.nodes[:2], e_minus=self.edges[:1])
+        batch_quadruple = UpdateQuadruple(v_plus=self.nodes[:2], e_minus=self.edges[:1])
+
+        for node in self.nodes[1:]:
+            quadruple.add_v_minus(node)
+        for edge in self.edges:
+            quadruple.add_e_plus(edge)
+        batch_quadruple.add_v_minus_from(self.nodes[1:])
+        batch_quadruple.add_e_plus_from(self.edges)
+
+        self.assertEqual(quadruple, batch_quadruple)
+        self.assertEqual({self.nodes[0]}, set(batch_quadruple.v_plus))
+
+
+if __name__ == '__main__':
+    unittest.main()